@@ -0,0 +1,71 @@
+"""Benchmark the batch loading of an OpenAPI catalog with worker processes.
+
+Writes a catalog of scaled-up copies of the example OpenAPI document, then loads it
+with threads (the default) and with pools of 1, 2, 4 and 8 worker processes, start-up
+of the workers included. Caches are disabled so every run parses every document.
+Speed-ups are bounded by the number of cores.
+
+Usage: python scripts/bench_batch_load.py [--documents 16] [--scale 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+from bench_parse_cache import scaled_document
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# disabled before the workers are started so that they inherit it
+os.environ["PYARAZZO_NO_CACHE"] = "1"
+
+from pyarazzo.model.openapi import OpenApiLoader, OperationRegistry
+
+
+def threads_time_ms(paths: list[str]) -> tuple[float, int]:
+    """Return the time (ms) taken to load the catalog with threads and the number of operationIds."""
+    registry = OperationRegistry(operations={})
+    start = time.perf_counter()
+    registry.extend(paths)
+    return (time.perf_counter() - start) * 1000, len(registry.operations)
+
+
+def processes_time_ms(paths: list[str], workers: int) -> float:
+    """Return the time (ms) taken to load the catalog with `workers` processes."""
+    start = time.perf_counter()
+    OpenApiLoader.load_batch(paths, workers)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=16, help="number of OpenAPI documents in the catalog")
+    parser.add_argument("--scale", type=int, default=50, help="number of copies of the example paths per document")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = []
+        for index in range(args.documents):
+            document = scaled_document(args.scale)
+            document["info"]["title"] = f"service-{index}"
+            path = os.path.join(tmpdir, f"service-{index}.openapi.yaml")
+            with open(path, "w") as file:
+                yaml.safe_dump(document, file)
+            paths.append(path)
+
+        print(f"catalog: {args.documents} documents, {os.cpu_count()} cores")
+        baseline, operations = threads_time_ms(paths)
+        print(f"threads:     {baseline:8.1f} ms, {operations} operationIds")
+        for workers in (1, 2, 4, 8):
+            elapsed = processes_time_ms(paths, workers)
+            print(f"{workers} processes: {elapsed:8.1f} ms, speed-up {baseline / elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
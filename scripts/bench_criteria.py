@@ -0,0 +1,84 @@
+"""Benchmark the evaluation of criteria against many responses.
+
+Evaluates simple, regular expression and JSONPath criteria against a batch of synthetic
+responses, as during a load test: each criterion is compiled once then evaluated with
+`CompiledCriteria.evaluate_many`. For reference, the same criteria are also compiled again
+for every response (caches cleared).
+
+Usage: python scripts/bench_criteria.py [--responses 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pyarazzo.runtime import criteria, expression, jsonpath, paths
+from pyarazzo.runtime.criteria import CompiledCriteria, compile_criterion_source
+from pyarazzo.runtime.expression import ExpressionContext
+
+CRITERIA = {
+    "simple": (None, "$statusCode == 200 && $response.body#/status == 'available'", "simple"),
+    "regex": ("$response.header.Content-Type", "^application/(.+\\+)?json", "regex"),
+    "jsonpath": ("$response.body", "$.pets[?(@.price < 20 && @.tags)]", "jsonpath"),
+}
+
+
+def responses(count: int) -> list[ExpressionContext]:
+    """Build `count` response contexts."""
+    return [
+        ExpressionContext(
+            status_code=200 if index % 10 else 500,
+            response_headers={"Content-Type": "application/json"},
+            response_body={
+                "status": "available",
+                "pets": [{"id": index, "price": index % 40, "tags": ["dog"] if index % 3 else []} for _ in range(5)],
+            },
+        )
+        for index in range(count)
+    ]
+
+
+def compiled_criteria(name: str) -> CompiledCriteria:
+    """Compile one of the criteria, or all of them."""
+    sources = [CRITERIA[name]] if name in CRITERIA else list(CRITERIA.values())
+    return CompiledCriteria([compile_criterion_source(*source) for source in sources])
+
+
+def clear_caches() -> None:
+    """Forget every compiled expression."""
+    for cached in (expression.compile_expression, jsonpath.compile_jsonpath, paths._compile, criteria._compile):
+        cached.cache_clear()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--responses", type=int, default=100_000, help="number of responses")
+    args = parser.parse_args()
+
+    contexts = responses(args.responses)
+    sample = contexts[: max(1, args.responses // 100)]
+    for name in [*CRITERIA, "all"]:
+        compiled = compiled_criteria(name)
+        start = time.perf_counter()
+        passed = sum(compiled.evaluate_many(contexts))
+        compiled_rate = len(contexts) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for context in sample:
+            clear_caches()
+            compiled_criteria(name)(context)
+        uncompiled_rate = len(sample) / (time.perf_counter() - start)
+        print(
+            f"{name:9} compiled: {compiled_rate:10,.0f} evaluations/s, "
+            f"compiled per response: {uncompiled_rate:8,.0f} evaluations/s, {passed} passed",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark running the independent steps of a workflow concurrently.
+
+Runs a workflow of `--steps` steps that do not reference each other, followed by a step reading
+all their outputs, against a local server answering after `--latency` milliseconds; first one
+step after the other, then with `parallel_steps`, along the data flow of the steps.
+
+Usage: python scripts/bench_dataflow.py [--steps 8] [--latency 20] [--runs 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bench_scheduler import serve
+
+from pyarazzo.model.arazzo import ArazzoSpecificationLoader
+from pyarazzo.runtime.runner import WorkflowRunner
+
+
+def write_specification(directory: Path, url: str, steps: int) -> Path:
+    """Write the OpenAPI description and the Arazzo specification of the benchmark."""
+    openapi = {
+        "openapi": "3.0.3",
+        "info": {"title": "items", "version": "1.0.0"},
+        "servers": [{"url": url}],
+        "paths": {"/items": {"get": {"operationId": "getItem", "responses": {"200": {"description": "ok"}}}}},
+    }
+    (directory / "openapi.json").write_text(json.dumps(openapi))
+    independent = [
+        {"stepId": f"get{step}", "operationId": "getItem", "outputs": {"id": "$response.body#/id"}}
+        for step in range(steps)
+    ]
+    summary = {
+        "stepId": "summary",
+        "operationId": "getItem",
+        "parameters": [
+            {"name": f"id{step}", "in": "query", "value": f"$steps.get{step}.outputs.id"} for step in range(steps)
+        ],
+    }
+    arazzo = {
+        "arazzo": "1.0.0",
+        "info": {"title": "bench", "version": "1.0.0"},
+        "sourceDescriptions": [{"name": "items", "url": str(directory / "openapi.json"), "type": "openapi"}],
+        "workflows": [{"workflowId": "fan-out", "steps": [*independent, summary]}],
+    }
+    path = directory / "arazzo.json"
+    path.write_text(json.dumps(arazzo))
+    return path
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=8, help="number of independent steps")
+    parser.add_argument("--latency", type=float, default=20, help="latency of the server, in milliseconds")
+    parser.add_argument("--runs", type=int, default=5, help="number of runs of the workflow")
+    args = parser.parse_args()
+
+    server = serve(args.latency / 1000)
+    host, port = server.server_address[:2]
+    timings = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_specification(Path(directory), f"http://{host!s}:{port}", args.steps)
+        specification = ArazzoSpecificationLoader.load(str(path))
+        for parallel_steps in (False, True):
+            runner = WorkflowRunner(specification, parallel_steps=parallel_steps)
+            # the first run compiles the steps
+            runner.run("fan-out")
+            start = time.perf_counter()
+            results = [runner.run("fan-out") for _ in range(args.runs)]
+            timings[parallel_steps] = (time.perf_counter() - start) / args.runs
+            if not all(result.success for result in results):
+                raise RuntimeError("a run of the workflow failed")
+    server.shutdown()
+
+    print(f"{args.steps} independent steps and a summary step, {args.latency:.0f} ms latency")
+    print(f"sequential steps: {timings[False] * 1e3:8.1f} ms/run")
+    print(f"parallel steps:   {timings[True] * 1e3:8.1f} ms/run ({timings[False] / timings[True]:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
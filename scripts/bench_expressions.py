@@ -0,0 +1,85 @@
+"""Benchmark the compilation and evaluation of runtime expressions.
+
+Collects the runtime expressions of the example Arazzo document (parameter values, outputs,
+criteria contexts, ...) and evaluates each of them against a context, compiling on every
+evaluation (no cache) and with the compiled expressions cache.
+
+Usage: python scripts/bench_expressions.py [--rounds 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pyarazzo.runtime.expression import ExpressionContext, compile_expression, compile_template
+
+EXAMPLE = Path(__file__).parent.parent / "examples" / "pet-coupons-example.yaml"
+
+
+def expressions(node: Any) -> list[str]:
+    """Collect the strings of a document that are runtime expressions or embed some."""
+    if isinstance(node, dict):
+        return [expression for value in node.values() for expression in expressions(value)]
+    if isinstance(node, list):
+        return [expression for value in node for expression in expressions(value)]
+    if isinstance(node, str) and (node.startswith("$") or "{$" in node):
+        # criteria conditions such as `$statusCode == 200` hold an expression and an operator
+        source = node.split(" ")[0]
+        return [source] if not source.startswith("$components.") else []
+    return []
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=10_000, help="number of evaluations of every expression")
+    args = parser.parse_args()
+
+    with EXAMPLE.open() as file:
+        sources = expressions(yaml.safe_load(file))
+    context = ExpressionContext(
+        status_code=200,
+        response_body=[{"id": 1, "couponCode": "c"}],
+        inputs={"pet_id": 1, "coupon_code": "c", "my_pet_tags": ["dog"], "quantity": 1},
+        steps={"find-pet": {"outputs": {"my_pet_id": 1}}, "place-order": {"outputs": {"my_order_id": 2}}},
+        outputs={"workflow_order_id": 2},
+    )
+    evaluations = args.rounds * len(sources)
+    print(f"expressions: {len(sources)} ({len(set(sources))} distinct)")
+
+    start = time.perf_counter()
+    for _ in range(args.rounds // 10):
+        for source in sources:
+            compile_expression.cache_clear()
+            compile_template.cache_clear()
+            compile_template(source).evaluate(context)
+    uncached_us = (time.perf_counter() - start) * 1_000_000 / (evaluations // 10)
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for source in sources:
+            compile_template(source).evaluate(context)
+    cached_us = (time.perf_counter() - start) * 1_000_000 / evaluations
+
+    compiled = [compile_expression(source) for source in sources]
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for expression in compiled:
+            expression.evaluate(context)
+    evaluate_us = (time.perf_counter() - start) * 1_000_000 / evaluations
+
+    print(f"compile + evaluate:      {uncached_us:6.2f} us/expression")
+    print(f"cache lookup + evaluate: {cached_us:6.2f} us/expression")
+    print(f"evaluate precompiled:    {evaluate_us:6.2f} us/expression")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Benchmark the extraction of the operations of an OpenAPI document.
+
+Compares the strict mode, which validates the whole document into the `openapi_pydantic`
+model before reading its operations, with the default mode, which only scans the `paths`
+subtree and the references it uses, on the example OpenAPI document scaled up.
+
+Usage: python scripts/bench_openapi_extract.py [--scale 200] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from bench_parse_cache import scaled_document
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pyarazzo.model.openapi import OpenApiLoader
+
+
+def extraction_time_ms(document: dict, *, strict: bool) -> tuple[float, int]:
+    """Return the time (ms) taken to extract the operations and their count."""
+    start = time.perf_counter()
+    operations = OpenApiLoader.extract(document, strict=strict)
+    return (time.perf_counter() - start) * 1000, len(operations)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=200, help="number of copies of the example paths")
+    parser.add_argument("--repeat", type=int, default=5, help="number of measured runs")
+    args = parser.parse_args()
+
+    document = scaled_document(args.scale)
+    print(f"document: {len(document['paths'])} paths")
+    results = {}
+    for label, strict in (("strict (full model)", True), ("fast (paths only)", False)):
+        runs = [extraction_time_ms(document, strict=strict) for _ in range(args.repeat)]
+        results[strict] = statistics.median(elapsed for elapsed, _ in runs)
+        print(f"{label:20} {results[strict]:8.1f} ms, {runs[0][1]} operations")
+    print(f"speed-up: {results[True] / results[False]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark the memory used to load an OpenAPI document.
+
+Compares the former approach (JSON round trip through `jsonref`, then the full model
+built from the resolved document) with the in-place lazy resolution used by `OpenApiLoader`,
+on the example OpenAPI document scaled up. Peak memory is measured with tracemalloc.
+
+Usage: python scripts/bench_openapi_memory.py [--scale 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from bench_parse_cache import scaled_document
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from openapi_pydantic.v3.v3_0 import OpenAPI
+
+from pyarazzo.model.refs import RefResolver
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def jsonref_round_trip(document: dict) -> Any:
+    """Former approach: serialize, re-parse with jsonref, build the model."""
+    import jsonref  # noqa: PLC0415
+
+    return OpenAPI(**jsonref.loads(json.dumps(document)))
+
+
+def lazy_resolution(document: dict) -> Any:
+    """Current approach: build the model on the loaded document, resolve references on demand."""
+    resolver = RefResolver(document)
+    model = OpenAPI.model_validate(document)
+    for path_item in document["paths"].values():
+        for operation in path_item.values():
+            for parameter in operation.get("parameters", []):
+                resolver.resolve(parameter)
+    return model
+
+
+def measure(function: Callable[[dict], Any], document: dict) -> tuple[float, float]:
+    """Return the peak memory (MiB) and the time (ms) taken by `function`."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(document)
+    elapsed = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak / 1024 / 1024, elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=200, help="number of copies of the example paths")
+    args = parser.parse_args()
+
+    document = scaled_document(args.scale)
+    print(f"document: {len(document['paths'])} paths")
+    try:
+        peak, elapsed = measure(jsonref_round_trip, document)
+        print(f"jsonref round trip: peak {peak:8.1f} MiB, {elapsed:8.1f} ms")
+    except ImportError:
+        print("jsonref round trip: skipped, jsonref is not installed")
+    peak, elapsed = measure(lazy_resolution, document)
+    print(f"lazy resolution:    peak {peak:8.1f} MiB, {elapsed:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
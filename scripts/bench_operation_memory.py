@@ -0,0 +1,66 @@
+"""Benchmark the memory held by the operations of a large OpenAPI catalog.
+
+Compares the operations kept as `ApiOperation` pydantic models (three dictionaries per
+operation) with the compact `OperationRecord`s used by the registry, on the example OpenAPI
+document scaled up. Memory still allocated once the operations are built is measured with
+tracemalloc, the loaded document itself is excluded.
+
+Usage: python scripts/bench_operation_memory.py [--scale 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from bench_parse_cache import scaled_document
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pyarazzo.model.openapi import OpenApiLoader, OperationRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def retained_mib(build: Callable[[], Any]) -> tuple[float, Any]:
+    """Return the memory (MiB) still allocated by `build` once it returned, and its result."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / 1024 / 1024, result
+
+
+def registry_of(operations: list[Any]) -> OperationRegistry:
+    """Register operations the way source descriptions are registered."""
+    registry = OperationRegistry(operations={})
+    for operation in operations:
+        registry.add(operation, source="petstore", url="petstore.yaml")
+    return registry
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=2000, help="number of copies of the example paths")
+    args = parser.parse_args()
+
+    document = scaled_document(args.scale)
+    records_mib, records = retained_mib(lambda: OpenApiLoader.extract(document))
+    models_mib, models = retained_mib(lambda: [record.to_model() for record in records])
+    print(f"operations: {len(records)}")
+    print(f"ApiOperation models: {models_mib:8.1f} MiB ({models_mib * 1024 * 1024 / len(models):6.0f} B/operation)")
+    print(f"OperationRecords:    {records_mib:8.1f} MiB ({records_mib * 1024 * 1024 / len(records):6.0f} B/operation)")
+    registry_mib, _ = retained_mib(lambda: registry_of(records))
+    print(f"registry indexes:    {registry_mib:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
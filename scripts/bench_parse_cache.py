@@ -0,0 +1,86 @@
+"""Benchmark cold vs warm loads through the parse cache.
+
+The example OpenAPI document is scaled up by duplicating its paths, then loaded
+once with an empty cache (cold) and several times with a populated cache (warm).
+
+Usage: python scripts/bench_parse_cache.py [--scale 200] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pyarazzo import cache, utils
+
+EXAMPLE = Path(__file__).parent.parent / "examples" / "pet-coupons.openapi.yaml"
+
+
+def scaled_document(scale: int) -> dict:
+    """Duplicate the example paths `scale` times."""
+    with EXAMPLE.open() as file:
+        document = yaml.safe_load(file)
+    paths = {}
+    for index in range(scale):
+        for path, item in document["paths"].items():
+            item_copy = copy.deepcopy(item)
+            for operation in item_copy.values():
+                if isinstance(operation, dict) and "operationId" in operation:
+                    operation["operationId"] = f"{operation['operationId']}{index}"
+            paths[f"/v{index}{path}"] = item_copy
+    document["paths"] = paths
+    return document
+
+
+def timed(path: str) -> float:
+    """Return the time taken to load `path`, in milliseconds."""
+    start = time.perf_counter()
+    utils.load_from_file(path)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=200, help="number of copies of the example paths")
+    parser.add_argument("--repeat", type=int, default=5, help="number of measured loads")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.environ["PYARAZZO_CACHE_DIR"] = os.path.join(tmpdir, "cache")
+        spec_path = os.path.join(tmpdir, "scaled.openapi.yaml")
+        with open(spec_path, "w") as file:
+            yaml.safe_dump(scaled_document(args.scale), file)
+
+        size_kb = os.path.getsize(spec_path) / 1024
+        lines = sum(1 for _ in open(spec_path))  # noqa: SIM115
+        print(f"document: {size_kb:.0f} KiB, {lines} lines")
+
+        cold = []
+        for _ in range(args.repeat):
+            cache.reset_caches()
+            cache.get_parse_cache().clear()
+            cold.append(timed(spec_path))
+
+        cache.reset_caches()
+        timed(spec_path)
+        warm = [timed(spec_path) for _ in range(args.repeat)]
+
+    cold_ms, warm_ms = statistics.median(cold), statistics.median(warm)
+    print(f"cold (parse + store): {cold_ms:8.1f} ms")
+    print(f"warm (cache hit):     {warm_ms:8.1f} ms")
+    print(f"speedup:              {cold_ms / warm_ms:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark the mapping of concrete request paths to operations.
+
+Compares the compiled `PathMatcher` (radix tree over path segments) with a naive scan
+of one regular expression per path template, on a synthetic catalog of templates.
+
+Usage: python scripts/bench_path_matcher.py [--templates 20000] [--lookups 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pyarazzo.model.matcher import PathMatcher
+from pyarazzo.model.openapi import HttpMethod, OperationRecord
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+SHAPES = [
+    "/{service}/{resource}",
+    "/{service}/{resource}/{{id}}",
+    "/{service}/{resource}/{{id}}/items",
+    "/{service}/{resource}/{{id}}/items/{{itemId}}",
+    "/{service}/{resource}/search",
+]
+
+
+def catalog(size: int) -> list[OperationRecord]:
+    """Build `size` operations spread over services and resources."""
+    operations = []
+    index = 0
+    while len(operations) < size:
+        for shape in SHAPES:
+            path = shape.format(service=f"svc{index // 50}", resource=f"res{index % 50}")
+            operations.append(OperationRecord.create("service", None, HttpMethod.get, path))
+        index += 1
+    return operations[:size]
+
+
+def concrete(path: str) -> str:
+    """Replace the parameters of a template with values."""
+    return re.sub(r"\{[^}]+\}", lambda _: str(random.randint(1, 10_000)), path)  # noqa: S311
+
+
+class RegexScan:
+    """Naive matcher, tries one regular expression per template in turn."""
+
+    def __init__(self, operations: list[OperationRecord]) -> None:
+        """Compile one regular expression per template."""
+        self.patterns = [
+            (re.compile("^" + re.sub(r"\\\{[^}]+\\\}", "([^/]+)", re.escape(operation.path)) + "$"), operation)
+            for operation in operations
+        ]
+
+    def match(self, path: str) -> OperationRecord | None:
+        """Return the first operation whose template matches."""
+        for pattern, operation in self.patterns:
+            if pattern.match(path):
+                return operation
+        return None
+
+
+def timed(function: Callable[[str], object], paths: list[str]) -> float:
+    """Return the mean lookup time in microseconds."""
+    start = time.perf_counter()
+    for path in paths:
+        function(path)
+    return (time.perf_counter() - start) * 1_000_000 / len(paths)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--templates", type=int, default=20_000, help="number of path templates")
+    parser.add_argument("--lookups", type=int, default=2_000, help="number of lookups")
+    args = parser.parse_args()
+
+    random.seed(0)
+    operations = catalog(args.templates)
+    paths = [concrete(random.choice(operations).path) for _ in range(args.lookups)]  # noqa: S311
+
+    start = time.perf_counter()
+    matcher = PathMatcher()
+    for operation in operations:
+        matcher.add(operation)
+    build_ms = (time.perf_counter() - start) * 1000
+    scan = RegexScan(operations)
+
+    trie_us = timed(lambda path: matcher.match("get", path), paths)
+    scan_us = timed(scan.match, paths[: max(1, args.lookups // 10)])
+    print(f"templates: {len(matcher)}, matcher built in {build_ms:.1f} ms")
+    print(f"radix tree: {trie_us:10.2f} us/lookup")
+    print(f"regex scan: {scan_us:10.2f} us/lookup")
+    print(f"speed-up: {scan_us / trie_us:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
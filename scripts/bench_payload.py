@@ -0,0 +1,101 @@
+"""Benchmark building request bodies from a large nested payload.
+
+Builds the body of a step for many executions: a payload of `--items` nested objects, with
+runtime expressions and replacements scattered across it, is compiled once and each body is
+built by copy-on-write with `CompiledPayload.build_many`. For reference, the same bodies are
+also built by deep-copying the payload and setting each target in the copy.
+
+Usage: python scripts/bench_payload.py [--items 2000] [--requests 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pyarazzo.model.arazzo import PayloadReplacementObject
+from pyarazzo.runtime.expression import ExpressionContext, evaluate, parse_json_pointer
+from pyarazzo.runtime.payload import compile_payload
+
+
+def payload(items: int) -> dict[str, Any]:
+    """Build a payload of `items` nested objects, and an expression."""
+    return {
+        "order": {"id": "$inputs.order_id", "customer": {"name": "{$inputs.first} {$inputs.last}"}},
+        "lines": [
+            {"sku": f"SKU-{index}", "quantity": 1, "options": {"color": "red", "sizes": ["S", "M", "L"]}}
+            for index in range(items)
+        ],
+    }
+
+
+def replacements(items: int) -> list[PayloadReplacementObject]:
+    """Replace the quantity of ten lines spread over the payload."""
+    return [
+        PayloadReplacementObject(target=f"/lines/{index}/quantity", value="$inputs.quantity")
+        for index in range(0, items, max(1, items // 10))
+    ]
+
+
+def deep_copy_build(
+    template: dict[str, Any],
+    targets: list[PayloadReplacementObject],
+    context: ExpressionContext,
+) -> Any:
+    """Build a body by deep-copying the payload, the naive way."""
+    body = copy.deepcopy(template)
+    for tokens, value in (
+        (("order", "id"), "$inputs.order_id"),
+        (("order", "customer", "name"), "{$inputs.first} {$inputs.last}"),
+        *((parse_json_pointer(target.target), target.value) for target in targets),
+    ):
+        node = body
+        for token in tokens[:-1]:
+            node = node[int(token)] if isinstance(node, list) else node[token]
+        last = tokens[-1]
+        node[int(last) if isinstance(node, list) else last] = evaluate(value, context)
+    return body
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=2000, help="number of nested objects of the payload")
+    parser.add_argument("--requests", type=int, default=2000, help="number of bodies built")
+    args = parser.parse_args()
+
+    template = payload(args.items)
+    targets = replacements(args.items)
+    contexts = [
+        ExpressionContext(inputs={"order_id": index, "first": "Ann", "last": "Lee", "quantity": index % 5 + 1})
+        for index in range(args.requests)
+    ]
+
+    start = time.perf_counter()
+    compiled = compile_payload(template, targets)
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bodies = compiled.build_many(contexts)
+    copy_on_write = (time.perf_counter() - start) / len(contexts)
+
+    sample = contexts[: max(1, len(contexts) // 20)]
+    start = time.perf_counter()
+    expected = [deep_copy_build(template, targets, context) for context in sample]
+    deep_copy = (time.perf_counter() - start) / len(sample)
+
+    if bodies[: len(sample)] != expected:
+        raise RuntimeError("copy-on-write and deep-copied bodies differ")
+    print(f"payload of {args.items} objects, {len(targets) + 2} replacements, compiled in {compile_time * 1e3:.1f} ms")
+    print(f"copy-on-write: {copy_on_write * 1e6:10.1f} µs/body")
+    print(f"deep copy:     {deep_copy * 1e6:10.1f} µs/body ({deep_copy / copy_on_write:.0f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
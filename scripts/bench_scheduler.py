@@ -0,0 +1,126 @@
+"""Benchmark running the workflows of a specification concurrently.
+
+Runs `--chains` independent chains of `--depth` workflows (each depending on the previous one of
+its chain through `dependsOn`), each workflow sending `--steps` requests to a local server
+answering after `--latency` milliseconds. The workflows are run one after the other by a
+`WorkflowRunner`, then concurrently by a `WorkflowScheduler`.
+
+Usage: python scripts/bench_scheduler.py [--chains 8] [--depth 3] [--steps 2] [--latency 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pyarazzo.model.arazzo import ArazzoSpecificationLoader
+from pyarazzo.runtime.runner import WorkflowRunner
+from pyarazzo.runtime.scheduler import WorkflowScheduler
+
+
+def serve(latency: float) -> ThreadingHTTPServer:
+    """Start a local server answering every request after `latency` seconds."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            time.sleep(latency)
+            body = b'{"id": 1}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def write_specification(directory: Path, url: str, chains: int, depth: int, steps: int) -> Path:
+    """Write the OpenAPI description and the Arazzo specification of the benchmark."""
+    openapi = {
+        "openapi": "3.0.3",
+        "info": {"title": "items", "version": "1.0.0"},
+        "servers": [{"url": url}],
+        "paths": {"/items": {"get": {"operationId": "getItem", "responses": {"200": {"description": "ok"}}}}},
+    }
+    (directory / "openapi.json").write_text(json.dumps(openapi))
+    workflows = [
+        {
+            "workflowId": f"chain{chain}-{level}",
+            **({"dependsOn": [f"chain{chain}-{level - 1}"]} if level else {}),
+            "steps": [
+                {
+                    "stepId": f"get{step}",
+                    "operationId": "getItem",
+                    "successCriteria": [{"condition": "$statusCode == 200"}],
+                }
+                for step in range(steps)
+            ],
+        }
+        for chain in range(chains)
+        for level in range(depth)
+    ]
+    arazzo = {
+        "arazzo": "1.0.0",
+        "info": {"title": "bench", "version": "1.0.0"},
+        "sourceDescriptions": [{"name": "items", "url": str(directory / "openapi.json"), "type": "openapi"}],
+        "workflows": workflows,
+    }
+    path = directory / "arazzo.json"
+    path.write_text(json.dumps(arazzo))
+    return path
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chains", type=int, default=8, help="number of independent chains of workflows")
+    parser.add_argument("--depth", type=int, default=3, help="number of workflows of a chain")
+    parser.add_argument("--steps", type=int, default=2, help="number of requests of a workflow")
+    parser.add_argument("--latency", type=float, default=20, help="latency of the server, in milliseconds")
+    parser.add_argument("--max-workflows", type=int, default=8, help="maximum number of workflows in flight")
+    args = parser.parse_args()
+
+    server = serve(args.latency / 1000)
+    host, port = server.server_address[:2]
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_specification(Path(directory), f"http://{host!s}:{port}", args.chains, args.depth, args.steps)
+        specification = ArazzoSpecificationLoader.load(str(path))
+
+        runner = WorkflowRunner(specification)
+        start = time.perf_counter()
+        results = [runner.run(workflow_id) for workflow_id in specification.workflow_graph.order]
+        sequential = time.perf_counter() - start
+        if not all(result.success for result in results):
+            raise RuntimeError("a workflow failed in the sequential run")
+
+        schedule = WorkflowScheduler(runner, max_workflows=args.max_workflows).run()
+        if not schedule.success:
+            raise RuntimeError("a workflow failed in the concurrent run")
+    server.shutdown()
+
+    print(f"{args.chains * args.depth} workflows of {args.steps} requests, {args.latency:.0f} ms latency")
+    print(f"sequential run:  {sequential * 1e3:8.1f} ms")
+    print(f"concurrent run:  {schedule.elapsed * 1e3:8.1f} ms ({sequential / schedule.elapsed:.1f}x faster)")
+    print(f"workflows total: {schedule.total * 1e3:8.1f} ms")
+    print(f"critical path:   {schedule.critical_path_time * 1e3:8.1f} ms ({' -> '.join(schedule.critical_path)})")
+
+
+if __name__ == "__main__":
+    main()
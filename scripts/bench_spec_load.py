@@ -0,0 +1,84 @@
+"""Benchmark the load of a large Arazzo specification with and without schema validation.
+
+The example Arazzo document is scaled up by duplicating its workflows, then loaded into an
+`ArazzoSpecification` with full JSON Schema validation, with a validation ledger hit (the same
+content already passed validation) and in trusted mode. The parse cache is warm in every case,
+so the timings compare validation and model construction only.
+
+Usage: python scripts/bench_spec_load.py [--scale 100] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pyarazzo import cache
+from pyarazzo.model.arazzo import ArazzoSpecificationLoader
+
+EXAMPLE = Path(__file__).parent.parent / "examples" / "pet-coupons-example.yaml"
+
+
+def scaled_specification(scale: int) -> dict:
+    """Duplicate the example workflows `scale` times."""
+    with EXAMPLE.open() as file:
+        document = yaml.safe_load(file)
+    workflows = []
+    for index in range(scale):
+        for workflow in document["workflows"]:
+            workflow_copy = copy.deepcopy(workflow)
+            workflow_copy["workflowId"] = f"{workflow['workflowId']}{index}"
+            workflows.append(workflow_copy)
+    document["workflows"] = workflows
+    return document
+
+
+def timed(path: str, *, trusted: bool = False) -> float:
+    """Return the time taken to load `path`, in milliseconds."""
+    start = time.perf_counter()
+    ArazzoSpecificationLoader.load(path, trusted=trusted)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=100, help="number of copies of the example workflows")
+    parser.add_argument("--repeat", type=int, default=3, help="number of measured loads")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.environ["PYARAZZO_CACHE_DIR"] = os.path.join(tmpdir, "cache")
+        spec_path = os.path.join(tmpdir, "scaled.arazzo.yaml")
+        document = scaled_specification(args.scale)
+        with open(spec_path, "w") as file:
+            yaml.safe_dump(document, file)
+        print(f"specification: {len(document['workflows'])} workflows")
+
+        cache.reset_caches()
+        timed(spec_path, trusted=True)
+        validated = []
+        for _ in range(args.repeat):
+            cache.get_validation_ledger().clear()
+            validated.append(timed(spec_path))
+        ledger = [timed(spec_path) for _ in range(args.repeat)]
+        trusted = [timed(spec_path, trusted=True) for _ in range(args.repeat)]
+
+    validated_ms, ledger_ms, trusted_ms = map(statistics.median, (validated, ledger, trusted))
+    print(f"validated (schema + model): {validated_ms:8.1f} ms")
+    print(f"ledger hit (model only):    {ledger_ms:8.1f} ms, speed-up {validated_ms / ledger_ms:.0f}x")
+    print(f"trusted (model only):       {trusted_ms:8.1f} ms, speed-up {validated_ms / trusted_ms:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
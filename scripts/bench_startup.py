@@ -0,0 +1,71 @@
+"""Benchmark the start-up time of the pyarazzo CLI.
+
+Measures the cumulative import time of `pyarazzo.cli` reported by `python -X importtime`
+and the wall-clock time of `python -m pyarazzo --version`. The script exits with a non-zero
+status when the median import time exceeds the budget, so it can guard against regressions in CI.
+
+Usage: python scripts/bench_startup.py [--repeat 10] [--budget-ms 100]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = str(Path(__file__).parent.parent / "src")
+ENV = {**os.environ, "PYTHONPATH": SRC}
+
+
+def import_time_ms(module: str) -> float:
+    """Return the cumulative import time of `module` in milliseconds."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=ENV,
+        check=True,
+    )
+    for line in reversed(result.stderr.splitlines()):
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:  # noqa: PLR2004
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"no import time reported for {module}")
+
+
+def version_wall_time_ms() -> float:
+    """Return the wall-clock time of `python -m pyarazzo --version` in milliseconds."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "pyarazzo", "--version"],
+        capture_output=True,
+        env=ENV,
+        check=True,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="number of measured runs")
+    parser.add_argument("--budget-ms", type=float, default=100.0, help="maximum median import time of pyarazzo.cli")
+    args = parser.parse_args()
+
+    imports = [import_time_ms("pyarazzo.cli") for _ in range(args.repeat)]
+    walls = [version_wall_time_ms() for _ in range(args.repeat)]
+    import_ms = statistics.median(imports)
+
+    print(f"import pyarazzo.cli:          {import_ms:8.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"python -m pyarazzo --version: {statistics.median(walls):8.1f} ms")
+    if import_ms > args.budget_ms:
+        print("start-up budget exceeded")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
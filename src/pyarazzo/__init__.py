@@ -12,6 +12,8 @@ from __future__ import annotations
 
 from pyarazzo.exceptions import (
     ArazzoError,
+    ExecutionError,
+    ExpressionError,
     GenerationError,
     LoadError,
     SpecificationError,
@@ -20,6 +22,8 @@ from pyarazzo.exceptions import (
 
 __all__: list[str] = [
     "ArazzoError",
+    "ExecutionError",
+    "ExpressionError",
     "GenerationError",
     "LoadError",
     "SpecificationError",
@@ -0,0 +1,430 @@
+"""On-disk caches.
+
+Parsing large YAML documents dominates the load time of a specification. This module
+stores already-parsed documents in a binary form (pickle) keyed by the hash of the raw
+content, the document format and the parser version, so unchanged files are only parsed once.
+It also holds the HTTP cache of remote documents used by `pyarazzo.http_client`, and the
+cache of the tables derived from documents (the operations of OpenAPI descriptions), and
+the ledger of the specifications that already passed schema validation.
+Caches are size-bounded, least recently used entries are evicted first.
+"""
+
+import contextlib
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from pyarazzo.config import (
+    CACHE_DIR_DEFAULT,
+    CACHE_DIR_ENV,
+    CACHE_DISABLE_ENV,
+    HTTP_CACHE_MAX_BYTES,
+    PARSE_CACHE_MAX_BYTES,
+    PARSE_CACHE_VERSION,
+    TABLE_CACHE_MAX_BYTES,
+    TABLE_CACHE_VERSION,
+    VALIDATION_LEDGER_MAX_BYTES,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+ENTRY_SUFFIX = ".pickle"
+
+
+def cache_root() -> str:
+    """Return the root directory of the pyarazzo caches.
+
+    Returns:
+        str: cache directory, taken from the environment or the default location.
+    """
+    return os.path.expanduser(os.environ.get(CACHE_DIR_ENV) or CACHE_DIR_DEFAULT)
+
+
+class DiskCache:
+    """Size-bounded key/value store of pickled objects."""
+
+    def __init__(self, directory: str, max_bytes: int, *, enabled: bool = True) -> None:
+        """Constructor.
+
+        Args:
+            directory (str): directory holding the cache entries
+            max_bytes (int): maximum size of the cache on disk
+            enabled (bool): when False, lookups always miss and nothing is stored
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Look up a parsed document.
+
+        Args:
+            key (str): cache key
+
+        Returns:
+            tuple[bool, Any]: whether the entry was found, and the stored object
+        """
+        if not self.enabled:
+            return False, None
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as file:
+                document = pickle.load(file)  # noqa: S301 - entries are only written by this class
+        except FileNotFoundError:
+            return False, None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            LOGGER.debug(f"Discarding unreadable cache entry {path}")
+            self._remove(path)
+            return False, None
+
+        # refresh the modification time, it drives the LRU eviction
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return True, document
+
+    def put(self, key: str, document: Any) -> None:
+        """Store an object, then evict old entries if the cache is too large.
+
+        Args:
+            key (str): cache key
+            document (Any): object to store
+        """
+        if not self.enabled:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # write to a temporary file first so that concurrent readers never see partial entries
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(document, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._entry_path(key))
+        except (OSError, pickle.PicklingError):
+            LOGGER.debug(f"Unable to store cache entry {key}", exc_info=True)
+            return
+        self.evict()
+
+    def _entries(self) -> list[os.DirEntry]:
+        try:
+            with os.scandir(self.directory) as it:
+                return [entry for entry in it if entry.name.endswith(ENTRY_SUFFIX)]
+        except FileNotFoundError:
+            return []
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits in `max_bytes`."""
+        stats = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            stats.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in stats)
+        for _, size, path in sorted(stats):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for entry in self._entries():
+            self._remove(entry.path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        with contextlib.suppress(OSError):
+            os.remove(path)
+
+
+class ParseCache(DiskCache):
+    """Content-addressed cache of parsed documents."""
+
+    def __init__(self, directory: str, max_bytes: int = PARSE_CACHE_MAX_BYTES, *, enabled: bool = True) -> None:
+        """Constructor.
+
+        Args:
+            directory (str): directory holding the cache entries
+            max_bytes (int): maximum size of the cache on disk
+            enabled (bool): when False, documents are always parsed and nothing is stored
+        """
+        super().__init__(directory, max_bytes, enabled=enabled)
+
+    @staticmethod
+    def key(content: bytes, fmt: str) -> str:
+        """Compute the cache key of a raw document.
+
+        Args:
+            content (bytes): raw document content
+            fmt (str): document format (json or yaml)
+
+        Returns:
+            str: hex digest identifying the parsed document
+        """
+        digest = hashlib.sha256(f"{PARSE_CACHE_VERSION}:{fmt}:".encode())
+        digest.update(content)
+        return digest.hexdigest()
+
+    def parse(self, content: bytes, fmt: str, parser: Callable[[bytes], Any]) -> Any:
+        """Return the parsed document, using the cache when possible.
+
+        Args:
+            content (bytes): raw document content
+            fmt (str): document format (json or yaml)
+            parser (Callable[[bytes], Any]): function parsing the raw content on cache miss
+
+        Returns:
+            Any: parsed document
+        """
+        if not self.enabled:
+            return parser(content)
+
+        key = self.key(content, fmt)
+        found, document = self.get(key)
+        if found:
+            LOGGER.debug(f"Parse cache hit {key}")
+            return document
+
+        document = parser(content)
+        self.put(key, document)
+        return document
+
+
+class TableCache:
+    """Cache of the values derived from documents, such as the operation table of an OpenAPI description.
+
+    Values are kept in memory for the lifetime of the process, keyed by the resolved location of
+    the document and the hash of its content, so every specification referencing the same document
+    shares a single table. They are also persisted on disk, keyed by the content hash only.
+    """
+
+    def __init__(self, disk: DiskCache) -> None:
+        """Constructor.
+
+        Args:
+            disk (DiskCache): persistent store of the tables, may be disabled
+        """
+        self.disk = disk
+        self._tables: dict[tuple[str, str], Any] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(content: bytes, variant: str) -> str:
+        """Compute the content hash of a document.
+
+        Args:
+            content (bytes): raw document content
+            variant (str): name of the derivation, tables derived differently have different keys
+
+        Returns:
+            str: hex digest identifying the table
+        """
+        digest = hashlib.sha256(f"{TABLE_CACHE_VERSION}:{variant}:".encode())
+        digest.update(content)
+        return digest.hexdigest()
+
+    def get(self, location: str, key: str) -> tuple[bool, Any]:
+        """Look up a table, in memory first, then on disk.
+
+        Args:
+            location (str): resolved url or absolute path of the document
+            key (str): content hash returned by `TableCache.key`
+
+        Returns:
+            tuple[bool, Any]: whether the table was found, and the table
+        """
+        with self._lock:
+            if (location, key) in self._tables:
+                return True, self._tables[(location, key)]
+        found, table = self.disk.get(key)
+        if found:
+            with self._lock:
+                self._tables[(location, key)] = table
+        return found, table
+
+    def put(self, location: str, key: str, table: Any, *, persist: bool = True) -> None:
+        """Store a table in memory and on disk.
+
+        Args:
+            location (str): resolved url or absolute path of the document
+            key (str): content hash returned by `TableCache.key`
+            table (Any): table derived from the document
+            persist (bool): also store the table on disk, False when another process already did
+        """
+        with self._lock:
+            self._tables[(location, key)] = table
+        if persist:
+            self.disk.put(key, table)
+
+    def clear(self) -> None:
+        """Forget the tables held in memory, persisted tables are kept."""
+        with self._lock:
+            self._tables.clear()
+
+
+class ValidationLedger(DiskCache):
+    """Record of the specifications that passed schema validation, keyed by the hash of their content.
+
+    Entries are bound to the schema they were validated against, a new schema invalidates them.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = VALIDATION_LEDGER_MAX_BYTES, *, enabled: bool = True) -> None:
+        """Constructor.
+
+        Args:
+            directory (str): directory holding the ledger entries
+            max_bytes (int): maximum size of the ledger on disk
+            enabled (bool): when False, no document is known as valid and nothing is recorded
+        """
+        super().__init__(directory, max_bytes, enabled=enabled)
+
+    @staticmethod
+    def key(content: bytes, schema: str) -> str:
+        """Compute the ledger key of a raw document.
+
+        Args:
+            content (bytes): raw document content
+            schema (str): digest of the schema the document is validated against
+
+        Returns:
+            str: hex digest identifying the validated document
+        """
+        digest = hashlib.sha256(f"{schema}:".encode())
+        digest.update(content)
+        return digest.hexdigest()
+
+    def is_validated(self, content: bytes, schema: str) -> bool:
+        """Tell whether a document already passed validation against a schema.
+
+        Args:
+            content (bytes): raw document content
+            schema (str): digest of the schema
+
+        Returns:
+            bool: True when the ledger holds the document
+        """
+        found, _ = self.get(self.key(content, schema))
+        return found
+
+    def record(self, content: bytes, schema: str) -> None:
+        """Record that a document passed validation against a schema.
+
+        Args:
+            content (bytes): raw document content
+            schema (str): digest of the schema
+        """
+        self.put(self.key(content, schema), True)  # noqa: FBT003
+
+
+_parse_cache: ParseCache | None = None
+_http_cache: DiskCache | None = None
+_table_cache: TableCache | None = None
+_validation_ledger: ValidationLedger | None = None
+_cache_enabled: bool | None = None
+
+
+def _enabled_from_environment() -> bool:
+    return _cache_enabled if _cache_enabled is not None else not os.environ.get(CACHE_DISABLE_ENV)
+
+
+def get_parse_cache() -> ParseCache:
+    """Return the process-wide parse cache.
+
+    Returns:
+        ParseCache: cache stored under the `parse` folder of the cache root.
+    """
+    global _parse_cache  # noqa: PLW0603
+    if _parse_cache is None:
+        _parse_cache = ParseCache(os.path.join(cache_root(), "parse"), enabled=_enabled_from_environment())
+    return _parse_cache
+
+
+def get_http_cache() -> DiskCache:
+    """Return the process-wide cache of remote documents.
+
+    Returns:
+        DiskCache: cache stored under the `http` folder of the cache root.
+    """
+    global _http_cache  # noqa: PLW0603
+    if _http_cache is None:
+        _http_cache = DiskCache(
+            os.path.join(cache_root(), "http"),
+            HTTP_CACHE_MAX_BYTES,
+            enabled=_enabled_from_environment(),
+        )
+    return _http_cache
+
+
+def get_table_cache() -> TableCache:
+    """Return the process-wide cache of tables derived from documents.
+
+    Returns:
+        TableCache: cache persisted under the `tables` folder of the cache root.
+    """
+    global _table_cache  # noqa: PLW0603
+    if _table_cache is None:
+        _table_cache = TableCache(
+            DiskCache(
+                os.path.join(cache_root(), "tables"),
+                TABLE_CACHE_MAX_BYTES,
+                enabled=_enabled_from_environment(),
+            ),
+        )
+    return _table_cache
+
+
+def get_validation_ledger() -> ValidationLedger:
+    """Return the process-wide ledger of validated specifications.
+
+    Returns:
+        ValidationLedger: ledger stored under the `validated` folder of the cache root.
+    """
+    global _validation_ledger  # noqa: PLW0603
+    if _validation_ledger is None:
+        _validation_ledger = ValidationLedger(
+            os.path.join(cache_root(), "validated"),
+            enabled=_enabled_from_environment(),
+        )
+    return _validation_ledger
+
+
+def is_cache_enabled() -> bool:
+    """Tell whether the on-disk caches are used.
+
+    Returns:
+        bool: False when disabled by `set_cache_enabled` or the environment.
+    """
+    return _enabled_from_environment()
+
+
+def set_cache_enabled(*, enabled: bool) -> None:
+    """Enable or disable the process-wide caches.
+
+    Args:
+        enabled (bool): new state of the caches
+    """
+    global _cache_enabled  # noqa: PLW0603
+    _cache_enabled = enabled
+    table_disk = _table_cache.disk if _table_cache is not None else None
+    for disk_cache in (_parse_cache, _http_cache, table_disk, _validation_ledger):
+        if disk_cache is not None:
+            disk_cache.enabled = enabled
+
+
+def reset_caches() -> None:
+    """Forget the process-wide caches so that they are rebuilt from the environment."""
+    global _parse_cache, _http_cache, _table_cache, _validation_ledger, _cache_enabled  # noqa: PLW0603
+    _parse_cache = None
+    _http_cache = None
+    _table_cache = None
+    _validation_ledger = None
+    _cache_enabled = None
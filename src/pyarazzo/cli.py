@@ -1,23 +1,84 @@
-"""Entry point module of the tool."""
+"""Entry point module of the tool.
 
+Subcommands are registered by import path and only imported when invoked, so that
+commands such as `pyarazzo --version` do not pay for the loaders and their dependencies.
+"""
+
+import importlib
 import logging
 import sys
-from importlib.metadata import PackageNotFoundError, version
+from typing import Any
 
 import click
 
-from pyarazzo.doc.cmd import doc
 from pyarazzo.exceptions import ArazzoError
 
 LOGGER = logging.getLogger(__name__)
 
-try:
-    __version__ = version("pyarazzo")
-except PackageNotFoundError:
-    __version__ = "0.0.0.dev0"
-
 name = "pyarazzo"
 
+# subcommand name -> "module.attribute" of the click command
+LAZY_SUBCOMMANDS = {
+    "doc": "pyarazzo.doc.cmd.doc",
+    "run": "pyarazzo.runtime.cmd.run",
+}
+
+
+def get_version() -> str:
+    """Return the installed version of pyarazzo.
+
+    Returns:
+        str: package version, or a development version when not installed.
+    """
+    from importlib.metadata import PackageNotFoundError, version  # noqa: PLC0415
+
+    try:
+        return version("pyarazzo")
+    except PackageNotFoundError:
+        return "0.0.0.dev0"
+
+
+def __getattr__(attr: str) -> Any:
+    # the version lookup is deferred until it is actually needed
+    if attr == "__version__":
+        return get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+
+
+class LazyGroup(click.Group):
+    """Click group importing its subcommands on first use."""
+
+    def __init__(self, *args: Any, lazy_subcommands: dict[str, str] | None = None, **kwargs: Any) -> None:
+        """Constructor.
+
+        Args:
+            lazy_subcommands (dict[str, str]): map of command name to the import path of the command
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eager and lazy subcommands."""
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return a subcommand, importing it if needed."""
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr = self.lazy_subcommands[cmd_name].rsplit(".", 1)
+            command = getattr(importlib.import_module(module_name), attr)
+            if not isinstance(command, click.Command):
+                raise TypeError(f"{self.lazy_subcommands[cmd_name]} is not a click command")
+            return command
+        return super().get_command(ctx, cmd_name)
+
+
+def print_version(ctx: click.Context, _param: click.Parameter, value: bool) -> None:  # noqa: FBT001
+    """Print the version and exit, resolving the version only when requested."""
+    if not value or ctx.resilient_parsing:
+        return
+    click.echo(f"{ctx.find_root().info_name}, version {get_version()}")
+    ctx.exit()
+
 
 HELP_BLURB = (
     "To see help text, you can run:\n"
@@ -41,14 +102,25 @@ LOGO = (
 USAGE = "pyarazzo [verbose options] <command> <subcommand> [parameters]\n" + f"{HELP_BLURB}"
 
 
-@click.group()
-@click.version_option(__version__)
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS)
+@click.option(
+    "--version",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=print_version,
+    help="Show the version and exit.",
+)
 @click.option("-v", "--verbose", count=True)
-def cli(verbose: int) -> None:
+@click.option("--no-cache", is_flag=True, default=False, help="Do not use the on-disk caches")
+@click.option("--offline", is_flag=True, default=False, help="Serve remote documents from the HTTP cache only")
+def cli(verbose: int, no_cache: bool, offline: bool) -> None:  # noqa: FBT001
     """Cli group.
 
     Args:
         verbose (int): verbose level
+        no_cache (bool): disable the on-disk caches
+        offline (bool): never touch the network for remote documents
     """
     if verbose == 1:
         logging.basicConfig(stream=sys.stdout, level=logging.INFO)
@@ -57,9 +129,15 @@ def cli(verbose: int) -> None:
     else:
         logging.basicConfig(stream=sys.stdout, level=logging.WARNING)
 
+    if no_cache:
+        from pyarazzo.cache import set_cache_enabled  # noqa: PLC0415
+
+        set_cache_enabled(enabled=False)
+
+    if offline:
+        from pyarazzo.http_client import set_offline  # noqa: PLC0415
 
-# adding commands subgroups
-cli.add_command(doc)
+        set_offline(offline=True)
 
 
 def main() -> None:
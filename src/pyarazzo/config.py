@@ -6,6 +6,19 @@ including HTTP settings, PlantUML configuration, and Robot Framework keywords.
 
 # HTTP request timeout in seconds
 HTTP_REQUEST_TIMEOUT = 30
+# HTTP connection establishment timeout in seconds
+HTTP_CONNECT_TIMEOUT = 10
+
+# Connection pool of the shared HTTP client
+HTTP_MAX_CONNECTIONS = 20
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 10
+# Idle time in seconds after which a kept-alive connection is closed
+HTTP_KEEPALIVE_EXPIRY = 30.0
+
+# Maximum number of source descriptions fetched and parsed concurrently
+SOURCE_LOAD_MAX_WORKERS = 8
+# Start method of the worker processes of batch loads, "spawn" never inherits threads or sockets
+SOURCE_LOAD_START_METHOD = "spawn"
 
 # PlantUML diagram settings
 PLANTUML_SETTINGS = {
@@ -31,3 +44,53 @@ SUPPORTED_FORMATS = {
 # Content type mappings
 CONTENT_TYPE_JSON = "application/json"
 CONTENT_TYPE_YAML = ["application/yaml", "text/yaml"]
+
+# Parse cache settings
+# Directory holding the on-disk caches, overridable through the environment
+CACHE_DIR_ENV = "PYARAZZO_CACHE_DIR"
+CACHE_DIR_DEFAULT = "~/.cache/pyarazzo"
+# Any non-empty value disables the on-disk caches (same as `--no-cache`)
+CACHE_DISABLE_ENV = "PYARAZZO_NO_CACHE"
+# Upper bound of the parse cache size on disk, oldest entries are evicted first
+PARSE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Bump whenever the parsed representation changes to invalidate existing entries
+PARSE_CACHE_VERSION = 1
+
+# HTTP cache settings
+# Upper bound of the cache of remote documents on disk
+HTTP_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Any non-empty value serves remote documents from the HTTP cache only (same as `--offline`)
+OFFLINE_ENV = "PYARAZZO_OFFLINE"
+
+# Operation table cache settings
+# Upper bound of the cache of OpenAPI operation tables on disk
+TABLE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Bump whenever `OperationRecord` changes to invalidate existing entries
+TABLE_CACHE_VERSION = 2
+
+# Validation ledger settings
+# Upper bound of the ledger of documents that passed schema validation, on disk
+VALIDATION_LEDGER_MAX_BYTES = 4 * 1024 * 1024
+
+# Operation index settings
+# SQLite database of the operation index, under the cache directory
+OPERATION_INDEX_FILE = "operations.sqlite"
+# Bump whenever the index schema changes, existing indexes are then rebuilt
+OPERATION_INDEX_SCHEMA_VERSION = 2
+
+
+# Runtime settings
+# Number of compiled runtime expressions kept in memory, least recently used first evicted
+EXPRESSION_CACHE_SIZE = 4096
+# Number of parsed XML documents kept in memory for XPath criteria, least recently used first evicted
+XML_DOCUMENT_CACHE_SIZE = 32
+# Upper bound of the steps executed by a workflow run, goto actions looping forever are stopped
+RUN_MAX_STEP_EXECUTIONS = 1000
+# Number of retries of a step when its retry action has no retryLimit
+RUN_DEFAULT_RETRY_LIMIT = 1
+# Maximum number of workflows run concurrently when running a whole specification
+RUN_MAX_CONCURRENT_WORKFLOWS = 8
+# Maximum number of requests in flight across the workflows run concurrently
+RUN_MAX_CONCURRENT_REQUESTS = HTTP_MAX_CONNECTIONS
+# Maximum number of steps of a workflow run concurrently, when steps run along their data flow
+RUN_MAX_CONCURRENT_STEPS = 8
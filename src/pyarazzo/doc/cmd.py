@@ -8,6 +8,7 @@ import click
 from pyarazzo.doc.generator import SimpleMarkdownGeneratorVisitor
 from pyarazzo.exceptions import ArazzoError, GenerationError
 from pyarazzo.model.arazzo import ArazzoSpecificationLoader
+from pyarazzo.model.index import OperationIndex
 
 
 @click.group()
@@ -32,11 +33,52 @@ def doc() -> None:
     default=".",
     help="Path ",
 )
-def generate(spec_path: str, output_dir: str) -> None:
+@click.option(
+    "--index",
+    "index_path",
+    type=click.Path(dir_okay=False),
+    is_flag=False,
+    flag_value="",
+    default=None,
+    help="Keep the OpenAPI operations in an on-disk index (SQLite), optionally at the given path",
+)
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Load the OpenAPI source descriptions in this many worker processes",
+)
+@click.option(
+    "--trusted",
+    is_flag=True,
+    default=False,
+    help="Skip the JSON Schema validation of the specification",
+)
+@click.option(
+    "--workflow",
+    "workflow_ids",
+    multiple=True,
+    help="Only document this workflow and the workflows it needs, may be repeated",
+)
+def generate(
+    spec_path: str,
+    output_dir: str,
+    index_path: str | None,
+    workers: int,
+    workflow_ids: tuple[str, ...],
+    *,
+    trusted: bool,
+) -> None:
     """Generate documentation from Arazzo specification."""
+    operation_index = OperationIndex(index_path or None) if index_path is not None else None
     try:
-        specification = ArazzoSpecificationLoader.load(spec_path)
-        visitor: SimpleMarkdownGeneratorVisitor = SimpleMarkdownGeneratorVisitor(output_dir)
+        specification = ArazzoSpecificationLoader.load(spec_path, trusted=trusted, workflow_ids=workflow_ids)
+        visitor: SimpleMarkdownGeneratorVisitor = SimpleMarkdownGeneratorVisitor(
+            output_dir,
+            operation_index,
+            processes=workers,
+        )
         specification.accept(visitor)
         click.echo(f"Documentation generated successfully from {spec_path} to {output_dir}")
     except ArazzoError as error:
@@ -45,3 +87,6 @@ def generate(spec_path: str, output_dir: str) -> None:
     except Exception as error:  # noqa: BLE001
         click.echo(f"Unexpected error generating documentation: {error}", err=True)
         raise click.Abort from GenerationError(f"Documentation generation failed: {error!s}")
+    finally:
+        if operation_index is not None:
+            operation_index.close()
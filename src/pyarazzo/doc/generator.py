@@ -6,6 +6,7 @@ It includes markdown generation with PlantUML diagrams for workflow visualizatio
 
 import logging
 import os
+from typing import TYPE_CHECKING
 
 from pyarazzo.config import PLANTUML_SETTINGS
 from pyarazzo.model.arazzo import (
@@ -24,7 +25,10 @@ from pyarazzo.model.arazzo import (
     Workflow,
     WorkflowId,
 )
-from pyarazzo.model.openapi import ApiOperation, OperationRegistry
+from pyarazzo.model.openapi import OperationRecord, OperationRegistry
+
+if TYPE_CHECKING:
+    from pyarazzo.model.index import OperationIndex
 
 LOGGER = logging.getLogger(__name__)
 
@@ -32,15 +36,20 @@ LOGGER = logging.getLogger(__name__)
 class SimpleMarkdownGeneratorVisitor(ArazzoVisitor):
     """Visitor that generates markdown files for workflows."""
 
-    def __init__(self, output_dir: str) -> None:
+    def __init__(self, output_dir: str, operation_index: "OperationIndex | None" = None, processes: int = 0) -> None:
         """Constructor.
 
         Args:
             output_dir (str): output dir path
+            operation_index (OperationIndex | None): on-disk index holding the operations of the source descriptions
+            processes (int): number of worker processes loading the source descriptions, 0 to use threads
         """
         self.output_dir = output_dir
+        self.processes = processes
         self.content = ""
         self.operation_registry = OperationRegistry(operations={})
+        if operation_index is not None:
+            self.operation_registry.use_index(operation_index)
         os.makedirs(output_dir, exist_ok=True)
 
     def plantumlify(self, name: str | WorkflowId | StepId) -> str:
@@ -60,8 +69,14 @@ class SimpleMarkdownGeneratorVisitor(ArazzoVisitor):
         Args:
             spec (ArazzoSpec): _description_
         """
+        # source descriptions are loaded concurrently rather than visited one by one
         for source_description in spec.source_descriptions:
-            source_description.accept(self)
+            self._check_source_type(source_description)
+        self.operation_registry.extend(
+            [source.url for source in spec.source_descriptions],
+            sources=[source.name for source in spec.source_descriptions],
+            processes=self.processes,
+        )
 
         for wf in spec.workflows:
             self.content = ""
@@ -97,8 +112,11 @@ class SimpleMarkdownGeneratorVisitor(ArazzoVisitor):
             step_description = step.description
             called_service = self.plantumlify(step.step_id)
 
-            if step.operation_id is not None:
-                operation: ApiOperation = self.operation_registry.operations[step.operation_id]
+            if step.operation_id is not None or step.operation_path is not None:
+                operation: OperationRecord = self.operation_registry.resolve(
+                    operation_id=step.operation_id,
+                    operation_path=step.operation_path,
+                )
                 called_service = self.plantumlify(operation.service_name)
                 step_description = f"{operation.method} {operation.path}"
                 self.content += f"{self.plantumlify(workflow.workflow_id)} --> {called_service} : {step_description}\n"
@@ -147,11 +165,14 @@ class SimpleMarkdownGeneratorVisitor(ArazzoVisitor):
         Args:
             instance (SourceDescriptionObject): _description_
         """
+        self._check_source_type(instance)
+        self.operation_registry.append(openapi_spec=instance.url, source=instance.name)
+
+    @staticmethod
+    def _check_source_type(instance: SourceDescriptionObject) -> None:
         if instance.type != SourceType.openapi:
             raise ValueError(f"not supported source type {instance.type} for source {instance.name} ")
 
-        self.operation_registry.append(openapi_spec=instance.url)
-
     def visit_criterion_expression_type(self, instance: CriterionExpressionTypeObject) -> None:
         """Visit CriterionExpressionTypeObject instance.
 
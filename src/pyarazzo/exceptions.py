@@ -9,6 +9,14 @@ class SpecificationError(ArazzoError):
     """Raised when specification is invalid or malformed."""
 
 
+class ExpressionError(SpecificationError):
+    """Raised when a runtime expression is malformed."""
+
+
+class ExecutionError(ArazzoError):
+    """Raised when a workflow cannot be executed."""
+
+
 class LoadError(ArazzoError):
     """Raised when specification cannot be loaded from source."""
 
@@ -0,0 +1,168 @@
+"""Shared HTTP client.
+
+All remote documents (Arazzo and OpenAPI descriptions) are fetched through a single
+pooled, keep-alive `httpx.Client`, so that several documents served by the same host
+reuse their connections instead of paying a TLS handshake each.
+Pool limits and timeouts are read from `pyarazzo.config`.
+
+Remote documents are kept in the HTTP cache along with their `ETag` and `Last-Modified`
+validators: later fetches are conditional requests, and a `304 Not Modified` answer is
+served from disk. In offline mode, documents are only served from the cache.
+"""
+
+import atexit
+import hashlib
+import logging
+import os
+import threading
+from dataclasses import dataclass
+
+import httpx
+
+from pyarazzo.cache import get_http_cache
+from pyarazzo.config import (
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_REQUEST_TIMEOUT,
+    OFFLINE_ENV,
+)
+from pyarazzo.exceptions import LoadError
+
+LOGGER = logging.getLogger(__name__)
+
+_client: httpx.Client | None = None
+_lock = threading.Lock()
+_offline: bool | None = None
+
+
+@dataclass
+class RemoteDocument:
+    """Content of a remote document along with its cache validators."""
+
+    url: str
+    """Url of the document."""
+    content: bytes
+    """Raw content."""
+    content_type: str
+    """Value of the Content-Type header."""
+    etag: str | None = None
+    """Value of the ETag header."""
+    last_modified: str | None = None
+    """Value of the Last-Modified header."""
+
+
+def create_http_client() -> httpx.Client:
+    """Create an HTTP client configured from `pyarazzo.config`.
+
+    Returns:
+        httpx.Client: pooled, keep-alive client.
+    """
+    return httpx.Client(
+        timeout=httpx.Timeout(HTTP_REQUEST_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+        follow_redirects=True,
+    )
+
+
+def get_http_client() -> httpx.Client:
+    """Return the process-wide HTTP client, creating it on first use.
+
+    Returns:
+        httpx.Client: shared client, safe to use from several threads.
+    """
+    global _client  # noqa: PLW0603
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = create_http_client()
+    return _client
+
+
+def close_http_client() -> None:
+    """Close the process-wide HTTP client and its pooled connections."""
+    global _client  # noqa: PLW0603
+    with _lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+atexit.register(close_http_client)
+
+
+def is_offline() -> bool:
+    """Tell whether remote documents must only be served from the HTTP cache.
+
+    Returns:
+        bool: True in offline mode.
+    """
+    return _offline if _offline is not None else bool(os.environ.get(OFFLINE_ENV))
+
+
+def set_offline(*, offline: bool | None) -> None:
+    """Enable or disable the offline mode.
+
+    Args:
+        offline (bool | None): new mode, None to follow the environment again
+    """
+    global _offline  # noqa: PLW0603
+    _offline = offline
+
+
+def _cache_key(url: str) -> str:
+    return hashlib.sha256(url.encode()).hexdigest()
+
+
+def fetch_document(url: str) -> RemoteDocument:
+    """Fetch a remote document, revalidating the cached copy if there is one.
+
+    Args:
+        url (str): url of the document
+
+    Raises:
+        LoadError: in offline mode, when the document is not in the cache.
+        httpx.HTTPError: when the request fails or the response status is an error.
+
+    Returns:
+        RemoteDocument: the document, either fresh or served from the cache.
+    """
+    http_cache = get_http_cache()
+    key = _cache_key(url)
+    found, cached = http_cache.get(key)
+
+    if is_offline():
+        if not found:
+            raise LoadError(f"{url} is not available offline")
+        LOGGER.debug(f"Offline, serving {url} from the HTTP cache")
+        return cached
+
+    headers = {}
+    if found:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    LOGGER.debug(f"GET {url}")
+    response = get_http_client().get(url, headers=headers)
+    if found and response.status_code == httpx.codes.NOT_MODIFIED:
+        LOGGER.debug(f"{url} not modified, serving it from the HTTP cache")
+        return cached
+    response.raise_for_status()
+
+    document = RemoteDocument(
+        url=url,
+        content=response.content,
+        content_type=response.headers.get("Content-Type", ""),
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
+    if (document.etag or document.last_modified) and "no-store" not in response.headers.get("Cache-Control", ""):
+        http_cache.put(key, document)
+    return document
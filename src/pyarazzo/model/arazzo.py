@@ -7,12 +7,22 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Annotated, Any, SupportsIndex
+from typing import TYPE_CHECKING, Annotated, Any, SupportsIndex
 
-from pydantic import BaseModel, Field, RootModel
+from pydantic import BaseModel, Field, PrivateAttr, RootModel
 
 # from pyarazzo.utils import load_spec
 from pyarazzo import utils
+from pyarazzo.exceptions import SpecificationError
+from pyarazzo.model.graph import WorkflowGraph
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterator
+
+    from pyarazzo.model.components import ComponentTable
+
+# prefix of the references to reusable actions, e.g. `$components.successActions.retry`
+COMPONENTS_REFERENCE_PREFIX = "$components."
 
 
 class ArazzoVisitor(ABC):
@@ -22,6 +32,9 @@ class ArazzoVisitor(ABC):
     def visit_specification(self, instance: ArazzoSpecification) -> None:
         """Visit ArazzoSpecification instance.
 
+        `instance.workflow_graph` orders the workflows in levels of workflows independent
+        from each other, which can be visited in parallel.
+
         Args:
             instance (ArazzoSpecification): _description_
         """
@@ -469,10 +482,10 @@ class CriterionObject(BaseModel):
         ),
     ]
     type: Annotated[
-        CriterionObjectConditiontype,
+        CriterionObjectConditiontype | CriterionExpressionTypeObject,
         Field(
             CriterionObjectConditiontype.SIMPLE,
-            description="The type of condition to be applied",
+            description="The type of condition to be applied, or the type and version of its expression language",
         ),
     ]
 
@@ -589,8 +602,9 @@ class Step(ArazzoElement):
     request_body: Annotated[
         RequestBodyObject,
         Field(
-            [],
-            description="A list of parameters that MUST be passed to an operation or workflow as referenced by operationId, operationPath, or workflowId",
+            None,
+            description="The request body to pass to an operation as referenced by operationId or operationPath",
+            alias="requestBody",
         ),
     ]
     success_criteria: Annotated[
@@ -621,7 +635,7 @@ class Step(ArazzoElement):
     outputs: Annotated[
         dict[str, Any],
         Field(
-            dict,
+            default_factory=dict,
             description="A map between a friendly name and a dynamic output value defined using a runtime expression",
         ),
     ]
@@ -636,7 +650,7 @@ class RuntimeExpression(RootModel):
 
     root: Annotated[
         str,
-        Field(..., description="", pattern="^$\\$sourceDescriptions\\.([A-Za-z0-9_\\-]+)\\.([A-Za-z0-9_\\-]+)$"),
+        Field(..., description="A runtime expression, e.g. `$response.body`", pattern="^\\$"),
     ]
 
     @classmethod
@@ -829,6 +843,64 @@ class ArazzoSpecification(ArazzoElement):
         ComponentsObject,
         Field(None, description="A list of workflows"),
     ]
+    # workflows left out of a selective load, kept as raw dicts until they are requested
+    _deferred_workflows: dict[str, dict] = PrivateAttr(default_factory=dict)
+    _workflow_graph: WorkflowGraph | None = PrivateAttr(default=None)
+    _component_table: ComponentTable | None = PrivateAttr(default=None)
+
+    @property
+    def workflow_graph(self) -> WorkflowGraph:
+        """Dependency graph of the workflows, built on first access and shared by every consumer.
+
+        Raises:
+            SpecificationError: when the workflows depend on each other in a cycle
+        """
+        if self._workflow_graph is None:
+            self._workflow_graph = WorkflowGraph.from_workflows(self.workflows)
+        return self._workflow_graph
+
+    @property
+    def component_table(self) -> ComponentTable:
+        """Resolved references to reusable components, built on first access and shared by every consumer.
+
+        Raises:
+            SpecificationError: when a reference targets a missing component
+        """
+        if self._component_table is None:
+            from pyarazzo.model.components import ComponentTable  # noqa: PLC0415
+
+            self._component_table = ComponentTable.from_specification(self)
+        return self._component_table
+
+    def get_workflow(self, workflow_id: str) -> Workflow:
+        """Return a workflow, building it first when it was left out of a selective load.
+
+        Args:
+            workflow_id (str): id of the workflow
+
+        Raises:
+            SpecificationError: when the specification has no such workflow
+
+        Returns:
+            Workflow: the workflow
+        """
+        for workflow in self.workflows:
+            if workflow.workflow_id == workflow_id:
+                return workflow
+        raw = self._deferred_workflows.pop(workflow_id, None)
+        if raw is None:
+            raise SpecificationError(f"Unknown workflow {workflow_id}")
+        workflow = Workflow.model_validate(raw)
+        self.workflows.append(workflow)
+        self._workflow_graph = None
+        if self._component_table is not None:
+            self._component_table.add_workflow(workflow)
+        return workflow
+
+    @property
+    def deferred_workflow_ids(self) -> list[str]:
+        """Ids of the workflows not built yet."""
+        return list(self._deferred_workflows)
 
     def accept(self, visitor: ArazzoVisitor) -> None:
         """Allows an Arazzo visitor to traverse the instance.
@@ -840,18 +912,96 @@ class ArazzoSpecification(ArazzoElement):
         return visitor.visit_specification(self)
 
 
+def _referenced_workflow_ids(workflow: dict, components: dict) -> Iterator[str]:
+    """Yield the ids of the workflows a raw workflow depends on, calls, or transfers to."""
+    yield from workflow.get("dependsOn") or []
+    actions = [*(workflow.get("successActions") or []), *(workflow.get("failureActions") or [])]
+    for step in workflow.get("steps") or []:
+        if step.get("workflowId"):
+            yield step["workflowId"]
+        actions.extend(step.get("onSuccess") or [])
+        actions.extend(step.get("onFailure") or [])
+    for action in actions:
+        reference = action.get("reference")
+        if isinstance(reference, str) and reference.startswith(COMPONENTS_REFERENCE_PREFIX):
+            kind, _, name = reference.removeprefix(COMPONENTS_REFERENCE_PREFIX).partition(".")
+            action = (components.get(kind) or {}).get(name) or {}  # noqa: PLW2901
+        if action.get("workflowId"):
+            yield action["workflowId"]
+
+
+def select_workflows(spec_dict: dict, workflow_ids: Collection[str]) -> tuple[list[dict], list[dict]]:
+    """Split the raw workflows of a specification into the requested ones, with the workflows they need, and the others.
+
+    The requested workflows are completed with the transitive closure of their `dependsOn`,
+    of the `workflowId` of their steps and of the `workflowId` of their success and failure
+    actions, reusable actions included. Workflows of other source descriptions are ignored.
+
+    Args:
+        spec_dict (dict): specification as a dict
+        workflow_ids (Collection[str]): ids of the requested workflows
+
+    Raises:
+        SpecificationError: when a requested workflow does not exist
+
+    Returns:
+        tuple[list[dict], list[dict]]: selected and remaining workflows, in document order
+    """
+    workflows = {workflow.get("workflowId"): workflow for workflow in spec_dict.get("workflows") or []}
+    missing = [workflow_id for workflow_id in workflow_ids if workflow_id not in workflows]
+    if missing:
+        raise SpecificationError(f"Unknown workflow {', '.join(missing)}")
+
+    components = spec_dict.get("components") or {}
+    selected: set[str] = set()
+    pending = list(workflow_ids)
+    while pending:
+        workflow_id = pending.pop()
+        if workflow_id in selected or workflow_id not in workflows:
+            continue
+        selected.add(workflow_id)
+        pending.extend(_referenced_workflow_ids(workflows[workflow_id], components))
+
+    return (
+        [workflow for workflow_id, workflow in workflows.items() if workflow_id in selected],
+        [workflow for workflow_id, workflow in workflows.items() if workflow_id not in selected],
+    )
+
+
 class ArazzoSpecificationLoader:
     """Helper class to load an Arazzo specific ation from a file or URL."""
 
     @staticmethod
-    def load(path_or_url: str) -> ArazzoSpecification:
+    def load(
+        path_or_url: str,
+        *,
+        trusted: bool = False,
+        workflow_ids: Collection[str] | None = None,
+    ) -> ArazzoSpecification:
         """Load and arazzo specification.
 
+        The JSON Schema validation is only run for documents that did not already pass it,
+        the pydantic model is built in every case.
+
+        When workflows are selected, only they and the workflows they need are built, the other
+        workflows are kept as raw dicts until requested with `ArazzoSpecification.get_workflow`.
+
         Args:
             path_or_url (str): url or path
+            trusted (bool): skip the JSON Schema validation, e.g. for bundles produced by pyarazzo
+            workflow_ids (Collection[str] | None): ids of the workflows to build, all of them when None
+
+        Raises:
+            SpecificationError: when a selected workflow does not exist
 
         Returns:
             ArazzoSpecification: _description_
         """
-        spec_dict = utils.load_spec(path_or_url)
-        return ArazzoSpecification(**spec_dict)
+        spec_dict = utils.load_spec(path_or_url, trusted=trusted)
+        if not workflow_ids:
+            return ArazzoSpecification(**spec_dict)
+
+        selected, deferred = select_workflows(spec_dict, workflow_ids)
+        specification = ArazzoSpecification(**{**spec_dict, "workflows": selected})
+        specification._deferred_workflows = {workflow["workflowId"]: workflow for workflow in deferred}
+        return specification
@@ -0,0 +1,196 @@
+"""Resolution of the references to the reusable components of an Arazzo specification.
+
+Steps and workflows may use reusable parameters and actions by reference, e.g.
+`{"reference": "$components.parameters.page", "value": 2}`. The references of a specification
+are all resolved in a single pass, dangling references are reported when it runs, and the results are
+kept so that every consumer reads resolved parameters and actions without any further lookup.
+"""
+
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from pyarazzo.exceptions import SpecificationError
+from pyarazzo.model.arazzo import (
+    ArazzoSpecification,
+    ComponentsObject,
+    FailureActionObject,
+    ParameterObject,
+    ReusableObject,
+    SuccessActionObject,
+    Workflow,
+)
+
+# prefix of the runtime expressions referencing components
+COMPONENTS_PREFIX = "$components."
+# kinds of components that can be referenced by a ReusableObject, as named in the Components Object
+PARAMETERS = "parameters"
+SUCCESS_ACTIONS = "successActions"
+FAILURE_ACTIONS = "failureActions"
+
+
+class ResolvedReferences(NamedTuple):
+    """Parameters and actions of a workflow or a step, references resolved."""
+
+    parameters: tuple[ParameterObject, ...] = ()
+    success_actions: tuple[SuccessActionObject, ...] = ()
+    failure_actions: tuple[FailureActionObject, ...] = ()
+
+
+class ComponentTable:
+    """Lookup table of the reusable components, and the resolved parameters and actions of a specification."""
+
+    def __init__(self, components: ComponentsObject | None) -> None:
+        """Constructor.
+
+        Args:
+            components (ComponentsObject | None): components of the specification
+        """
+        self._components: dict[str, Any] = {}
+        if components is not None:
+            for kind, entries in (
+                (PARAMETERS, components.parameters),
+                (SUCCESS_ACTIONS, components.success_actions),
+                (FAILURE_ACTIONS, components.failure_actions),
+            ):
+                for name, component in (entries or {}).items():
+                    self._components[f"{COMPONENTS_PREFIX}{kind}.{name}"] = component
+        self._parameters: dict[tuple[str, Any], ParameterObject] = {}
+        self._workflows: dict[str, ResolvedReferences] = {}
+        self._steps: dict[tuple[str, str], ResolvedReferences] = {}
+
+    @classmethod
+    def from_specification(cls, spec: ArazzoSpecification) -> "ComponentTable":
+        """Resolve every reference of the workflows and steps of a specification.
+
+        Args:
+            spec (ArazzoSpecification): the specification
+
+        Raises:
+            SpecificationError: when a reference targets a missing component
+
+        Returns:
+            ComponentTable: the table
+        """
+        table = cls(spec.components)
+        for workflow in spec.workflows:
+            table.add_workflow(workflow)
+        return table
+
+    def lookup(self, reference: str, kind: str) -> Any:
+        """Return the component targeted by a reference.
+
+        Args:
+            reference (str): runtime expression, e.g. `$components.parameters.page`
+            kind (str): expected kind of component, e.g. `parameters`
+
+        Raises:
+            SpecificationError: when the reference targets a missing component, or a component of another kind
+
+        Returns:
+            Any: the component
+        """
+        if not reference.startswith(f"{COMPONENTS_PREFIX}{kind}."):
+            raise SpecificationError(f"Reference {reference} does not target {kind} components")
+        try:
+            return self._components[reference]
+        except KeyError as e:
+            raise SpecificationError(f"Unresolvable reference {reference}") from e
+
+    def resolve_parameter(self, parameter: ParameterObject | ReusableObject) -> ParameterObject:
+        """Resolve a parameter, the value of a reference overrides the value of the reusable parameter.
+
+        Args:
+            parameter (ParameterObject | ReusableObject): parameter or reference to a reusable parameter
+
+        Raises:
+            SpecificationError: when the reference targets a missing parameter
+
+        Returns:
+            ParameterObject: the parameter
+        """
+        if not isinstance(parameter, ReusableObject):
+            return parameter
+        key = (parameter.reference, parameter.value)
+        resolved = self._parameters.get(key)
+        if resolved is None:
+            resolved = self.lookup(parameter.reference, PARAMETERS)
+            if parameter.value is not None:
+                resolved = resolved.model_copy(update={"value": parameter.value})
+            self._parameters[key] = resolved
+        return resolved
+
+    def _resolve(
+        self,
+        parameters: list[ParameterObject | ReusableObject] | None,
+        success_actions: list[SuccessActionObject | ReusableObject] | None,
+        failure_actions: list[FailureActionObject | ReusableObject] | None,
+    ) -> ResolvedReferences:
+        return ResolvedReferences(
+            tuple(self.resolve_parameter(parameter) for parameter in parameters or ()),
+            tuple(
+                self.lookup(action.reference, SUCCESS_ACTIONS) if isinstance(action, ReusableObject) else action
+                for action in success_actions or ()
+            ),
+            tuple(
+                self.lookup(action.reference, FAILURE_ACTIONS) if isinstance(action, ReusableObject) else action
+                for action in failure_actions or ()
+            ),
+        )
+
+    def add_workflow(self, workflow: Workflow) -> None:
+        """Resolve the references of a workflow and of its steps.
+
+        Args:
+            workflow (Workflow): the workflow
+
+        Raises:
+            SpecificationError: when a reference targets a missing component
+        """
+        workflow_id = str(workflow.workflow_id)
+        try:
+            shared = self._resolve(workflow.parameters, workflow.success_actions, workflow.failure_actions)
+        except SpecificationError as e:
+            raise SpecificationError(f"Workflow {workflow_id}: {e}") from e
+        self._workflows[workflow_id] = shared
+        for step in workflow.steps:
+            try:
+                own = self._resolve(step.parameters, step.on_success, step.on_failure)
+            except SpecificationError as e:
+                raise SpecificationError(f"Step {step.step_id} of workflow {workflow_id}: {e}") from e
+            # the parameters and actions of a step override those of its workflow with the same name
+            self._steps[(workflow_id, str(step.step_id))] = ResolvedReferences(
+                _merge(shared.parameters, own.parameters, lambda parameter: (parameter.name, parameter.in_)),
+                _merge(shared.success_actions, own.success_actions, lambda action: action.name),
+                _merge(shared.failure_actions, own.failure_actions, lambda action: action.name),
+            )
+
+    def for_workflow(self, workflow_id: str) -> ResolvedReferences:
+        """Return the parameters and actions declared by a workflow for all its steps.
+
+        Args:
+            workflow_id (str): id of the workflow
+
+        Returns:
+            ResolvedReferences: resolved parameters and actions
+        """
+        return self._workflows[workflow_id]
+
+    def for_step(self, workflow_id: str, step_id: str) -> ResolvedReferences:
+        """Return the parameters and actions applying to a step, those of its workflow included.
+
+        Args:
+            workflow_id (str): id of the workflow
+            step_id (str): id of the step
+
+        Returns:
+            ResolvedReferences: resolved parameters and actions
+        """
+        return self._steps[(workflow_id, step_id)]
+
+
+def _merge(shared: tuple[Any, ...], own: tuple[Any, ...], key: Callable[[Any], Any]) -> tuple[Any, ...]:
+    if not shared:
+        return own
+    merged = {key(item): item for item in shared}
+    merged.update((key(item), item) for item in own)
+    return tuple(merged.values())
@@ -0,0 +1,129 @@
+"""Dependency graph of the workflows of an Arazzo specification.
+
+A workflow depends on the workflows listed in its `dependsOn` and on the workflows called by
+its steps (`Step.workflowId`). The graph is built once per specification, in linear time, and
+orders the workflows in topological levels: the workflows of a level only depend on workflows
+of the previous levels, so they are independent from each other and can be processed in parallel.
+References to workflows of other source descriptions (`$sourceDescriptions.<name>.<workflowId>`)
+are not part of the graph.
+"""
+
+from collections import deque
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING
+
+from pyarazzo.exceptions import SpecificationError
+
+if TYPE_CHECKING:
+    from pyarazzo.model.arazzo import Workflow
+
+
+class WorkflowGraph:
+    """Adjacency lists, reverse edges and topological levels of the workflows of a specification."""
+
+    def __init__(self, dependencies: Mapping[str, Iterable[str]]) -> None:
+        """Constructor.
+
+        Args:
+            dependencies (Mapping[str, Iterable[str]]): ids of the workflows each workflow depends on,
+                in document order; ids unknown to the mapping are ignored
+
+        Raises:
+            SpecificationError: when the dependencies form a cycle
+        """
+        self.dependencies: dict[str, list[str]] = {}
+        self.dependents: dict[str, list[str]] = {workflow_id: [] for workflow_id in dependencies}
+        for workflow_id, targets in dependencies.items():
+            edges = self.dependencies[workflow_id] = list(dict.fromkeys(t for t in targets if t in self.dependents))
+            for target in edges:
+                self.dependents[target].append(workflow_id)
+        self.levels = self._levels()
+        self.order = [workflow_id for level in self.levels for workflow_id in level]
+        self._level_of = {workflow_id: index for index, level in enumerate(self.levels) for workflow_id in level}
+
+    @classmethod
+    def from_workflows(cls, workflows: Iterable["Workflow"]) -> "WorkflowGraph":
+        """Build the graph of workflow models.
+
+        Args:
+            workflows (Iterable[Workflow]): workflows of a specification
+
+        Raises:
+            SpecificationError: when the workflows depend on each other in a cycle
+
+        Returns:
+            WorkflowGraph: the graph
+        """
+        dependencies: dict[str, list[str]] = {}
+        for workflow in workflows:
+            targets = dependencies[str(workflow.workflow_id)] = list(workflow.depends_on or [])
+            targets.extend(str(step.workflow_id) for step in workflow.steps if step.workflow_id is not None)
+        return cls(dependencies)
+
+    def __len__(self) -> int:
+        return len(self.dependencies)
+
+    def __contains__(self, workflow_id: object) -> bool:
+        return workflow_id in self.dependencies
+
+    def _levels(self) -> list[list[str]]:
+        # Kahn's algorithm, one level per round
+        remaining = {workflow_id: len(edges) for workflow_id, edges in self.dependencies.items()}
+        level = [workflow_id for workflow_id, count in remaining.items() if count == 0]
+        levels = []
+        while level:
+            levels.append(level)
+            next_level = []
+            for workflow_id in level:
+                del remaining[workflow_id]
+                for dependent in self.dependents[workflow_id]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        next_level.append(dependent)
+            level = next_level
+        if remaining:
+            cycle = " -> ".join(self._cycle(remaining))
+            raise SpecificationError(f"Workflows depend on each other in a cycle: {cycle}")
+        return levels
+
+    def _cycle(self, candidates: Iterable[str]) -> list[str]:
+        # every workflow left by Kahn's algorithm has a dependency left too: following them
+        # from any of these workflows ends up looping
+        start = next(iter(candidates))
+        remaining = set(candidates)
+        path: dict[str, int] = {}
+        workflow_id = start
+        while workflow_id not in path:
+            path[workflow_id] = len(path)
+            workflow_id = next(target for target in self.dependencies[workflow_id] if target in remaining)
+        walk = list(path)
+        return [*walk[path[workflow_id] :], workflow_id]
+
+    def level_of(self, workflow_id: str) -> int:
+        """Return the topological level of a workflow.
+
+        Args:
+            workflow_id (str): id of the workflow
+
+        Returns:
+            int: 0 for workflows without dependencies, otherwise one more than their deepest dependency
+        """
+        return self._level_of[workflow_id]
+
+    def ancestors(self, workflow_id: str) -> set[str]:
+        """Return the workflows a workflow depends on, directly or transitively.
+
+        Args:
+            workflow_id (str): id of the workflow
+
+        Returns:
+            set[str]: ids of the dependencies
+        """
+        found: set[str] = set()
+        pending = deque(self.dependencies[workflow_id])
+        while pending:
+            dependency = pending.popleft()
+            if dependency not in found:
+                found.add(dependency)
+                pending.extend(self.dependencies[dependency])
+        return found
@@ -0,0 +1,245 @@
+"""Persistent index of OpenAPI operations.
+
+Large API catalogs are indexed once in a SQLite database rather than loaded in memory on
+every run. Documents are indexed by content hash, so a document is only scanned again when
+it changes, and identical documents served from several locations share their rows.
+An `OperationRegistry` attached to an index only pages in the operations it is asked for.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from types import TracebackType
+from typing import Self
+
+from pyarazzo.cache import TableCache, cache_root
+from pyarazzo.config import OPERATION_INDEX_FILE, OPERATION_INDEX_SCHEMA_VERSION
+from pyarazzo.model.openapi import HttpMethod, OpenApiLoader, OperationRecord
+
+LOGGER = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS locations (
+    location TEXT PRIMARY KEY,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    digest TEXT PRIMARY KEY,
+    operations INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS operations (
+    digest TEXT NOT NULL,
+    operation_id TEXT,
+    method TEXT NOT NULL,
+    path TEXT NOT NULL,
+    pointer TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS operations_by_id ON operations (digest, operation_id);
+CREATE INDEX IF NOT EXISTS operations_by_method_path ON operations (digest, method, path);
+CREATE INDEX IF NOT EXISTS operations_by_pointer ON operations (digest, pointer);
+"""
+
+
+def default_index_path() -> str:
+    """Return the default location of the operation index.
+
+    Returns:
+        str: index file under the cache root.
+    """
+    return os.path.join(cache_root(), OPERATION_INDEX_FILE)
+
+
+class OperationIndex:
+    """SQLite index of the operations of OpenAPI documents, safe to use from several threads."""
+
+    def __init__(self, path: str | None = None) -> None:
+        """Constructor.
+
+        Args:
+            path (str | None): database file, `default_index_path()` by default
+        """
+        self.path = path or default_index_path()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+            if version != OPERATION_INDEX_SCHEMA_VERSION:
+                LOGGER.debug(f"Rebuilding operation index {self.path}")
+                self._connection.executescript(
+                    "DROP TABLE IF EXISTS locations; DROP TABLE IF EXISTS documents; DROP TABLE IF EXISTS operations;",
+                )
+                self._connection.execute(f"PRAGMA user_version = {OPERATION_INDEX_SCHEMA_VERSION}")
+            self._connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def add_document(self, url: str, *, strict: bool = False) -> str:
+        """Index an OpenAPI document, unless a document with the same content is already indexed.
+
+        Args:
+            url (str): url or path of the OpenAPI specification
+            strict (bool): validate the whole document, see `OpenApiLoader.extract`
+
+        Raises:
+            LoadError: when the document cannot be read or parsed
+
+        Returns:
+            str: content hash of the document, to be passed to the lookups
+        """
+        location, content, fmt = OpenApiLoader.read(url)
+        digest = TableCache.key(content, "openapi-strict" if strict else "openapi")
+
+        operations = None
+        if not self._is_indexed(digest):
+            # parse outside of the lock, only the writes are serialized
+            operations = OpenApiLoader.extract(OpenApiLoader.parse(url, content, fmt), strict=strict)
+
+        with self._lock, self._connection:
+            if operations is not None and not self._has_digest(digest):
+                LOGGER.debug(f"Indexing {len(operations)} operations of {url}")
+                self._connection.executemany(
+                    "INSERT INTO operations (digest, operation_id, method, path, pointer, data) VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            digest,
+                            operation.operation_id,
+                            operation.method.value if operation.method is not None else "",
+                            operation.path,
+                            operation.pointer,
+                            json.dumps(
+                                [
+                                    operation.service_name,
+                                    operation.operation_id,
+                                    operation.method.value if operation.method is not None else None,
+                                    operation.path,
+                                    operation.parameter_specs,
+                                ],
+                            ),
+                        )
+                        for operation in operations
+                    ],
+                )
+                self._connection.execute(
+                    "INSERT INTO documents (digest, operations) VALUES (?, ?)",
+                    (digest, len(operations)),
+                )
+
+            row = self._connection.execute("SELECT digest FROM locations WHERE location = ?", (location,)).fetchone()
+            if row is None or row[0] != digest:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO locations (location, digest) VALUES (?, ?)",
+                    (location, digest),
+                )
+                if row is not None:
+                    self._prune(row[0])
+        return digest
+
+    def _has_digest(self, digest: str) -> bool:
+        return self._connection.execute("SELECT 1 FROM documents WHERE digest = ?", (digest,)).fetchone() is not None
+
+    def _is_indexed(self, digest: str) -> bool:
+        with self._lock:
+            return self._has_digest(digest)
+
+    def _prune(self, digest: str) -> None:
+        """Drop a document no longer served at any location."""
+        if self._connection.execute("SELECT 1 FROM locations WHERE digest = ?", (digest,)).fetchone() is None:
+            self._connection.execute("DELETE FROM operations WHERE digest = ?", (digest,))
+            self._connection.execute("DELETE FROM documents WHERE digest = ?", (digest,))
+
+    def _fetch_one(self, query: str, parameters: tuple[str, ...]) -> OperationRecord | None:
+        with self._lock:
+            row = self._connection.execute(query + " ORDER BY rowid DESC LIMIT 1", parameters).fetchone()
+        if row is None:
+            return None
+        service_name, operation_id, method, path, parameter_specs = json.loads(row[0])
+        return OperationRecord.create(
+            service_name,
+            operation_id,
+            HttpMethod(method) if method is not None else None,
+            path,
+            tuple(tuple(spec) for spec in parameter_specs),
+        )
+
+    def get(self, digest: str, operation_id: str) -> OperationRecord | None:
+        """Find an operation of a document by operationId.
+
+        Args:
+            digest (str): content hash returned by `add_document`
+            operation_id (str): operationId
+
+        Returns:
+            OperationRecord | None: the operation, None when unknown
+        """
+        return self._fetch_one(
+            "SELECT data FROM operations WHERE digest = ? AND operation_id = ?",
+            (digest, operation_id),
+        )
+
+    def find(self, digest: str, method: HttpMethod | str, path: str) -> OperationRecord | None:
+        """Find an operation of a document by HTTP method and path template.
+
+        Args:
+            digest (str): content hash returned by `add_document`
+            method (HttpMethod | str): HTTP method
+            path (str): path template as declared in the OpenAPI document
+
+        Returns:
+            OperationRecord | None: the operation, None when unknown
+        """
+        method = method.value if isinstance(method, HttpMethod) else method.lower()
+        return self._fetch_one(
+            "SELECT data FROM operations WHERE digest = ? AND method = ? AND path = ?",
+            (digest, method, path),
+        )
+
+    def find_by_pointer(self, digest: str, pointer: str) -> OperationRecord | None:
+        """Find an operation of a document by JSON Pointer, e.g. `/paths/~1pet/get`.
+
+        Args:
+            digest (str): content hash returned by `add_document`
+            pointer (str): escaped JSON Pointer of the operation
+
+        Returns:
+            OperationRecord | None: the operation, None when unknown
+        """
+        return self._fetch_one("SELECT data FROM operations WHERE digest = ? AND pointer = ?", (digest, pointer))
+
+    def count(self, digest: str | None = None) -> int:
+        """Count the indexed operations.
+
+        Args:
+            digest (str | None): restrict the count to a document
+
+        Returns:
+            int: number of operations
+        """
+        with self._lock:
+            if digest is None:
+                row = self._connection.execute("SELECT COALESCE(SUM(operations), 0) FROM documents").fetchone()
+            else:
+                row = self._connection.execute(
+                    "SELECT operations FROM documents WHERE digest = ?",
+                    (digest,),
+                ).fetchone()
+        return row[0] if row is not None else 0
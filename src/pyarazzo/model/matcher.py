@@ -0,0 +1,161 @@
+"""Mapping of concrete request paths back to OpenAPI operations.
+
+Path templates are compiled into one radix tree per HTTP method, with a node per path
+segment. Matching walks the tree segment by segment, so its cost depends on the depth of
+the path rather than on the number of templates. Like OpenAPI, literal segments take
+precedence over templated ones: `/pets/mine` matches `/pets/mine` before `/pets/{petId}`.
+"""
+
+import re
+import sys
+from urllib.parse import unquote, urlparse
+
+from pyarazzo.model.openapi import HttpMethod, OperationRecord, OperationRegistry
+
+# {name} inside a path segment
+TEMPLATE_PARAMETER_PATTERN = re.compile(r"\{([^{}/]+)\}")
+
+
+class _Node:
+    """Node of the radix tree, one per path segment."""
+
+    __slots__ = ("literals", "names", "operation", "parameter", "patterns")
+
+    def __init__(self) -> None:
+        self.literals: dict[str, _Node] = {}
+        # segments mixing literals and parameters, e.g. `{name}.json`
+        self.patterns: list[tuple[re.Pattern[str], _Node]] = []
+        self.parameter: _Node | None = None
+        # operation ending at this node, with the names of the parameters of its template
+        self.operation: OperationRecord | None = None
+        self.names: tuple[str, ...] = ()
+
+
+def _split(path: str) -> list[str]:
+    path = path.strip("/")
+    return path.split("/") if path else []
+
+
+class PathMatcher:
+    """Compiled matcher of concrete request paths against the path templates of operations."""
+
+    def __init__(self, base_path: str = "") -> None:
+        """Constructor.
+
+        Args:
+            base_path (str): prefix of the server url, removed from the matched paths, e.g. `/v2`
+        """
+        self.base_path = base_path.rstrip("/")
+        self._roots: dict[str, _Node] = {}
+        self._size = 0
+
+    @classmethod
+    def from_registry(cls, registry: OperationRegistry, base_path: str = "") -> "PathMatcher":
+        """Compile the operations held in memory by a registry.
+
+        Args:
+            registry (OperationRegistry): registry of the operations
+            base_path (str): prefix of the server url, removed from the matched paths
+
+        Returns:
+            PathMatcher: the matcher
+        """
+        matcher = cls(base_path)
+        for operation in registry.iter_operations():
+            matcher.add(operation)
+        return matcher
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, operation: OperationRecord) -> None:
+        """Compile the path template of an operation, replacing any operation with the same method and template.
+
+        Args:
+            operation (OperationRecord): operation to match
+        """
+        method = operation.method.value if operation.method is not None else ""
+        node = self._roots.setdefault(method, _Node())
+        for segment in _split(operation.path):
+            node = self._child(node, segment)
+        if node.operation is None:
+            self._size += 1
+        node.operation = operation
+        node.names = tuple(TEMPLATE_PARAMETER_PATTERN.findall(operation.path))
+
+    @staticmethod
+    def _child(node: _Node, segment: str) -> _Node:
+        parts = TEMPLATE_PARAMETER_PATTERN.split(segment)
+        if len(parts) == 1:
+            return node.literals.setdefault(sys.intern(segment), _Node())
+
+        if parts == ["", parts[1], ""]:
+            if node.parameter is None:
+                node.parameter = _Node()
+            return node.parameter
+
+        # parameter names do not take part in matching, they are kept by the final node
+        regex = "".join("([^/]+?)" if index % 2 else re.escape(part) for index, part in enumerate(parts)) + "$"
+        for pattern, child in node.patterns:
+            if pattern.pattern == regex:
+                return child
+        child = _Node()
+        node.patterns.append((re.compile(regex), child))
+        return child
+
+    def match(self, method: HttpMethod | str, path: str) -> tuple[OperationRecord, dict[str, str]] | None:
+        """Find the operation serving a concrete request.
+
+        Args:
+            method (HttpMethod | str): HTTP method of the request
+            path (str): request path or absolute url, the query string is ignored
+
+        Returns:
+            tuple[OperationRecord, dict[str, str]] | None: the operation and the values of its path
+                parameters, None when no template matches
+        """
+        method = method.value if isinstance(method, HttpMethod) else method.lower()
+        root = self._roots.get(method)
+        if root is None:
+            return None
+        path = urlparse(path).path if "://" in path else path.partition("?")[0]
+        if self.base_path:
+            if path != self.base_path and not path.startswith(self.base_path + "/"):
+                return None
+            path = path[len(self.base_path) :]
+
+        values: list[str] = []
+        node = self._walk(root, _split(path), 0, values)
+        if node is None or node.operation is None:
+            return None
+        return node.operation, dict(zip(node.names, map(unquote, values), strict=True))
+
+    def _walk(self, node: _Node, segments: list[str], position: int, values: list[str]) -> _Node | None:
+        if position == len(segments):
+            return node if node.operation is not None else None
+        segment = segments[position]
+        depth = len(values)
+
+        # literal first, then mixed segments, then plain parameters; backtrack on dead ends
+        child = node.literals.get(segment)
+        if child is not None:
+            found = self._walk(child, segments, position + 1, values)
+            if found is not None:
+                return found
+
+        for pattern, child in node.patterns:
+            match = pattern.match(segment)
+            if match is not None:
+                values.extend(match.groups())
+                found = self._walk(child, segments, position + 1, values)
+                if found is not None:
+                    return found
+                del values[depth:]
+
+        if node.parameter is not None:
+            values.append(segment)
+            found = self._walk(node.parameter, segments, position + 1, values)
+            if found is not None:
+                return found
+            del values[depth:]
+        return None
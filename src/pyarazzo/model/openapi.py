@@ -1,17 +1,34 @@
 """pydantic models for Open API."""
 
+import functools
 import json
+import logging
+import multiprocessing
+import os
 import re
+import sys
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any, NamedTuple
+from urllib.parse import unquote
 
-import httpx
-import jsonref
 import yaml
-from openapi_pydantic.v3.v3_0 import OpenAPI, Operation, PathItem
+from openapi_pydantic.v3.v3_0 import OpenAPI, Operation, PathItem, Reference
 from openapi_pydantic.v3.v3_0.parameter import Parameter, ParameterLocation
-from pydantic import BaseModel, Field, field_validator
-from requests.exceptions import HTTPError
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+from pyarazzo import utils
+from pyarazzo.cache import get_table_cache, is_cache_enabled, set_cache_enabled
+from pyarazzo.config import SOURCE_LOAD_MAX_WORKERS, SOURCE_LOAD_START_METHOD
+from pyarazzo.exceptions import LoadError, SpecificationError
+from pyarazzo.http_client import is_offline, set_offline
+from pyarazzo.model.refs import RefResolver, unescape_pointer_token
+
+if TYPE_CHECKING:
+    from pyarazzo.model.index import OperationIndex
+
+LOGGER = logging.getLogger(__name__)
 
 
 class HttpMethod(str, Enum):
@@ -32,17 +49,17 @@ class ApiOperation(BaseModel):
 
     Attributes:
         service_name (str): Name of the service this operation belongs to.
-        operationId (str): Unique identifier for the operation.
+        operationId (Optional[str]): Unique identifier for the operation, if declared.
         method (Optional[HttpMethod]): HTTP method (e.g., GET, POST) for the operation.
         path (str): URL path for the operation.
-        headers (dict): Dictionary of HTTP headers associated with the operation.
-        parameters (dict): Dictionary of parameters for the operation.
+        headers (dict): Header parameter names mapped to their required flag.
+        query_parameters (dict): Query parameter names mapped to their required flag.
+        parameters (dict): Parameter names mapped to their location (path, query, header, cookie).
         body (Optional[dict]): Request body for the operation, if applicable.
 
     Methods:
-        append_parameters(parameters: List[Union[Parameter, Reference]]):
-            Appends a list of parameters to the operation, updating both the parameters and headers.
-            If a parameter is of type 'header', it is added to the headers dictionary.
+        append_parameters(parameters: List[Parameter]):
+            Appends a list of parameters to the operation, updating the parameters, headers and query parameters.
     """
 
     service_name: Annotated[
@@ -54,9 +71,9 @@ class ApiOperation(BaseModel):
     ]
 
     operation_id: Annotated[
-        str,
+        str | None,
         Field(
-            "not-set",
+            None,
             description="",
         ),
     ]
@@ -67,24 +84,194 @@ class ApiOperation(BaseModel):
     parameters: dict = {}
     body: dict | None = None
 
+    @property
+    def pointer(self) -> str:
+        """JSON Pointer of the operation inside its OpenAPI document, as used by Arazzo `operationPath`."""
+        method = self.method.value if self.method is not None else ""
+        return f"/paths/{escape_pointer_token(self.path)}/{method}"
+
+    def add_parameter(self, name: str, location: str, required: bool = False) -> None:  # noqa: FBT001, FBT002
+        """Record a parameter of the operation.
+
+        Args:
+            name (str): parameter name
+            location (str): parameter location (path, query, header, cookie)
+            required (bool): whether the parameter is required
+        """
+        self.parameters[name] = location
+        if location == ParameterLocation.HEADER.value:
+            self.headers[name] = required
+        elif location == ParameterLocation.QUERY.value:
+            self.query_parameters[name] = required
+
     def append_parameters(self, parameters: list[Parameter]) -> None:
         """Append parameters to the operation.
 
-        This method will update the operation's parameters and headers.
-        It will also update the headers if any parameter is of type 'header'.
+        `parameters` maps every parameter name to its location, while `headers` and
+        `query_parameters` map the header and query parameter names to their required flag.
         """
         for param in parameters:
-            if param is not None and param.param_in == ParameterLocation.HEADER:
-                self.headers.update(param)
+            if param is not None:
+                self.add_parameter(param.name, param.param_in.value, bool(param.required))
+
+
+# (name, location, required) of each parameter of an operation
+ParameterSpecs = tuple[tuple[str, str, bool], ...]
+
+# every distinct parameter list is stored once, see `OperationRecord.create`
+_shared_parameter_specs: dict[ParameterSpecs, ParameterSpecs] = {}
+
+
+class OperationRecord(NamedTuple):
+    """Compact, immutable form of an `ApiOperation`, used by the registry and the operation tables.
+
+    Records are plain tuples: no per-instance dictionary, cheap to pickle and hashable.
+    Records built with `create` share their strings (interned service names and paths) and
+    their parameter lists with every other record, which matters for catalogs of tens of
+    thousands of operations. `to_model` returns the full pydantic model.
+    """
+
+    service_name: str
+    operation_id: str | None
+    method: HttpMethod | None
+    path: str
+    parameter_specs: ParameterSpecs = ()
+
+    @classmethod
+    def create(
+        cls,
+        service_name: str,
+        operation_id: str | None,
+        method: HttpMethod | None,
+        path: str,
+        parameter_specs: ParameterSpecs = (),
+    ) -> "OperationRecord":
+        """Build a record sharing its strings and parameter list with the existing records.
+
+        Args:
+            service_name (str): name of the service, the OpenAPI `info.title`
+            operation_id (str | None): operationId, if declared
+            method (HttpMethod | None): HTTP method
+            path (str): path template
+            parameter_specs (ParameterSpecs): `(name, location, required)` of each parameter
+
+        Returns:
+            OperationRecord: the record
+        """
+        if parameter_specs:
+            specs = tuple(
+                (sys.intern(name), sys.intern(location), required) for name, location, required in parameter_specs
+            )
+            parameter_specs = _shared_parameter_specs.setdefault(specs, specs)
+        return cls(sys.intern(service_name), operation_id, method, sys.intern(path), parameter_specs)
+
+    @classmethod
+    def from_model(cls, operation: ApiOperation) -> "OperationRecord":
+        """Compact an operation model.
+
+        Args:
+            operation (ApiOperation): operation model
+
+        Returns:
+            OperationRecord: the record
+        """
+        parameter_specs = tuple(
+            (name, location, bool(operation.headers.get(name, operation.query_parameters.get(name, False))))
+            for name, location in operation.parameters.items()
+        )
+        return cls.create(
+            operation.service_name,
+            operation.operation_id,
+            operation.method,
+            operation.path,
+            parameter_specs,
+        )
+
+    def to_model(self) -> ApiOperation:
+        """Expand the record into the full operation model.
+
+        Returns:
+            ApiOperation: a new, mutable, operation model
+        """
+        operation = ApiOperation(
+            service_name=self.service_name,
+            operation_id=self.operation_id,
+            method=self.method,
+            path=self.path,
+            headers={},
+            query_parameters={},
+            parameters={},
+            body=None,
+        )
+        for name, location, required in self.parameter_specs:
+            operation.add_parameter(name, location, required)
+        return operation
+
+    @property
+    def parameters(self) -> dict[str, str]:
+        """Parameter names mapped to their location (path, query, header, cookie)."""
+        return {name: location for name, location, _ in self.parameter_specs}
+
+    @property
+    def headers(self) -> dict[str, bool]:
+        """Header parameter names mapped to their required flag."""
+        return {
+            name: required
+            for name, location, required in self.parameter_specs
+            if location == ParameterLocation.HEADER.value
+        }
+
+    @property
+    def query_parameters(self) -> dict[str, bool]:
+        """Query parameter names mapped to their required flag."""
+        return {
+            name: required
+            for name, location, required in self.parameter_specs
+            if location == ParameterLocation.QUERY.value
+        }
+
+    @property
+    def pointer(self) -> str:
+        """JSON Pointer of the operation inside its OpenAPI document, as used by Arazzo `operationPath`."""
+        method = self.method.value if self.method is not None else ""
+        return f"/paths/{escape_pointer_token(self.path)}/{method}"
+
+
+def escape_pointer_token(token: str) -> str:
+    """Escape a JSON Pointer reference token (RFC 6901)."""
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+# {$sourceDescriptions.<name>.url}#<json pointer>
+OPERATION_PATH_PATTERN = re.compile(r"^\{\$sourceDescriptions\.(?P<source>[A-Za-z0-9_\-]+)\.url\}#(?P<pointer>.*)$")
+# $sourceDescriptions.<name>.<operationId>
+QUALIFIED_OPERATION_ID_PATTERN = re.compile(
+    r"^\$sourceDescriptions\.(?P<source>[A-Za-z0-9_\-]+)\.(?P<operation_id>.+)$",
+)
 
 
 class OperationRegistry(BaseModel):
-    """Registry for OpenAPI operations."""
+    """Registry for OpenAPI operations.
+
+    Operations are kept as compact `OperationRecord`s, indexed by operationId, by
+    `(source, method, path)` and by Arazzo `operationPath`; all lookups are constant time.
+
+    A registry attached to an `OperationIndex` (see `use_index`) does not load the operations
+    of its specifications in memory: they are indexed on disk and paged in on first lookup.
+    """
 
-    operations: dict[str, ApiOperation] = Field(
+    operations: dict[str, OperationRecord] = Field(
         {},
         description="Dictionary of operations keyed by ID",
     )
+    # nested rather than tuple-keyed dictionaries: no key object is allocated per operation
+    # source -> operationId -> operation
+    _by_source_operation_id: dict[str, dict[str, OperationRecord]] = PrivateAttr(default_factory=dict)
+    # source (None for any source) -> method -> path -> operation
+    _by_method_path: dict[str | None, dict[str, dict[str, OperationRecord]]] = PrivateAttr(default_factory=dict)
+    _operation_index: "OperationIndex | None" = PrivateAttr(default=None)
+    # (source, url, digest) of the documents held by the operation index, in declaration order
+    _indexed: list[tuple[str | None, str, str]] = PrivateAttr(default_factory=list)
 
     @classmethod
     @field_validator("operations")
@@ -94,9 +281,239 @@ class OperationRegistry(BaseModel):
             raise ValueError("Duplicate IDs found in operations")
         return v
 
-    def append(self, openapi_spec: str) -> None:
-        """Append operations from an OpenAPI specification to the registry."""
-        self.operations.update(OpenApiLoader.load(url=openapi_spec))
+    @field_validator("operations", mode="before")
+    @classmethod
+    def compact_operations(cls, value: Any) -> Any:
+        """Accept operation models, they are stored as records."""
+        if isinstance(value, dict):
+            return {
+                key: OperationRecord.from_model(operation) if isinstance(operation, ApiOperation) else operation
+                for key, operation in value.items()
+            }
+        return value
+
+    def model_post_init(self, _context: Any, /) -> None:
+        """Index the operations given at construction time."""
+        for operation in self.operations.values():
+            self._index(operation, sources=[])
+
+    def _index(self, operation: OperationRecord, sources: list[str], *, unqualified: bool = True) -> None:
+        method = operation.method.value if operation.method is not None else ""
+        if unqualified:
+            self._by_method_path.setdefault(None, {}).setdefault(method, {})[operation.path] = operation
+            if operation.operation_id is not None:
+                self.operations[operation.operation_id] = operation
+        for source in sources:
+            self._by_method_path.setdefault(source, {}).setdefault(method, {})[operation.path] = operation
+            if operation.operation_id is not None:
+                self._by_source_operation_id.setdefault(source, {})[operation.operation_id] = operation
+
+    def add(self, operation: OperationRecord | ApiOperation, source: str | None = None, url: str | None = None) -> None:
+        """Add an operation to the registry.
+
+        Args:
+            operation (OperationRecord | ApiOperation): operation to register, models are compacted
+            source (str | None): name of the source description declaring the operation
+            url (str | None): url of the OpenAPI document declaring the operation
+        """
+        if isinstance(operation, ApiOperation):
+            operation = OperationRecord.from_model(operation)
+        self._index(operation, sources=[name for name in (source, url) if name is not None])
+
+    def use_index(self, operation_index: "OperationIndex") -> None:
+        """Keep the operations of the specifications appended from now on in an on-disk index.
+
+        Args:
+            operation_index (OperationIndex): index holding the operations
+        """
+        self._operation_index = operation_index
+
+    def _load(self, openapi_spec: str, *, strict: bool) -> list[OperationRecord] | str:
+        """Load the operations of a specification, or only index them when an operation index is used."""
+        if self._operation_index is not None:
+            return self._operation_index.add_document(openapi_spec, strict=strict)
+        return OpenApiLoader.load(url=openapi_spec, strict=strict)
+
+    def _merge(self, loaded: list[OperationRecord] | str, source: str | None, url: str) -> None:
+        if isinstance(loaded, str):
+            self._indexed.append((source, url, loaded))
+            return
+        for operation in loaded:
+            self.add(operation, source=source, url=url)
+
+    def _page_in(
+        self,
+        source: str | None,
+        query: Callable[["OperationIndex", str], OperationRecord | None],
+    ) -> OperationRecord | None:
+        """Look an operation up in the operation index and keep it in memory.
+
+        Documents are searched from the last declared one, like the in-memory lookups.
+        """
+        if self._operation_index is None:
+            return None
+        for name, url, digest in reversed(self._indexed):
+            if source is not None and source not in (name, url):
+                continue
+            operation = query(self._operation_index, digest)
+            if operation is not None:
+                self._index(operation, [key for key in (name, url) if key is not None], unqualified=source is None)
+                return operation
+        return None
+
+    def append(self, openapi_spec: str, source: str | None = None, *, strict: bool = False) -> None:
+        """Append operations from an OpenAPI specification to the registry.
+
+        Args:
+            openapi_spec (str): url or path of the OpenAPI specification
+            source (str | None): name of the source description referencing the specification
+            strict (bool): validate the whole OpenAPI document, see `OpenApiLoader.extract`
+        """
+        self._merge(self._load(openapi_spec, strict=strict), source, openapi_spec)
+
+    def extend(
+        self,
+        openapi_specs: list[str],
+        max_workers: int = SOURCE_LOAD_MAX_WORKERS,
+        *,
+        sources: list[str] | None = None,
+        strict: bool = False,
+        processes: int = 0,
+    ) -> None:
+        """Append operations from several OpenAPI specifications to the registry.
+
+        Specifications are fetched and parsed concurrently, with at most `max_workers` in flight.
+        Parsing is CPU-bound: with `processes` greater than one, specifications are rather spread
+        over a pool of worker processes (see `OpenApiLoader.load_batch`), unless an operation
+        index is used. Operations are merged in the order of `openapi_specs` whatever the
+        completion order, so a later specification always overrides an earlier one.
+
+        Args:
+            openapi_specs (list[str]): urls or paths of the OpenAPI specifications
+            max_workers (int): maximum number of specifications loaded concurrently
+            sources (list[str] | None): names of the source descriptions, in the order of `openapi_specs`
+            strict (bool): validate the whole OpenAPI documents, see `OpenApiLoader.extract`
+            processes (int): number of worker processes, threads are used when lower than 2
+        """
+        names: list[str | None] = list(sources) if sources is not None else [None] * len(openapi_specs)
+        if processes > 1 and len(openapi_specs) > 1 and self._operation_index is None:
+            batch = OpenApiLoader.load_batch(openapi_specs, processes, strict=strict)
+            for table, openapi_spec, source in zip(batch, openapi_specs, names, strict=True):
+                self._merge(table, source, openapi_spec)
+            return
+        if max_workers <= 1 or len(openapi_specs) <= 1:
+            for openapi_spec, source in zip(openapi_specs, names, strict=True):
+                self.append(openapi_spec, source=source, strict=strict)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(openapi_specs))) as executor:
+            results = list(executor.map(functools.partial(self._load, strict=strict), openapi_specs))
+        for loaded, openapi_spec, source in zip(results, openapi_specs, names, strict=True):
+            self._merge(loaded, source, openapi_spec)
+
+    def iter_operations(self) -> Iterator[OperationRecord]:
+        """Iterate over the operations held in memory, one per method and path template.
+
+        Operations of an operation index that were not paged in are not listed.
+
+        Returns:
+            Iterator[OperationRecord]: the operations, grouped by method
+        """
+        return (operation for paths in self._by_method_path.get(None, {}).values() for operation in paths.values())
+
+    def get(self, operation_id: str, source: str | None = None) -> OperationRecord | None:
+        """Find an operation by operationId.
+
+        Args:
+            operation_id (str): operationId, optionally qualified as `$sourceDescriptions.<name>.<operationId>`
+            source (str | None): restrict the lookup to a source description
+
+        Returns:
+            OperationRecord | None: the operation, None when unknown
+        """
+        match = QUALIFIED_OPERATION_ID_PATTERN.match(operation_id)
+        if match is not None:
+            source, operation_id = match["source"], match["operation_id"]
+        operation = (
+            self._by_source_operation_id.get(source, {}).get(operation_id)
+            if source is not None
+            else self.operations.get(operation_id)
+        )
+        if operation is None:
+            operation = self._page_in(source, lambda index, digest: index.get(digest, operation_id))
+        return operation
+
+    def find(self, method: HttpMethod | str, path: str, source: str | None = None) -> OperationRecord | None:
+        """Find an operation by HTTP method and path template.
+
+        Args:
+            method (HttpMethod | str): HTTP method
+            path (str): path template as declared in the OpenAPI document, e.g. `/pet/{petId}`
+            source (str | None): restrict the lookup to a source description
+
+        Returns:
+            OperationRecord | None: the operation, None when unknown
+        """
+        method = method.value if isinstance(method, HttpMethod) else method.lower()
+        operation = self._by_method_path.get(source, {}).get(method, {}).get(path)
+        if operation is None:
+            operation = self._page_in(source, lambda index, digest: index.find(digest, method, path))
+        return operation
+
+    def find_by_operation_path(self, operation_path: str) -> OperationRecord | None:
+        """Find an operation by Arazzo operationPath.
+
+        Both `{$sourceDescriptions.<name>.url}#/paths/...` and `<url>#/paths/...` forms are supported.
+
+        Args:
+            operation_path (str): reference to a source combined with a JSON Pointer
+
+        Returns:
+            OperationRecord | None: the operation, None when unknown
+        """
+        match = OPERATION_PATH_PATTERN.match(operation_path)
+        if match is not None:
+            source, pointer = match["source"], match["pointer"]
+        else:
+            source, _, pointer = operation_path.partition("#")
+        pointer = unquote(pointer)
+        # operations are only pointed at by /paths/<escaped path>/<method>
+        prefix, _, rest = pointer.partition("/paths/")
+        escaped_path, _, method = rest.rpartition("/")
+        operation = None
+        if not prefix and escaped_path:
+            operation = self._by_method_path.get(source, {}).get(method, {}).get(unescape_pointer_token(escaped_path))
+        if operation is None:
+            operation = self._page_in(source, lambda index, digest: index.find_by_pointer(digest, pointer))
+        return operation
+
+    def resolve(self, operation_id: str | None = None, operation_path: str | None = None) -> OperationRecord:
+        """Resolve the operation referenced by a step.
+
+        Args:
+            operation_id (str | None): operationId of the step
+            operation_path (str | None): operationPath of the step
+
+        Raises:
+            SpecificationError: when the operation cannot be found
+
+        Returns:
+            OperationRecord: the referenced operation
+        """
+        operation = None
+        if operation_id is not None:
+            operation = self.get(operation_id)
+        elif operation_path is not None:
+            operation = self.find_by_operation_path(operation_path)
+        if operation is None:
+            raise SpecificationError(f"Unable to resolve operation {operation_id or operation_path}")
+        return operation
+
+
+def _init_worker(offline: bool, cache_enabled: bool) -> None:  # noqa: FBT001
+    # spawned workers import pyarazzo afresh: the modes set on the command line are passed on
+    set_offline(offline=offline)
+    set_cache_enabled(enabled=cache_enabled)
 
 
 class OpenApiLoader:
@@ -119,89 +536,241 @@ class OpenApiLoader:
         return re.match(pattern, url) is not None
 
     @staticmethod
-    def _download_file(url: str) -> dict:
-        """Download a file from a URL and return its content as a dictionary."""
-        # Send a GET request to the URL
+    def read(url: str) -> tuple[str, bytes, str]:
+        """Read the raw content of a specification.
+
+        Args:
+            url (str): url or path of the OpenAPI specification
+
+        Raises:
+            LoadError: when the document cannot be read
+
+        Returns:
+            tuple[str, bytes, str]: resolved location (url or absolute path), raw content and format
+        """
+        if OpenApiLoader._is_remote(url):
+            return (url, *utils.read_from_url(url))
+        return (os.path.abspath(url), *utils.read_from_file(url))
+
+    @staticmethod
+    def parse(url: str, content: bytes, fmt: str) -> dict:
+        """Parse the raw content returned by `OpenApiLoader.read`.
+
+        Args:
+            url (str): url or path of the OpenAPI specification, for error messages
+            content (bytes): raw content
+            fmt (str): document format (json or yaml)
+
+        Raises:
+            LoadError: when the content cannot be parsed
+
+        Returns:
+            dict: the OpenAPI document
+        """
         try:
-            response = httpx.get(url)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as exc:
-            raise HTTPError(f"Failed to download file. Status code: {exc.response.status_code}") from exc
-        except httpx.RequestError as exc:
-            raise HTTPError(f"An error occurred while requesting {url}: {exc}") from exc
-
-        if url.endswith(".json"):
-            return response.json()
-        if url.endswith((".yaml", ".yml")):
-            return yaml.safe_load(response.text)
-        raise ValueError(
-            "Unsupported file type. Only JSON and YAML files are supported.",
-        )
+            return utils.parse_content(content, fmt)
+        except (json.JSONDecodeError, yaml.YAMLError) as e:
+            raise LoadError(f"Failed to parse {url}: {e!s}") from e
 
     @staticmethod
-    def _process_operation(
+    def _resolve_parameters(
+        parameters: list[Parameter | Reference] | None,
+        resolver: RefResolver,
+        models: dict[str, Parameter],
+    ) -> list[Parameter]:
+        """Resolve referenced parameters, each distinct reference is validated only once."""
+        resolved = []
+        for parameter in parameters or []:
+            if isinstance(parameter, Reference):
+                model = models.get(parameter.ref)
+                if model is None:
+                    model = Parameter.model_validate(resolver.resolve({"$ref": parameter.ref}))
+                    models[parameter.ref] = model
+                resolved.append(model)
+            else:
+                resolved.append(parameter)
+        return resolved
+
+    @staticmethod
+    def _parameter_specs(
         path_item: PathItem,
-        operation_method: HttpMethod,
         operation_data: Operation,
-        operation: ApiOperation,
-    ) -> None:
-        """Helper function to process an operation method."""
-        if operation_data.operationId is None:
-            raise ValueError("Operation ID is required but not provided in the OpenAPI specification.")
-
-        operation.operation_id = operation_data.operationId
-        operation.method = operation_method
-        parameters_merged: list[Any] = []
-        if path_item.parameters is not None:
-            parameters_merged.extend(path_item.parameters)
-        if operation_data.parameters is not None:
-            parameters_merged.extend(operation_data.parameters)
-        operation.append_parameters(parameters_merged)
+        resolver: RefResolver,
+        models: dict[str, Parameter],
+    ) -> ParameterSpecs:
+        """Merge the path level and operation level parameters of an operation."""
+        specs: dict[str, tuple[str, str, bool]] = {}
+        for parameters in (path_item.parameters, operation_data.parameters):
+            for param in OpenApiLoader._resolve_parameters(parameters, resolver, models):
+                specs[param.name] = (param.name, param.param_in.value, bool(param.required))
+        return tuple(specs.values())
 
     @staticmethod
-    def load(url: str) -> dict[str, ApiOperation]:
-        """Load OpenAPI specification from a URL or file and return operations."""
-        operations = {}
-        spec_dict = None
-        # detect if http or path
-        if OpenApiLoader._is_remote(url):
-            spec_dict = OpenApiLoader._download_file(url)
-        else:
-            with open(url) as file:
-                if url.endswith(".json"):
-                    spec_dict = json.load(file)
-                if url.endswith((".yaml", ".yml")):
-                    spec_dict = yaml.safe_load(file)
+    def _extract_from_model(spec_dict: dict) -> list[OperationRecord]:
+        """Validate the whole document into the OpenAPI model, then extract the operations."""
+        operations = []
+        resolver = RefResolver(spec_dict)
+        models: dict[str, Parameter] = {}
+        open_api_spec = OpenAPI.model_validate(spec_dict)
+
+        for path_name, path_item in open_api_spec.paths.items():
+            if path_item.ref is not None:
+                path_item = PathItem.model_validate(resolver.resolve({"$ref": path_item.ref}))  # noqa: PLW2901
+            for http_method in HttpMethod:
+                operation_data = getattr(path_item, http_method.value)
+                if operation_data is None:
+                    continue
+                operations.append(
+                    OperationRecord.create(
+                        open_api_spec.info.title,
+                        operation_data.operationId,
+                        http_method,
+                        path_name,
+                        OpenApiLoader._parameter_specs(path_item, operation_data, resolver, models),
+                    ),
+                )
 
-        # resolve all $ref
-        resolved_data = jsonref.loads(json.dumps(spec_dict))
+        return operations
 
-        open_api_spec = OpenAPI(**resolved_data)
+    @staticmethod
+    def _extract_from_paths(spec_dict: dict) -> list[OperationRecord]:
+        """Extract the operations by scanning the `paths` subtree only, resolving just the references it uses."""
+        if not isinstance(spec_dict, dict):
+            raise SpecificationError("OpenAPI document must be an object")
+        operations = []
+        resolver = RefResolver(spec_dict)
+        service_name = (spec_dict.get("info") or {}).get("title", "not-set")
+
+        for path_name, raw_path_item in (spec_dict.get("paths") or {}).items():
+            if str(path_name).startswith("x-"):
+                # specification extensions
+                continue
+            path_item = resolver.resolve(raw_path_item)
+            if not isinstance(path_item, dict):
+                raise SpecificationError(f"Path item {path_name} must be an object")
+            common_parameters = [resolver.resolve(param) for param in path_item.get("parameters") or []]
+            for http_method in HttpMethod:
+                operation_data = path_item.get(http_method.value)
+                if not isinstance(operation_data, dict):
+                    continue
+                parameters = [resolver.resolve(param) for param in operation_data.get("parameters") or []]
+                # operation level parameters override path level ones with the same name
+                specs: dict[str, tuple[str, str, bool]] = {}
+                for param in [*common_parameters, *parameters]:
+                    try:
+                        specs[param["name"]] = (param["name"], param["in"], bool(param.get("required", False)))
+                    except (KeyError, TypeError) as e:
+                        raise SpecificationError(f"Invalid parameter in {http_method.value} {path_name}") from e
+                operations.append(
+                    OperationRecord.create(
+                        service_name,
+                        operation_data.get("operationId"),
+                        http_method,
+                        path_name,
+                        tuple(specs.values()),
+                    ),
+                )
 
-        # just accumulate all parameters at the operation level
+        return operations
 
-        for path_name, path_item in open_api_spec.paths.items():
-            operation = ApiOperation(
-                service_name=open_api_spec.info.title,
-                operation_id="no-set",
-                method=None,
-                path=path_name,
-                headers={},
-                parameters={},
-                body=None,
-            )
+    @staticmethod
+    def extract(spec_dict: dict, *, strict: bool = False) -> list[OperationRecord]:
+        """Extract the operations of a loaded OpenAPI document, one per path and method.
 
-            method_handlers = {
-                "post": (HttpMethod.post, path_item.post),
-                "get": (HttpMethod.get, path_item.get),
-                "put": (HttpMethod.put, path_item.put),
-            }
+        References are resolved in place and on demand (see `RefResolver`).
 
-            for _, (http_method, operation_data) in method_handlers.items():
-                if operation_data is not None:
-                    OpenApiLoader._process_operation(path_item, http_method, operation_data, operation)
+        Args:
+            spec_dict (dict): loaded OpenAPI document
+            strict (bool): validate the whole document into the `openapi_pydantic` model first,
+                by default only the paths, methods, operationIds and parameters are read
 
-            # TODO : Guarantee that the operationId is not missing
-            operations[operation.operation_id] = operation
+        Returns:
+            list[OperationRecord]: the operations of the document
+        """
+        if strict:
+            return OpenApiLoader._extract_from_model(spec_dict)
+        return OpenApiLoader._extract_from_paths(spec_dict)
 
-        return operations
+    @staticmethod
+    def load_batch(urls: list[str], workers: int, *, strict: bool = False) -> list[list[OperationRecord]]:
+        """Load several OpenAPI specifications in a pool of worker processes.
+
+        Workers send back `OperationRecord`s, plain tuples much cheaper to pickle than models, which
+        are then kept in the table cache of this process. Workers follow the offline mode and the
+        state of the caches of this process. Starting the workers costs a few hundred milliseconds,
+        so this only pays off for large catalogs.
+
+        Args:
+            urls (list[str]): urls or paths of the OpenAPI specifications
+            workers (int): maximum number of worker processes
+            strict (bool): validate the whole documents, see `OpenApiLoader.extract`
+
+        Raises:
+            LoadError: when a document cannot be read or parsed
+
+        Returns:
+            list[list[OperationRecord]]: the operations of each document, in the order of `urls`
+        """
+        context = multiprocessing.get_context(SOURCE_LOAD_START_METHOD)
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(urls)),
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(is_offline(), is_cache_enabled()),
+        ) as executor:
+            batch = list(executor.map(functools.partial(OpenApiLoader.load_table, strict=strict), urls))
+        table_cache = get_table_cache()
+        tables = []
+        for location, key, records in batch:
+            # records built in the workers do not share their strings with the ones of this process
+            table = [OperationRecord.create(*record) for record in records]
+            # the workers stored the tables on disk already
+            table_cache.put(location, key, table, persist=False)
+            tables.append(table)
+        return tables
+
+    @staticmethod
+    def load(url: str, *, strict: bool = False) -> list[OperationRecord]:
+        """Load OpenAPI specification from a URL or file and return its operations, one per path and method.
+
+        Operation tables are shared through the table cache: a document is only parsed and
+        scanned once per process (and once across runs while it is unchanged), whatever the number
+        of specifications referencing it.
+
+        Args:
+            url (str): url or path of the OpenAPI specification
+            strict (bool): validate the whole document, see `OpenApiLoader.extract`
+
+        Raises:
+            LoadError: when the document cannot be read or parsed
+
+        Returns:
+            list[OperationRecord]: the operations of the document
+        """
+        return OpenApiLoader.load_table(url, strict=strict)[2]
+
+    @staticmethod
+    def load_table(url: str, *, strict: bool = False) -> tuple[str, str, list[OperationRecord]]:
+        """Load the operations of an OpenAPI specification along with their key in the table cache.
+
+        Args:
+            url (str): url or path of the OpenAPI specification
+            strict (bool): validate the whole document, see `OpenApiLoader.extract`
+
+        Raises:
+            LoadError: when the document cannot be read or parsed
+
+        Returns:
+            tuple[str, str, list[OperationRecord]]: resolved location and content key of the document, and its operations
+        """
+        location, content, fmt = OpenApiLoader.read(url)
+        table_cache = get_table_cache()
+        key = table_cache.key(content, "openapi-strict" if strict else "openapi")
+        found, operations = table_cache.get(location, key)
+        if found:
+            LOGGER.debug(f"Operation table cache hit for {url}")
+            return location, key, list(operations)
+
+        operations = OpenApiLoader.extract(OpenApiLoader.parse(url, content, fmt), strict=strict)
+        table_cache.put(location, key, operations)
+        return location, key, list(operations)
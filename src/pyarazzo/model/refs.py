@@ -0,0 +1,149 @@
+"""Lazy resolution of local JSON references.
+
+OpenAPI documents are resolved in place rather than through a serialize/re-parse round trip:
+a reference is only followed when a consumer accesses it, every JSON Pointer is looked up once,
+and recursive structures are never expanded, so circular references are harmless unless
+a reference points (directly or through other references) to itself.
+"""
+
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any
+from urllib.parse import unquote
+
+from pyarazzo.exceptions import SpecificationError
+
+REF = "$ref"
+
+
+def unescape_pointer_token(token: str) -> str:
+    """Unescape a JSON Pointer reference token (RFC 6901)."""
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+class RefResolver:
+    """Resolver of the local references (`#/...`) of a loaded document."""
+
+    def __init__(self, document: Any) -> None:
+        """Constructor.
+
+        Args:
+            document (Any): loaded document, as returned by the JSON or YAML parser
+        """
+        self.document = document
+        self._targets: dict[str, Any] = {}
+        self._views: dict[int, Any] = {}
+
+    def lookup(self, ref: str) -> Any:
+        """Return the node targeted by a reference, without following the references it contains.
+
+        Args:
+            ref (str): local reference, e.g. `#/components/parameters/page`
+
+        Raises:
+            SpecificationError: when the reference is not local or targets a missing node
+
+        Returns:
+            Any: the targeted node
+        """
+        if ref in self._targets:
+            return self._targets[ref]
+        if not ref.startswith("#"):
+            raise SpecificationError(f"Unsupported non local reference {ref}")
+
+        node = self.document
+        pointer = unquote(ref[1:])
+        if pointer:
+            for token in pointer.lstrip("/").split("/"):
+                key = unescape_pointer_token(token)
+                try:
+                    node = node[int(key)] if isinstance(node, list) else node[key]
+                except (KeyError, IndexError, ValueError, TypeError) as e:
+                    raise SpecificationError(f"Unresolvable reference {ref}") from e
+        self._targets[ref] = node
+        return node
+
+    def resolve(self, node: Any) -> Any:
+        """Follow the chain of references of a node.
+
+        Only the node itself is resolved, its children are left untouched.
+
+        Args:
+            node (Any): any node of the document
+
+        Raises:
+            SpecificationError: when the references form a cycle
+
+        Returns:
+            Any: the first node of the chain that is not a reference
+        """
+        seen: set[str] = set()
+        while isinstance(node, dict) and REF in node:
+            ref = node[REF]
+            if ref in seen:
+                raise SpecificationError(f"Circular reference {ref}")
+            seen.add(ref)
+            node = self.lookup(ref)
+        return node
+
+    def view(self, node: Any = None) -> Any:
+        """Wrap a node so that references are transparently resolved when accessed.
+
+        Args:
+            node (Any): node to wrap, the whole document by default
+
+        Returns:
+            Any: read-only mapping or sequence view for containers, the node itself otherwise
+        """
+        node = self.resolve(self.document if node is None else node)
+        if not isinstance(node, (dict, list)):
+            return node
+        view = self._views.get(id(node))
+        if view is None:
+            view = LazyMapping(self, node) if isinstance(node, dict) else LazySequence(self, node)
+            self._views[id(node)] = view
+        return view
+
+
+class LazyMapping(Mapping[str, Any]):
+    """Read-only view of an object whose references are resolved on access."""
+
+    def __init__(self, resolver: RefResolver, node: dict) -> None:
+        """Constructor.
+
+        Args:
+            resolver (RefResolver): resolver of the document owning the node
+            node (dict): wrapped node
+        """
+        self._resolver = resolver
+        self._node = node
+
+    def __getitem__(self, key: str) -> Any:
+        return self._resolver.view(self._node[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._node)
+
+    def __len__(self) -> int:
+        return len(self._node)
+
+
+class LazySequence(Sequence[Any]):
+    """Read-only view of an array whose references are resolved on access."""
+
+    def __init__(self, resolver: RefResolver, node: list) -> None:
+        """Constructor.
+
+        Args:
+            resolver (RefResolver): resolver of the document owning the node
+            node (list): wrapped node
+        """
+        self._resolver = resolver
+        self._node = node
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self._resolver.view(item) for item in self._node[index]]
+        return self._resolver.view(self._node[index])
+
+    def __len__(self) -> int:
+        return len(self._node)
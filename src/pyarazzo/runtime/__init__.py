@@ -0,0 +1 @@
+"""Workflow execution package."""
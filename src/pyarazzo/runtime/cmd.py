@@ -0,0 +1,177 @@
+"""Execution Commands.
+
+This module provides the CLI command running the workflows of Arazzo specifications.
+"""
+
+import json
+from typing import Any
+
+import click
+
+from pyarazzo.config import RUN_MAX_CONCURRENT_REQUESTS, RUN_MAX_CONCURRENT_WORKFLOWS
+from pyarazzo.exceptions import ArazzoError
+from pyarazzo.model.arazzo import ArazzoSpecificationLoader
+from pyarazzo.runtime.runner import WorkflowResult, WorkflowRunner
+from pyarazzo.runtime.scheduler import ScheduleResult, WorkflowScheduler
+
+
+def _pairs(option: str, values: tuple[str, ...]) -> dict[str, str]:
+    pairs = {}
+    for value in values:
+        name, separator, rest = value.partition("=")
+        if not separator or not name:
+            raise click.BadParameter(f"expected name=value, got {value!r}", param_hint=option)
+        pairs[name] = rest
+    return pairs
+
+
+def _input_value(value: str) -> Any:
+    # inputs are JSON values, anything else is a string
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def report(result: WorkflowResult) -> dict[str, Any]:
+    """Summarize the outcome of a run.
+
+    Args:
+        result (WorkflowResult): outcome of the run
+
+    Returns:
+        dict[str, Any]: JSON-serializable summary
+    """
+    return {
+        "workflowId": result.workflow_id,
+        "success": result.success,
+        "outputs": result.outputs,
+        "error": result.error,
+        "elapsed": round(result.elapsed, 6),
+        "steps": [
+            {
+                "stepId": step.step_id,
+                "success": step.success,
+                "statusCode": step.status_code,
+                "attempt": step.attempt,
+                "elapsed": round(step.elapsed, 6),
+            }
+            for step in result.steps
+        ],
+    }
+
+
+def schedule_report(schedule: ScheduleResult) -> dict[str, Any]:
+    """Summarize the outcome of a concurrent run of workflows.
+
+    Args:
+        schedule (ScheduleResult): outcome of the run
+
+    Returns:
+        dict[str, Any]: JSON-serializable summary
+    """
+    return {
+        "success": schedule.success,
+        "elapsed": round(schedule.elapsed, 6),
+        "total": round(schedule.total, 6),
+        "criticalPath": schedule.critical_path,
+        "criticalPathTime": round(schedule.critical_path_time, 6),
+        "speedup": round(schedule.speedup, 2),
+        "skipped": schedule.skipped,
+        "workflows": [report(result) for result in schedule.results.values()],
+    }
+
+
+@click.command()
+@click.option(
+    "-s",
+    "--spec",
+    "spec_path",
+    type=click.Path(exists=True),
+    required=True,
+    help="Path to the Arazzo specification file",
+)
+@click.option(
+    "-w",
+    "--workflow",
+    "workflow_ids",
+    multiple=True,
+    help="Id of the workflow to run, may be repeated; every workflow is run concurrently by default",
+)
+@click.option(
+    "-i",
+    "--input",
+    "input_values",
+    multiple=True,
+    help="Input of the workflows as name=value, the value is read as JSON when possible, may be repeated",
+)
+@click.option(
+    "--server",
+    "server_urls",
+    multiple=True,
+    help="Url of the server of a source description as name=url, may be repeated",
+)
+@click.option(
+    "--max-workflows",
+    type=click.IntRange(min=1),
+    default=RUN_MAX_CONCURRENT_WORKFLOWS,
+    show_default=True,
+    help="Maximum number of workflows run concurrently",
+)
+@click.option(
+    "--max-requests",
+    type=click.IntRange(min=1),
+    default=RUN_MAX_CONCURRENT_REQUESTS,
+    show_default=True,
+    help="Maximum number of requests in flight across the workflows run concurrently",
+)
+@click.option(
+    "--parallel-steps",
+    is_flag=True,
+    default=False,
+    help="Run the steps of a workflow concurrently when they neither reference each other nor have actions",
+)
+@click.option(
+    "--trusted",
+    is_flag=True,
+    default=False,
+    help="Skip the JSON Schema validation of the specification",
+)
+def run(
+    spec_path: str,
+    workflow_ids: tuple[str, ...],
+    input_values: tuple[str, ...],
+    server_urls: tuple[str, ...],
+    *,
+    max_workflows: int,
+    max_requests: int,
+    parallel_steps: bool,
+    trusted: bool,
+) -> None:
+    """Run workflows of an Arazzo specification.
+
+    The workflows, or the whole specification, are run concurrently along their dependencies,
+    each one after the workflows of its `dependsOn`. A single workflow is reported on its own.
+    """
+    inputs = {name: _input_value(value) for name, value in _pairs("--input", input_values).items()}
+    servers = _pairs("--server", server_urls)
+    try:
+        specification = ArazzoSpecificationLoader.load(spec_path, trusted=trusted, workflow_ids=workflow_ids)
+        runner = WorkflowRunner(specification, servers=servers, parallel_steps=parallel_steps)
+        scheduler = WorkflowScheduler(runner, max_workflows=max_workflows, max_requests=max_requests)
+        # the inputs are given to every workflow, which only reads its own
+        everyone = [str(workflow.workflow_id) for workflow in specification.workflows]
+        everyone.extend(specification.deferred_workflow_ids)
+        schedule = scheduler.run(workflow_ids or None, dict.fromkeys(everyone, inputs))
+        if len(workflow_ids) == 1:
+            # its dependencies ran first, to give it their outputs
+            result = schedule.results[workflow_ids[0]]
+            summary, success = report(result), result.success
+        else:
+            summary, success = schedule_report(schedule), schedule.success
+    except ArazzoError as error:
+        click.echo(f"Error: {error}", err=True)
+        raise click.Abort from error
+    click.echo(json.dumps(summary, indent=2, default=str))
+    if not success:
+        raise click.exceptions.Exit(1)
@@ -0,0 +1,296 @@
+"""Parser of the condition language of criteria.
+
+Simple criteria (`$statusCode == 200 && $response.body#/status == 'available'`) and the filters
+of JSONPath expressions (`?(@.price < 10)`) share the same language: literals, operands, function
+calls, comparisons (`==`, `!=`, `<`, `<=`, `>`, `>=`), `!`, `&&`, `||` and parentheses. Conditions
+are compiled into closures; operands (runtime expressions, JSONPath paths) are compiled by the caller.
+"""
+
+import operator
+import re
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from pyarazzo.exceptions import ExpressionError
+
+Evaluator = Callable[[Any], Any]
+# compiles the source of an operand, e.g. `$statusCode` or `@.price`, into an evaluator
+OperandCompiler = Callable[[str], Evaluator]
+
+NUMBER_PATTERN = re.compile(r"-?\d+(\.\d+)?([eE][+-]?\d+)?")
+IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+# characters ending an operand outside of brackets
+OPERAND_DELIMITERS = frozenset(" \t\r\n=!<>&|(),")
+KEYWORDS = {"true": True, "false": False, "null": None}
+COMPARISONS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+OPERATORS = ("==", "!=", "<=", ">=", "&&", "||", "<", ">", "!", "(", ")", ",")
+
+
+def _scan_operand(text: str, start: int) -> int:
+    depth = 0
+    quote = ""
+    position = start
+    while position < len(text):
+        char = text[position]
+        if quote:
+            if char == "\\":
+                position += 1
+            elif char == quote:
+                quote = ""
+        elif char in "'\"" and depth:
+            quote = char
+        elif char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        elif char == "(" and depth:
+            depth += 1
+        elif char == ")" and depth:
+            depth -= 1
+        elif not depth and char in OPERAND_DELIMITERS:
+            break
+        position += 1
+    return position
+
+
+def _scan_string(text: str, start: int) -> tuple[str, int]:
+    quote = text[start]
+    chars = []
+    position = start + 1
+    while position < len(text):
+        char = text[position]
+        if char == "\\" and position + 1 < len(text):
+            chars.append(text[position + 1])
+            position += 2
+            continue
+        if char == quote:
+            return "".join(chars), position + 1
+        chars.append(char)
+        position += 1
+    raise ExpressionError(f"Unterminated string in condition {text!r}")
+
+
+def tokenize(text: str) -> list[tuple[str, Any]]:
+    """Split a condition into tokens.
+
+    Args:
+        text (str): condition
+
+    Raises:
+        ExpressionError: when the condition holds an unexpected character
+
+    Returns:
+        list[tuple[str, Any]]: (kind, value) pairs, kinds are `literal`, `operand`, `name` and the operators
+    """
+    tokens: list[tuple[str, Any]] = []
+    position = 0
+    while position < len(text):
+        char = text[position]
+        if char.isspace():
+            position += 1
+        elif char in "$@":
+            end = _scan_operand(text, position)
+            tokens.append(("operand", text[position:end]))
+            position = end
+        elif char in "'\"":
+            value, position = _scan_string(text, position)
+            tokens.append(("literal", value))
+        elif number := NUMBER_PATTERN.match(text, position):
+            literal = number.group()
+            tokens.append(("literal", float(literal) if number.group(1) or number.group(2) else int(literal)))
+            position = number.end()
+        elif identifier := IDENTIFIER_PATTERN.match(text, position):
+            name = identifier.group()
+            tokens.append(("literal", KEYWORDS[name]) if name in KEYWORDS else ("name", name))
+            position = identifier.end()
+        else:
+            symbol = next((symbol for symbol in OPERATORS if text.startswith(symbol, position)), None)
+            if symbol is None:
+                raise ExpressionError(f"Unexpected character {char!r} in condition {text!r}")
+            tokens.append((symbol, symbol))
+            position += len(symbol)
+    return tokens
+
+
+def _coerce(left: Any, right: Any) -> tuple[Any, Any]:
+    # header and query values are strings, compare them as numbers against numbers
+    if isinstance(left, str) and isinstance(right, int | float) and not isinstance(right, bool):
+        try:
+            return float(left), right
+        except ValueError:
+            return left, right
+    if isinstance(right, str) and isinstance(left, int | float) and not isinstance(left, bool):
+        try:
+            return left, float(right)
+        except ValueError:
+            return left, right
+    return left, right
+
+
+def compare(symbol: str, left: Any, right: Any) -> bool:
+    """Compare two values, values of incomparable types are never ordered.
+
+    Args:
+        symbol (str): comparison operator, e.g. `<=`
+        left (Any): left value
+        right (Any): right value
+
+    Returns:
+        bool: result of the comparison
+    """
+    if type(left) is not type(right):
+        left, right = _coerce(left, right)
+    try:
+        return COMPARISONS[symbol](left, right)
+    except TypeError:
+        return symbol == "!="
+
+
+def truthy(value: Any) -> bool:
+    """Tell whether the value of an operand satisfies a condition on its own.
+
+    Args:
+        value (Any): value
+
+    Returns:
+        bool: False for missing values, False and empty strings or collections
+    """
+    if value is True:
+        return True
+    return value is not None and value is not False and value not in ("", [], {})
+
+
+class _Parser:
+    def __init__(self, text: str, operand: OperandCompiler, functions: Mapping[str, Callable[..., Any]]) -> None:
+        self.text = text
+        self.tokens = tokenize(text)
+        self.position = 0
+        self.operand = operand
+        self.functions = functions
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.position][0] if self.position < len(self.tokens) else None
+
+    def _next(self) -> tuple[str, Any]:
+        if self.position >= len(self.tokens):
+            raise ExpressionError(f"Unexpected end of condition {self.text!r}")
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def _expect(self, kind: str) -> None:
+        if self._next()[0] != kind:
+            raise ExpressionError(f"Expected {kind!r} in condition {self.text!r}")
+
+    def parse(self) -> Evaluator:
+        evaluate = self._or()
+        if self.position != len(self.tokens):
+            raise ExpressionError(f"Unexpected {self.tokens[self.position][1]!r} in condition {self.text!r}")
+        return evaluate
+
+    def _or(self) -> Evaluator:
+        operands = [self._and()]
+        while self._peek() == "||":
+            self._next()
+            operands.append(self._and())
+        if len(operands) == 1:
+            return operands[0]
+        if len(operands) == 2:  # noqa: PLR2004 - the most frequent case, without a generator
+            first, second = operands
+            return lambda scope: truthy(first(scope)) or truthy(second(scope))
+        return lambda scope: any(truthy(operand(scope)) for operand in operands)
+
+    def _and(self) -> Evaluator:
+        operands = [self._not()]
+        while self._peek() == "&&":
+            self._next()
+            operands.append(self._not())
+        if len(operands) == 1:
+            return operands[0]
+        if len(operands) == 2:  # noqa: PLR2004 - the most frequent case, without a generator
+            first, second = operands
+            return lambda scope: truthy(first(scope)) and truthy(second(scope))
+        return lambda scope: all(truthy(operand(scope)) for operand in operands)
+
+    def _not(self) -> Evaluator:
+        if self._peek() == "!":
+            self._next()
+            inner = self._not()
+            return lambda scope: not truthy(inner(scope))
+        return self._comparison()
+
+    def _comparison(self) -> Evaluator:
+        left = self._primary()
+        symbol = self._peek()
+        if symbol is None or symbol not in COMPARISONS:
+            return left
+        self._next()
+        right = self._primary()
+        comparison = COMPARISONS[symbol]
+
+        def evaluate(scope: Any) -> bool:
+            first, second = left(scope), right(scope)
+            if type(first) is type(second):
+                try:
+                    return comparison(first, second)
+                except TypeError:
+                    return symbol == "!="
+            return compare(symbol, first, second)
+
+        return evaluate
+
+    def _primary(self) -> Evaluator:
+        kind, value = self._next()
+        if kind == "literal":
+            return lambda _: value
+        if kind == "operand":
+            return self.operand(value)
+        if kind == "(":
+            inner = self._or()
+            self._expect(")")
+            return inner
+        if kind == "name":
+            return self._call(value)
+        raise ExpressionError(f"Unexpected {value!r} in condition {self.text!r}")
+
+    def _call(self, name: str) -> Evaluator:
+        function = self.functions.get(name)
+        if function is None:
+            raise ExpressionError(f"Unknown function {name} in condition {self.text!r}")
+        self._expect("(")
+        arguments: list[Evaluator] = []
+        if self._peek() != ")":
+            arguments.append(self._or())
+            while self._peek() == ",":
+                self._next()
+                arguments.append(self._or())
+        self._expect(")")
+        return lambda scope: function(*(argument(scope) for argument in arguments))
+
+
+def compile_condition(
+    text: str,
+    operand: OperandCompiler,
+    functions: Mapping[str, Callable[..., Any]] | None = None,
+) -> Evaluator:
+    """Compile a condition into a closure.
+
+    Args:
+        text (str): condition, e.g. `$statusCode == 200`
+        operand (OperandCompiler): compiler of the operands starting with `$` or `@`
+        functions (Mapping[str, Callable[..., Any]] | None): functions available to the condition, by name
+
+    Raises:
+        ExpressionError: when the condition is malformed
+
+    Returns:
+        Evaluator: closure evaluating the condition against a scope, passed to the operands
+    """
+    return _Parser(text, operand, functions or {}).parse()
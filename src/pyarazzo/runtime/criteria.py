@@ -0,0 +1,238 @@
+"""Evaluation of criteria.
+
+Criteria (`successCriteria` of steps, `criteria` of actions) are compiled once into closures:
+simple conditions into comparisons of compiled runtime expressions, regular expressions into
+compiled patterns, and JSONPath and XPath conditions into compiled paths. Compiled criteria are
+cached by (context, condition, type, version), and a list of criteria can be evaluated against many
+responses.
+"""
+
+import functools
+import re
+import xml.etree.ElementTree as ET
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from pyarazzo.config import EXPRESSION_CACHE_SIZE
+from pyarazzo.exceptions import ExpressionError
+from pyarazzo.model.arazzo import (
+    CriterionExpressionTypeObject,
+    CriterionExpressionTypeObjectVersion,
+    CriterionObject,
+    CriterionObjectConditiontype,
+)
+from pyarazzo.runtime.condition import compile_condition, truthy
+from pyarazzo.runtime.expression import ExpressionContext, compile_expression
+from pyarazzo.runtime.paths import compile_path
+
+
+class CompiledCriterion:
+    """Criterion ready to be evaluated."""
+
+    __slots__ = ("condition", "context", "evaluate", "type")
+
+    def __init__(
+        self,
+        context: str | None,
+        condition: str,
+        type_: CriterionObjectConditiontype,
+        evaluate: Callable[[ExpressionContext], bool],
+    ) -> None:
+        """Constructor.
+
+        Args:
+            context (str | None): runtime expression the condition applies to
+            condition (str): source of the condition
+            type_ (CriterionObjectConditiontype): type of the condition
+            evaluate (Callable[[ExpressionContext], bool]): closure evaluating the criterion
+        """
+        self.context = context
+        self.condition = condition
+        self.type = type_
+        self.evaluate = evaluate
+
+    def __call__(self, context: ExpressionContext) -> bool:
+        """Evaluate the criterion against a context."""
+        return self.evaluate(context)
+
+    def __repr__(self) -> str:
+        return f"CompiledCriterion({self.type.value}: {self.condition!r})"
+
+
+def _expression_operand(source: str) -> Callable[[ExpressionContext], Any]:
+    return compile_expression(source).evaluate
+
+
+def _simple(condition: str) -> Callable[[ExpressionContext], bool]:
+    evaluate = compile_condition(condition, _expression_operand)
+    return lambda context: truthy(evaluate(context))
+
+
+def _regex(target: Callable[[ExpressionContext], Any], condition: str) -> Callable[[ExpressionContext], bool]:
+    try:
+        pattern = re.compile(condition)
+    except re.error as e:
+        raise ExpressionError(f"Invalid regular expression {condition!r}: {e}") from e
+
+    def evaluate(context: ExpressionContext) -> bool:
+        value = target(context)
+        return value is not None and pattern.search(value if isinstance(value, str) else str(value)) is not None
+
+    return evaluate
+
+
+def _jsonpath(
+    target: Callable[[ExpressionContext], Any],
+    condition: str,
+    version: CriterionExpressionTypeObjectVersion | None,
+) -> Callable[[ExpressionContext], bool]:
+    path = compile_path(CriterionObjectConditiontype.JSONPATH.value, condition, version)
+    return lambda context: bool(path.find(target(context)))
+
+
+def _xpath(
+    target: Callable[[ExpressionContext], Any],
+    condition: str,
+    version: CriterionExpressionTypeObjectVersion | None,
+) -> Callable[[ExpressionContext], bool]:
+    path = compile_path(CriterionObjectConditiontype.XPATH.value, condition, version)
+
+    def evaluate(context: ExpressionContext) -> bool:
+        document = target(context)
+        if not isinstance(document, str | bytes | ET.Element):
+            return False
+        try:
+            return bool(path.find(document))
+        except ExpressionError:
+            # a body which is not XML never satisfies an XPath condition
+            return False
+
+    return evaluate
+
+
+def compile_criterion_source(
+    context: str | None,
+    condition: str,
+    type_: CriterionObjectConditiontype | CriterionExpressionTypeObject | str = CriterionObjectConditiontype.SIMPLE,
+    version: CriterionExpressionTypeObjectVersion | str | None = None,
+) -> CompiledCriterion:
+    """Compile a criterion given by its fields, compiled criteria are cached.
+
+    Args:
+        context (str | None): runtime expression the condition applies to, required unless the condition is simple
+        condition (str): condition
+        type_ (CriterionObjectConditiontype | CriterionExpressionTypeObject | str): type of the condition,
+            or type and version of its expression language
+        version (CriterionExpressionTypeObjectVersion | str | None): version of the expression language of
+            `jsonpath` and `xpath` conditions, the latest by default
+
+    Raises:
+        ExpressionError: when the condition or the context is malformed, or the context is missing
+
+    Returns:
+        CompiledCriterion: the compiled criterion
+    """
+    if isinstance(type_, CriterionExpressionTypeObject):
+        version = type_.version
+        type_ = type_.type.value
+    try:
+        type_ = CriterionObjectConditiontype(type_)
+        version = None if version is None else CriterionExpressionTypeObjectVersion(version)
+    except ValueError as e:
+        raise ExpressionError(f"Unknown condition type {type_} version {version}") from e
+    return _compile(context, condition, type_, version)
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _compile(
+    context: str | None,
+    condition: str,
+    type_: CriterionObjectConditiontype,
+    version: CriterionExpressionTypeObjectVersion | None,
+) -> CompiledCriterion:
+    if type_ == CriterionObjectConditiontype.SIMPLE:
+        return CompiledCriterion(context, condition, type_, _simple(condition))
+    if not context:
+        raise ExpressionError(f"A context is required by the {type_.value} condition {condition!r}")
+    target = compile_expression(context).evaluate
+    if type_ == CriterionObjectConditiontype.REGEX:
+        return CompiledCriterion(context, condition, type_, _regex(target, condition))
+    if type_ == CriterionObjectConditiontype.JSONPATH:
+        return CompiledCriterion(context, condition, type_, _jsonpath(target, condition, version))
+    return CompiledCriterion(context, condition, type_, _xpath(target, condition, version))
+
+
+def compile_criterion(criterion: CriterionObject) -> CompiledCriterion:
+    """Compile a criterion.
+
+    Args:
+        criterion (CriterionObject): criterion of a step or an action
+
+    Raises:
+        ExpressionError: when the criterion is malformed
+
+    Returns:
+        CompiledCriterion: the compiled criterion
+    """
+    context = str(criterion.context) if criterion.context is not None else None
+    return compile_criterion_source(context, criterion.condition, criterion.type)
+
+
+class CompiledCriteria:
+    """List of criteria, satisfied when every criterion is."""
+
+    __slots__ = ("criteria",)
+
+    def __init__(self, criteria: Iterable[CriterionObject | CompiledCriterion]) -> None:
+        """Constructor.
+
+        Args:
+            criteria (Iterable[CriterionObject | CompiledCriterion]): criteria, compiled if needed
+
+        Raises:
+            ExpressionError: when a criterion is malformed
+        """
+        self.criteria = tuple(
+            criterion if isinstance(criterion, CompiledCriterion) else compile_criterion(criterion)
+            for criterion in criteria
+        )
+
+    def __len__(self) -> int:
+        return len(self.criteria)
+
+    def __call__(self, context: ExpressionContext) -> bool:
+        """Tell whether every criterion is satisfied by a context.
+
+        Args:
+            context (ExpressionContext): context, e.g. of a response
+
+        Returns:
+            bool: True when every criterion is satisfied, or there is no criterion
+        """
+        return all(criterion.evaluate(context) for criterion in self.criteria)
+
+    def failures(self, context: ExpressionContext) -> list[CompiledCriterion]:
+        """Return the criteria not satisfied by a context.
+
+        Args:
+            context (ExpressionContext): context, e.g. of a response
+
+        Returns:
+            list[CompiledCriterion]: unsatisfied criteria
+        """
+        return [criterion for criterion in self.criteria if not criterion.evaluate(context)]
+
+    def evaluate_many(self, contexts: Iterable[ExpressionContext]) -> list[bool]:
+        """Evaluate the criteria against many contexts, e.g. every response of a load test.
+
+        Args:
+            contexts (Iterable[ExpressionContext]): contexts
+
+        Returns:
+            list[bool]: for each context, whether every criterion is satisfied
+        """
+        evaluators = [criterion.evaluate for criterion in self.criteria]
+        if len(evaluators) == 1:
+            evaluate = evaluators[0]
+            return [evaluate(context) for context in contexts]
+        return [all(evaluate(context) for evaluate in evaluators) for context in contexts]
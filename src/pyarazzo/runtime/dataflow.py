@@ -0,0 +1,218 @@
+"""Data flow between the steps of a workflow.
+
+The steps of a workflow are an ordered list, but most steps do not read what the previous ones
+produced. A `StepGraph` records, for each step, the steps whose outputs it references
+(`$steps.<id>` in its parameters, request body, success criteria, action criteria and outputs),
+the steps carrying actions, and the targets of goto actions. A step reading `$workflows` depends
+on every step of the workflow calling a workflow, as these record the inputs and outputs of the
+workflows they call, and of the workflows those call in turn.
+
+The graph splits the workflow in batches of consecutive steps that may run concurrently: a batch
+holds no step with actions, as their outcome decides what runs next, and only starts at the target
+of a goto, as a jump must not skip a step running concurrently. Within a batch, two steps
+referencing each other run in document order, so every expression reads the same values as in a
+sequential run. A step failing in a batch fails the workflow: no other step of the batch is
+started, while the steps already running complete.
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from pyarazzo.model.arazzo import (
+    CriterionObject,
+    FailureActionObject,
+    FailureActionObjectType,
+    RequestBodyObject,
+    Step,
+    SuccessActionObject,
+    SuccessActionObjectType,
+    Workflow,
+)
+from pyarazzo.model.components import ComponentTable, ResolvedReferences
+
+# `$steps.<stepId>` in a runtime expression, step ids match `^[A-Za-z0-9_\-]+$`
+STEP_REFERENCE_PATTERN = re.compile(r"\$steps\.([A-Za-z0-9_\-]+)")
+# start of `$workflows.<workflowId>` in a runtime expression, the inputs or outputs of a workflow
+WORKFLOW_REFERENCE_PATTERN = re.compile(r"\$workflows\.")
+# types of the actions transferring to a step
+GOTO_TYPES = (SuccessActionObjectType.goto, FailureActionObjectType.goto)
+
+
+def _strings(value: Any) -> Iterator[str]:
+    # strings of a value, nested in objects and arrays
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for key, child in value.items():
+            yield str(key)
+            yield from _strings(child)
+    elif isinstance(value, list | tuple):
+        for child in value:
+            yield from _strings(child)
+
+
+def _criteria_strings(criteria: Iterable[CriterionObject] | None) -> Iterator[str]:
+    for criterion in criteria or ():
+        if criterion.context is not None:
+            yield str(criterion.context)
+        yield criterion.condition
+
+
+def _expressions(step: Step, references: ResolvedReferences) -> Iterator[str]:
+    # strings of a step that may hold runtime expressions
+    sources: list[Iterable[str]] = [
+        _strings([parameter.value for parameter in references.parameters]),
+        _criteria_strings(step.success_criteria),
+        _strings(dict(step.outputs or {})),
+    ]
+    sources.extend(_criteria_strings(action.criteria) for action in references.success_actions)
+    sources.extend(_criteria_strings(action.criteria) for action in references.failure_actions)
+    if isinstance(step.request_body, RequestBodyObject):
+        sources.append(_strings(step.request_body.payload))
+        sources.append(
+            _strings([replacement.value for replacement in step.request_body.replacements or ()]),
+        )
+    for strings in sources:
+        yield from strings
+
+
+def step_references(step: Step, references: ResolvedReferences) -> set[str]:
+    """Return the ids of the steps whose outputs a step references.
+
+    Args:
+        step (Step): the step
+        references (ResolvedReferences): parameters and actions applying to the step
+
+    Returns:
+        set[str]: ids of the referenced steps, the step itself included when it references its own outputs
+    """
+    return {match for text in _expressions(step, references) for match in STEP_REFERENCE_PATTERN.findall(text)}
+
+
+def reads_workflows(step: Step, references: ResolvedReferences) -> bool:
+    """Tell whether a step references the inputs or outputs of workflows.
+
+    Args:
+        step (Step): the step
+        references (ResolvedReferences): parameters and actions applying to the step
+
+    Returns:
+        bool: True when a runtime expression of the step starts with `$workflows.`
+    """
+    return any(WORKFLOW_REFERENCE_PATTERN.search(text) for text in _expressions(step, references))
+
+
+class StepGraph:
+    """Data dependencies and control flow of the steps of a workflow."""
+
+    def __init__(
+        self,
+        step_ids: list[str],
+        references: dict[str, set[str]],
+        control_steps: set[str],
+        goto_targets: set[str],
+    ) -> None:
+        """Constructor.
+
+        Args:
+            step_ids (list[str]): ids of the steps, in document order
+            references (dict[str, set[str]]): ids of the steps referenced by each step
+            control_steps (set[str]): steps with success or failure actions
+            goto_targets (set[str]): steps targeted by goto actions
+        """
+        self.step_ids = step_ids
+        self.positions = {step_id: position for position, step_id in enumerate(step_ids)}
+        # references to unknown steps evaluate to None whatever the order, they are no dependency
+        self.dependencies = {
+            step_id: sorted(
+                (target for target in references.get(step_id, ()) if target in self.positions and target != step_id),
+                key=self.positions.__getitem__,
+            )
+            for step_id in step_ids
+        }
+        self.control_steps = control_steps
+        self.goto_targets = goto_targets
+        self._batch_ends = self._batches()
+
+    @classmethod
+    def from_workflow(cls, workflow: Workflow, table: ComponentTable) -> "StepGraph":
+        """Analyse the steps of a workflow.
+
+        Args:
+            workflow (Workflow): the workflow
+            table (ComponentTable): resolved parameters and actions of the specification
+
+        Returns:
+            StepGraph: the graph
+        """
+        workflow_id = str(workflow.workflow_id)
+        step_ids = [str(step.step_id) for step in workflow.steps]
+        callers = {step_id for step_id, step in zip(step_ids, workflow.steps, strict=True) if step.workflow_id}
+        references = {}
+        control_steps = set()
+        goto_targets = set()
+        for step_id, step in zip(step_ids, workflow.steps, strict=True):
+            resolved = table.for_step(workflow_id, step_id)
+            references[step_id] = step_references(step, resolved)
+            if reads_workflows(step, resolved):
+                references[step_id] |= callers
+            if resolved.success_actions or resolved.failure_actions:
+                control_steps.add(step_id)
+            actions: tuple[SuccessActionObject | FailureActionObject, ...] = (
+                *resolved.success_actions,
+                *resolved.failure_actions,
+            )
+            for action in actions:
+                if action.step_id is not None and action.type in GOTO_TYPES:
+                    goto_targets.add(str(action.step_id))
+        return cls(step_ids, references, control_steps, goto_targets)
+
+    def _batches(self) -> list[int]:
+        # for each position, the end (excluded) of the batch starting there, scanning backwards
+        ends = [0] * len(self.step_ids)
+        end = len(self.step_ids)
+        for position in range(len(self.step_ids) - 1, -1, -1):
+            step_id = self.step_ids[position]
+            if step_id in self.control_steps:
+                end = position + 1
+            ends[position] = end
+            if step_id in self.control_steps or step_id in self.goto_targets:
+                # steps before a control step or a goto target end their batch before it
+                end = position
+        return ends
+
+    def batch(self, position: int) -> list[int]:
+        """Return the positions of the steps that may run concurrently from a position.
+
+        Args:
+            position (int): position of the next step to run
+
+        Returns:
+            list[int]: consecutive positions, starting with `position`
+        """
+        return list(range(position, self._batch_ends[position]))
+
+    def predecessors(self, positions: Iterable[int]) -> dict[int, list[int]]:
+        """Return the steps of a batch that must complete before each step of the batch starts.
+
+        Args:
+            positions (Iterable[int]): positions of the steps of a batch
+
+        Returns:
+            dict[int, list[int]]: for each position, the earlier positions of the batch it references or
+                that reference it
+        """
+        positions = list(positions)
+        return {
+            position: [
+                earlier
+                for earlier in positions
+                if earlier < position
+                and (
+                    self.step_ids[earlier] in self.dependencies[self.step_ids[position]]
+                    or self.step_ids[position] in self.dependencies[self.step_ids[earlier]]
+                )
+            ]
+            for position in positions
+        }
@@ -0,0 +1,269 @@
+"""Runtime expressions.
+
+Runtime expressions (`$inputs.petId`, `$steps.find-pet.outputs.id`, `$response.body#/0/id`,
+`$statusCode`, ...) and the strings embedding them (`Bearer {$inputs.token}`) are compiled
+once into closures, cached by source text, then evaluated against an `ExpressionContext`
+without any further parsing. Values missing from the context evaluate to None.
+"""
+
+import functools
+import re
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from pyarazzo.config import EXPRESSION_CACHE_SIZE
+from pyarazzo.exceptions import ExpressionError
+from pyarazzo.model.refs import unescape_pointer_token
+
+# `{$...}` embedded in a string
+EMBEDDED_EXPRESSION_PATTERN = re.compile(r"\{(\$[^{}]+)\}")
+
+# expression root -> attribute of the context holding named values
+NAMED_ROOTS = {
+    "inputs": "inputs",
+    "outputs": "outputs",
+    "steps": "steps",
+    "workflows": "workflows",
+    "sourceDescriptions": "source_descriptions",
+    "components": "components",
+}
+# expression root -> attribute of the context holding the value
+VALUE_ROOTS = {"url": "url", "method": "method", "statusCode": "status_code"}
+
+Evaluator = Callable[["ExpressionContext"], Any]
+
+
+@dataclass(slots=True)
+class ExpressionContext:
+    """Values runtime expressions are evaluated against."""
+
+    url: str | None = None
+    """Url of the request."""
+    method: str | None = None
+    """HTTP method of the request."""
+    status_code: int | None = None
+    """Status code of the response."""
+    request_headers: Mapping[str, str] = field(default_factory=dict)
+    """Headers of the request."""
+    request_query: Mapping[str, Any] = field(default_factory=dict)
+    """Query parameters of the request."""
+    request_path: Mapping[str, Any] = field(default_factory=dict)
+    """Path parameters of the request."""
+    request_body: Any = None
+    """Parsed body of the request."""
+    response_headers: Mapping[str, str] = field(default_factory=dict)
+    """Headers of the response."""
+    response_body: Any = None
+    """Parsed body of the response."""
+    inputs: Mapping[str, Any] = field(default_factory=dict)
+    """Inputs of the workflow."""
+    outputs: Mapping[str, Any] = field(default_factory=dict)
+    """Outputs of the workflow."""
+    steps: Mapping[str, Any] = field(default_factory=dict)
+    """Step id -> `{"outputs": {...}}` of the steps already run."""
+    workflows: Mapping[str, Any] = field(default_factory=dict)
+    """Workflow id -> `{"inputs": {...}, "outputs": {...}}` of the workflows already run."""
+    source_descriptions: Mapping[str, Any] = field(default_factory=dict)
+    """Name -> source description."""
+    components: Mapping[str, Any] = field(default_factory=dict)
+    """Components of the specification."""
+
+
+class CompiledExpression:
+    """Runtime expression, or string embedding runtime expressions, ready to be evaluated."""
+
+    __slots__ = ("evaluate", "source")
+
+    def __init__(self, source: str, evaluate: Evaluator) -> None:
+        """Constructor.
+
+        Args:
+            source (str): source text
+            evaluate (Evaluator): closure evaluating the expression against a context
+        """
+        self.source = source
+        self.evaluate = evaluate
+
+    def __call__(self, context: ExpressionContext) -> Any:
+        """Evaluate the expression against a context."""
+        return self.evaluate(context)
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.source!r})"
+
+
+def _child(node: Any, token: str) -> Any:
+    if isinstance(node, Mapping):
+        return node.get(token)
+    if isinstance(node, Sequence) and not isinstance(node, str) and token.isdigit():
+        index = int(token)
+        return node[index] if index < len(node) else None
+    return None
+
+
+def _walk(node: Any, tokens: tuple[str, ...]) -> Any:
+    for token in tokens:
+        if node is None:
+            return None
+        node = _child(node, token)
+    return node
+
+
+def _header(headers: Mapping[str, str], name: str) -> str | None:
+    # header names are case insensitive, httpx headers already handle it
+    value = headers.get(name)
+    if value is not None:
+        return value
+    lower = name.lower()
+    return next((value for key, value in headers.items() if key.lower() == lower), None)
+
+
+def parse_json_pointer(pointer: str) -> tuple[str, ...]:
+    """Split a JSON Pointer (RFC 6901) into unescaped reference tokens.
+
+    Args:
+        pointer (str): JSON Pointer, e.g. `/items/0/id`
+
+    Raises:
+        ExpressionError: when the pointer is not empty and does not start with `/`
+
+    Returns:
+        tuple[str, ...]: reference tokens
+    """
+    if not pointer:
+        return ()
+    if not pointer.startswith("/"):
+        raise ExpressionError(f"Invalid JSON Pointer {pointer!r}")
+    return tuple(unescape_pointer_token(token) for token in pointer[1:].split("/"))
+
+
+def _source_evaluator(source: str, root: str, rest: str) -> Evaluator:
+    # $request.<source> and $response.<source>
+    part, _, name = rest.partition(".")
+    if part == "body" and not name:
+        body = f"{root}_body"
+        return lambda context: getattr(context, body)
+    if part == "header" and name:
+        headers = f"{root}_headers"
+        return lambda context: _header(getattr(context, headers), name)
+    if part in ("query", "path") and name:
+        values = f"{root}_{part}"
+        return lambda context: getattr(context, values).get(name)
+    raise ExpressionError(f"Invalid runtime expression {source!r}")
+
+
+def _evaluator(source: str) -> Evaluator:
+    expression, has_pointer, pointer = source.partition("#")
+    if not expression.startswith("$"):
+        raise ExpressionError(f"Runtime expression must start with $: {source!r}")
+    root, _, rest = expression[1:].partition(".")
+
+    evaluate: Evaluator
+    if root in VALUE_ROOTS and not rest:
+        attribute = VALUE_ROOTS[root]
+        evaluate = lambda context: getattr(context, attribute)  # noqa: E731
+    elif root in ("request", "response") and rest:
+        evaluate = _source_evaluator(source, root, rest)
+    elif root in NAMED_ROOTS and rest:
+        attribute = NAMED_ROOTS[root]
+        names = tuple(rest.split("."))
+        if not all(names):
+            raise ExpressionError(f"Invalid runtime expression {source!r}")
+        evaluate = lambda context: _walk(getattr(context, attribute), names)  # noqa: E731
+    else:
+        raise ExpressionError(f"Invalid runtime expression {source!r}")
+
+    if not has_pointer:
+        return evaluate
+    tokens = parse_json_pointer(pointer)
+    get = evaluate
+    return lambda context: _walk(get(context), tokens)
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(source: str) -> CompiledExpression:
+    """Compile a runtime expression, e.g. `$steps.find-pet.outputs.id` or `$response.body#/id`.
+
+    Compiled expressions are cached by source text.
+
+    Args:
+        source (str): runtime expression
+
+    Raises:
+        ExpressionError: when the expression is malformed
+
+    Returns:
+        CompiledExpression: the compiled expression
+    """
+    return CompiledExpression(source, _evaluator(source.strip()))
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_template(source: str) -> CompiledExpression:
+    """Compile a value that may be a runtime expression or embed some, e.g. `Bearer {$inputs.token}`.
+
+    A string that is a runtime expression evaluates to the value of the expression, with its type.
+    A string embedding expressions evaluates to a string, with each `{$...}` replaced by its value.
+    Any other string evaluates to itself. Compiled values are cached by source text.
+
+    Args:
+        source (str): value
+
+    Raises:
+        ExpressionError: when an expression is malformed
+
+    Returns:
+        CompiledExpression: the compiled value
+    """
+    if source.startswith("$"):
+        return compile_expression(source)
+
+    parts = EMBEDDED_EXPRESSION_PATTERN.split(source)
+    if len(parts) == 1:
+        return CompiledExpression(source, lambda _: source)
+
+    # odd parts are expressions, even parts literal text
+    pieces = [compile_expression(part).evaluate if index % 2 else part for index, part in enumerate(parts)]
+
+    def render(context: ExpressionContext) -> str:
+        return "".join(piece if isinstance(piece, str) else _text(piece(context)) for piece in pieces)
+
+    return CompiledExpression(source, render)
+
+
+def compile_value(value: Any) -> Evaluator:
+    """Compile a value of a specification: strings are compiled templates, other values are constants.
+
+    A string that does not compile, e.g. a price like `$5`, is not a runtime expression and is a
+    constant too, as in request bodies.
+
+    Args:
+        value (Any): value, e.g. the value of a parameter or of an output
+
+    Returns:
+        Evaluator: closure evaluating the value against a context
+    """
+    if isinstance(value, str):
+        try:
+            return compile_template(value).evaluate
+        except ExpressionError:
+            pass
+    return lambda _: value
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def evaluate(value: Any, context: ExpressionContext) -> Any:
+    """Evaluate a value of a specification: strings are compiled templates, other values are returned as is.
+
+    Args:
+        value (Any): value, e.g. the value of a parameter or of an output
+        context (ExpressionContext): values the expressions are evaluated against
+
+    Returns:
+        Any: the evaluated value
+    """
+    return compile_value(value)(context)
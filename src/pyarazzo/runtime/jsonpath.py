@@ -0,0 +1,330 @@
+"""JSONPath expressions.
+
+A subset of JSONPath (draft-goessner-dispatch-jsonpath-00, with the filter functions of RFC 9535):
+the root `$`, member names (`.name`, `['name']`), wildcards (`*`), array indexes and slices
+(`[0]`, `[-1]`, `[1:3]`), unions (`[0,2]`), recursive descent (`..name`) and filters
+(`[?(@.price < 10 && @.tags)]`). Paths are compiled once into a list of selectors and cached by
+source text, so evaluating a path never parses it again.
+"""
+
+import functools
+import re
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
+from pyarazzo.config import EXPRESSION_CACHE_SIZE
+from pyarazzo.exceptions import ExpressionError
+from pyarazzo.runtime.condition import Evaluator, compile_condition, truthy
+
+# member name of the dot notation
+NAME_PATTERN = re.compile(r"[\w\-]+")
+INDEX_PATTERN = re.compile(r"-?\d+")
+SLICE_PATTERN = re.compile(r"(-?\d+)?:(-?\d+)?(?::(-?\d+)?)?")
+
+# selects the children of a node, given the node and the root of the document
+Selector = Callable[[Any, Any], Iterable[Any]]
+
+
+def _is_array(node: Any) -> bool:
+    return isinstance(node, Sequence) and not isinstance(node, str | bytes)
+
+
+def _children(node: Any) -> Iterable[Any]:
+    if isinstance(node, Mapping):
+        return node.values()
+    if _is_array(node):
+        return node
+    return ()
+
+
+def _descendants(node: Any) -> Iterator[Any]:
+    # the node itself, then its descendants in document order
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        children = list(_children(current))
+        stack.extend(reversed(children))
+
+
+class _NameSelector:
+    """Selector of a member, paths made of member names only are evaluated without selectors."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __call__(self, node: Any, _root: Any) -> Iterable[Any]:
+        if isinstance(node, Mapping) and self.name in node:
+            return (node[self.name],)
+        return ()
+
+
+def _index_selector(index: int) -> Selector:
+    def select(node: Any, _root: Any) -> Iterable[Any]:
+        if _is_array(node) and -len(node) <= index < len(node):
+            return (node[index],)
+        return ()
+
+    return select
+
+
+def _slice_selector(start: int | None, end: int | None, step: int | None) -> Selector:
+    if step == 0:
+        raise ExpressionError("JSONPath slice step cannot be 0")
+    items = slice(start, end, step)
+
+    def select(node: Any, _root: Any) -> Iterable[Any]:
+        return node[items] if _is_array(node) else ()
+
+    return select
+
+
+def _wildcard_selector(node: Any, _root: Any) -> Iterable[Any]:
+    return _children(node)
+
+
+def _filter_selector(condition: Evaluator) -> Selector:
+    def select(node: Any, root: Any) -> Iterable[Any]:
+        return [child for child in _children(node) if truthy(condition((child, root)))]
+
+    return select
+
+
+def _union_selector(selectors: list[Selector]) -> Selector:
+    def select(node: Any, root: Any) -> Iterable[Any]:
+        return [child for selector in selectors for child in selector(node, root)]
+
+    return select
+
+
+def _descendant_selector(selector: Selector) -> Selector:
+    def select(node: Any, root: Any) -> Iterable[Any]:
+        return [child for descendant in _descendants(node) for child in selector(descendant, root)]
+
+    return select
+
+
+def _length(value: Any) -> int | None:
+    return len(value) if isinstance(value, str | Mapping) or _is_array(value) else None
+
+
+def _count(value: Any) -> int:
+    if value is None:
+        return 0
+    return len(value) if _is_array(value) else 1
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _regex(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
+FILTER_FUNCTIONS: dict[str, Callable[..., Any]] = {
+    "length": _length,
+    "count": _count,
+    "match": lambda value, pattern: isinstance(value, str) and _regex(pattern).fullmatch(value) is not None,
+    "search": lambda value, pattern: isinstance(value, str) and _regex(pattern).search(value) is not None,
+}
+
+
+class JsonPath:
+    """Compiled JSONPath expression."""
+
+    __slots__ = ("names", "selectors", "source")
+
+    def __init__(self, source: str, selectors: list[Selector]) -> None:
+        """Constructor.
+
+        Args:
+            source (str): source text
+            selectors (list[Selector]): selectors applied in turn from the root
+        """
+        self.source = source
+        self.selectors = selectors
+        # singular path of member names, e.g. `@.owner.name`
+        self.names = (
+            tuple(selector.name for selector in selectors if isinstance(selector, _NameSelector))
+            if all(isinstance(selector, _NameSelector) for selector in selectors)
+            else None
+        )
+
+    def _member(self, node: Any) -> tuple[bool, Any]:
+        for name in self.names or ():
+            if not isinstance(node, Mapping) or name not in node:
+                return False, None
+            node = node[name]
+        return True, node
+
+    def find(self, document: Any, root: Any = None) -> list[Any]:
+        """Return the values selected in a document.
+
+        Args:
+            document (Any): parsed JSON document, or node a relative path (`@...`) starts from
+            root (Any): root of the document when `document` is one of its nodes
+
+        Returns:
+            list[Any]: selected values, in document order
+        """
+        if self.names is not None:
+            found, value = self._member(document)
+            return [value] if found else []
+        root = document if root is None else root
+        nodes = [document]
+        for selector in self.selectors:
+            nodes = [child for node in nodes for child in selector(node, root)]
+            if not nodes:
+                break
+        return nodes
+
+    def first(self, document: Any, root: Any = None) -> Any:
+        """Return the first value selected in a document.
+
+        Args:
+            document (Any): parsed JSON document
+            root (Any): root of the document when `document` is one of its nodes
+
+        Returns:
+            Any: first selected value, None when nothing is selected
+        """
+        if self.names is not None:
+            return self._member(document)[1]
+        nodes = self.find(document, root)
+        return nodes[0] if nodes else None
+
+    def find_many(self, documents: Iterable[Any]) -> list[list[Any]]:
+        """Evaluate the expression against many documents.
+
+        Args:
+            documents (Iterable[Any]): parsed JSON documents
+
+        Returns:
+            list[list[Any]]: for each document, the selected values
+        """
+        find = self.find
+        return [find(document) for document in documents]
+
+    def __repr__(self) -> str:
+        return f"JsonPath({self.source!r})"
+
+
+def _filter_operand(source: str) -> Evaluator:
+    path = compile_jsonpath(source)
+    if source.startswith("@"):
+        return lambda scope: path.first(scope[0], scope[1])
+    return lambda scope: path.first(scope[1])
+
+
+class _PathParser:
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.position = 1
+
+    def _error(self) -> ExpressionError:
+        return ExpressionError(f"Invalid JSONPath {self.source!r} at position {self.position}")
+
+    def parse(self) -> list[Selector]:
+        if not self.source.startswith(("$", "@")):
+            raise ExpressionError(f"JSONPath must start with $ or @: {self.source!r}")
+        selectors: list[Selector] = []
+        while self.position < len(self.source):
+            if self.source.startswith("..", self.position):
+                self.position += 2
+                selector = self._bracket() if self.source.startswith("[", self.position) else self._member()
+                selectors.append(_descendant_selector(selector))
+            elif self.source.startswith(".", self.position):
+                self.position += 1
+                selectors.append(self._member())
+            elif self.source.startswith("[", self.position):
+                selectors.append(self._bracket())
+            else:
+                raise self._error()
+        return selectors
+
+    def _member(self) -> Selector:
+        if self.source.startswith("*", self.position):
+            self.position += 1
+            return _wildcard_selector
+        name = NAME_PATTERN.match(self.source, self.position)
+        if name is None:
+            raise self._error()
+        self.position = name.end()
+        return _NameSelector(name.group())
+
+    def _bracket(self) -> Selector:
+        end = self._closing_bracket()
+        content = self.source[self.position + 1 : end].strip()
+        self.position = end + 1
+        if content.startswith("?"):
+            return _filter_selector(compile_condition(content[1:], _filter_operand, FILTER_FUNCTIONS))
+        selectors = [self._selector(part.strip()) for part in self._split_union(content)]
+        return selectors[0] if len(selectors) == 1 else _union_selector(selectors)
+
+    def _closing_bracket(self) -> int:
+        depth = 0
+        quote = ""
+        position = self.position
+        while position < len(self.source):
+            char = self.source[position]
+            if quote:
+                if char == "\\":
+                    position += 1
+                elif char == quote:
+                    quote = ""
+            elif char in "'\"":
+                quote = char
+            elif char == "[":
+                depth += 1
+            elif char == "]":
+                depth -= 1
+                if depth == 0:
+                    return position
+            position += 1
+        raise self._error()
+
+    def _split_union(self, content: str) -> list[str]:
+        parts = []
+        quote = ""
+        start = 0
+        for position, char in enumerate(content):
+            if quote:
+                if char == quote and content[position - 1] != "\\":
+                    quote = ""
+            elif char in "'\"":
+                quote = char
+            elif char == ",":
+                parts.append(content[start:position])
+                start = position + 1
+        parts.append(content[start:])
+        return parts
+
+    def _selector(self, part: str) -> Selector:
+        if part == "*":
+            return _wildcard_selector
+        if len(part) > 1 and part[0] == part[-1] and part[0] in "'\"":
+            return _NameSelector(re.sub(r"\\(.)", r"\1", part[1:-1]))
+        if INDEX_PATTERN.fullmatch(part):
+            return _index_selector(int(part))
+        bounds = SLICE_PATTERN.fullmatch(part)
+        if bounds is not None:
+            start, end, step = (int(bound) if bound else None for bound in bounds.groups())
+            return _slice_selector(start, end, step)
+        raise self._error()
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_jsonpath(source: str) -> JsonPath:
+    """Compile a JSONPath expression, compiled expressions are cached by source text.
+
+    Args:
+        source (str): JSONPath expression, e.g. `$.pets[?(@.status == 'available')].id`
+
+    Raises:
+        ExpressionError: when the expression is malformed
+
+    Returns:
+        JsonPath: the compiled expression
+    """
+    source = source.strip()
+    return JsonPath(source, _PathParser(source).parse())
@@ -0,0 +1,73 @@
+"""Path expressions of criteria.
+
+The `jsonpath` and `xpath` condition types of criteria select values in the body of a response.
+A Criterion Expression Type Object names the version of the expression language (JSONPath
+`draft-goessner-dispatch-jsonpath-00`, XPath `xpath-10`, `xpath-20`, `xpath-30`); expressions are
+compiled once and cached by (type, version, text), and a compiled expression evaluates many
+documents with `find_many`.
+"""
+
+import functools
+
+from pyarazzo.config import EXPRESSION_CACHE_SIZE
+from pyarazzo.exceptions import ExpressionError
+from pyarazzo.model.arazzo import CriterionExpressionTypeObjectType, CriterionExpressionTypeObjectVersion
+from pyarazzo.runtime.jsonpath import JsonPath, compile_jsonpath
+from pyarazzo.runtime.xpath import XPath, compile_xpath
+
+# version of each expression language, when a criterion gives its type as a plain string
+DEFAULT_VERSIONS = {
+    CriterionExpressionTypeObjectType.jsonpath: CriterionExpressionTypeObjectVersion.JSONPATH,
+    CriterionExpressionTypeObjectType.xpath: CriterionExpressionTypeObjectVersion.XPATH30,
+}
+# versions of each expression language
+VERSIONS = {
+    CriterionExpressionTypeObjectType.jsonpath: frozenset({CriterionExpressionTypeObjectVersion.JSONPATH}),
+    CriterionExpressionTypeObjectType.xpath: frozenset(
+        {
+            CriterionExpressionTypeObjectVersion.XPATH10,
+            CriterionExpressionTypeObjectVersion.XPATH20,
+            CriterionExpressionTypeObjectVersion.XPATH30,
+        },
+    ),
+}
+
+
+def compile_path(
+    type_: CriterionExpressionTypeObjectType | str,
+    source: str,
+    version: CriterionExpressionTypeObjectVersion | str | None = None,
+) -> JsonPath | XPath:
+    """Compile a path expression, compiled expressions are cached by (type, version, text).
+
+    Args:
+        type_ (CriterionExpressionTypeObjectType | str): expression language, `jsonpath` or `xpath`
+        source (str): expression, e.g. `$.pets[0].id` or `/pets/pet[1]/@id`
+        version (CriterionExpressionTypeObjectVersion | str | None): version of the language, the latest by default
+
+    Raises:
+        ExpressionError: when the language or the version is unknown, or the expression is malformed
+
+    Returns:
+        JsonPath | XPath: the compiled expression
+    """
+    try:
+        type_ = CriterionExpressionTypeObjectType(type_)
+        version = DEFAULT_VERSIONS[type_] if version is None else CriterionExpressionTypeObjectVersion(version)
+    except ValueError as e:
+        raise ExpressionError(f"Unknown expression type {type_} version {version}") from e
+    if version not in VERSIONS[type_]:
+        raise ExpressionError(f"Version {version.value} is not a version of {type_.value} expressions")
+    return _compile(type_, version, source)
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _compile(
+    type_: CriterionExpressionTypeObjectType,
+    _version: CriterionExpressionTypeObjectVersion,
+    source: str,
+) -> JsonPath | XPath:
+    # the supported subsets of the versions of a language are the same
+    if type_ == CriterionExpressionTypeObjectType.jsonpath:
+        return compile_jsonpath(source)
+    return compile_xpath(source)
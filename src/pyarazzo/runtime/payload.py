@@ -0,0 +1,318 @@
+"""Request bodies of steps.
+
+The payload of a Request Body Object is a template: its runtime expressions (`$inputs.pet`,
+`{$inputs.name}`) and its replacements (a JSON Pointer or an XPath target, and a value) give a
+concrete body for each execution of the step. A request body is compiled once per step: the
+targets are parsed and checked against the payload, and each body is then built by copy-on-write,
+copying only the containers (objects, arrays, elements) on the way to a replaced value and sharing
+everything else with the payload. The payload itself is never modified nor deep-copied.
+"""
+
+import copy
+import json
+import re
+import xml.etree.ElementTree as ET
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any
+
+from pyarazzo.exceptions import ExpressionError
+from pyarazzo.model.arazzo import PayloadReplacementObject, RequestBodyObject
+from pyarazzo.runtime.expression import (
+    EMBEDDED_EXPRESSION_PATTERN,
+    ExpressionContext,
+    compile_template,
+    compile_value,
+    parse_json_pointer,
+)
+from pyarazzo.runtime.xpath import compile_xpath, parse_xml
+
+# last step of an XPath target setting an attribute or the text of the selected elements
+XPATH_VALUE_STEP_PATTERN = re.compile(r"(?P<path>.*?)/(?:@(?P<attribute>[\w\-.:]+)|(?P<text>text\(\s*\)))")
+
+# reference token of the item after the last one of an array, appended by a replacement
+NEW_ITEM_TOKEN = "-"  # noqa: S105
+
+ValueEvaluator = Callable[[ExpressionContext], Any]
+
+
+def _template(value: str) -> ValueEvaluator | None:
+    # evaluator of a string of the payload holding runtime expressions, None for plain text
+    if not value.startswith("$") and EMBEDDED_EXPRESSION_PATTERN.search(value) is None:
+        return None
+    try:
+        return compile_template(value).evaluate
+    except ExpressionError:
+        # not a runtime expression, e.g. a price like `$5`, left as is
+        return None
+
+
+def _is_xml(payload: Any, content_type: str | None) -> bool:
+    if not isinstance(payload, str):
+        return False
+    if content_type:
+        return "xml" in content_type.lower()
+    return payload.lstrip().startswith("<")
+
+
+class CompiledPayload:
+    """Request body ready to be built for many executions of a step."""
+
+    __slots__ = ("_build", "content_type", "payload")
+
+    def __init__(self, payload: Any, content_type: str | None, build: Callable[[ExpressionContext], Any]) -> None:
+        """Constructor.
+
+        Args:
+            payload (Any): payload of the request body, shared by every body built
+            content_type (str | None): Content-Type of the request body
+            build (Callable[[ExpressionContext], Any]): closure building a body
+        """
+        self.payload = payload
+        self.content_type = content_type
+        self._build = build
+
+    def build(self, context: ExpressionContext) -> Any:
+        """Build the body of a request.
+
+        Args:
+            context (ExpressionContext): values the runtime expressions are evaluated against
+
+        Raises:
+            ExpressionError: when a replacement cannot be applied to the value of an earlier one
+
+        Returns:
+            Any: the body, a JSON value sharing the unchanged parts of the payload, or an XML document as a string
+        """
+        return self._build(context)
+
+    def build_many(self, contexts: Iterable[ExpressionContext]) -> list[Any]:
+        """Build the bodies of many requests.
+
+        Args:
+            contexts (Iterable[ExpressionContext]): for each request, values the runtime expressions are evaluated against
+
+        Returns:
+            list[Any]: the bodies
+        """
+        build = self._build
+        return [build(context) for context in contexts]
+
+    def __repr__(self) -> str:
+        return f"CompiledPayload({self.content_type})"
+
+
+# JSON payloads
+
+
+def _replace(node: Any, tokens: tuple[str, ...], depth: int, value: Any, copies: dict[int, Any]) -> Any:
+    # `node` with the value at `tokens[depth:]` replaced, copying the containers on the way once per body:
+    # `copies` holds the containers already copied for the body, by identity
+    if depth == len(tokens):
+        return value
+    token = tokens[depth]
+    if isinstance(node, dict):
+        container = node if id(node) in copies else dict(node)
+        copies[id(container)] = container
+        container[token] = _replace(container.get(token), tokens, depth + 1, value, copies)
+        return container
+    if isinstance(node, list):
+        items = node if id(node) in copies else list(node)
+        copies[id(items)] = items
+        if token == NEW_ITEM_TOKEN:
+            items.append(_replace(None, tokens, depth + 1, value, copies))
+            return items
+        if not token.isdigit() or int(token) >= len(items):
+            raise ExpressionError(f"Index {token} out of the array at /{'/'.join(tokens[:depth])}")
+        index = int(token)
+        items[index] = _replace(items[index], tokens, depth + 1, value, copies)
+        return items
+    raise ExpressionError(f"No object or array at /{'/'.join(tokens[:depth])} to replace /{'/'.join(tokens)}")
+
+
+def _expressions(node: Any, tokens: tuple[str, ...] = ()) -> Iterator[tuple[tuple[str, ...], ValueEvaluator]]:
+    # pointers and evaluators of the strings of a JSON payload holding runtime expressions
+    if isinstance(node, str):
+        evaluator = _template(node)
+        if evaluator is not None:
+            yield tokens, evaluator
+    elif isinstance(node, dict):
+        for key, child in node.items():
+            yield from _expressions(child, (*tokens, str(key)))
+    elif isinstance(node, list):
+        for index, child in enumerate(node):
+            yield from _expressions(child, (*tokens, str(index)))
+
+
+def _compile_json(payload: Any, replacements: Sequence[PayloadReplacementObject]) -> Callable[[ExpressionContext], Any]:
+    operations = list(_expressions(payload))
+    for replacement in replacements:
+        operations.append((parse_json_pointer(replacement.target), compile_value(replacement.value)))
+
+    # check the targets against the payload, except below the target of an earlier replacement
+    checked: dict[int, Any] = {}
+    replaced: list[tuple[str, ...]] = []
+    document = payload
+    for tokens, _ in operations:
+        if not any(tokens[: len(prefix)] == prefix for prefix in replaced):
+            document = _replace(document, tokens, 0, None, checked)
+        replaced.append(tokens)
+
+    if not operations:
+        return lambda _: payload
+    if len(operations) == 1:
+        (tokens, evaluate), *_ = operations
+        return lambda context: _replace(payload, tokens, 0, evaluate(context), {})
+
+    def build(context: ExpressionContext) -> Any:
+        copies: dict[int, Any] = {}
+        document = payload
+        for tokens, evaluate in operations:
+            document = _replace(document, tokens, 0, evaluate(context), copies)
+        return document
+
+    return build
+
+
+# XML payloads
+
+
+def _text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _element_paths(document: ET.Element) -> dict[int, tuple[int, ...]]:
+    # indexes of the children leading from the document node to each element
+    paths: dict[int, tuple[int, ...]] = {id(document): ()}
+    stack = [document]
+    while stack:
+        element = stack.pop()
+        path = paths[id(element)]
+        for index, child in enumerate(element):
+            paths[id(child)] = (*path, index)
+            stack.append(child)
+    return paths
+
+
+# replacement of an XML payload: path of the element, attribute name or None, whether the value
+# replaces the text of the element only rather than its whole content, value
+XmlOperation = tuple[tuple[int, ...], str | None, bool, ValueEvaluator]
+
+
+def _xml_expressions(document: ET.Element, paths: dict[int, tuple[int, ...]]) -> Iterator[XmlOperation]:
+    # texts and attribute values of an XML payload holding runtime expressions
+    for element in document.iter():
+        path = paths[id(element)]
+        if element.text is not None and (evaluator := _template(element.text)) is not None:
+            yield path, None, True, evaluator
+        for name, value in element.attrib.items():
+            if (evaluator := _template(value)) is not None:
+                yield path, name, False, evaluator
+
+
+def _xml_operations(
+    document: ET.Element,
+    paths: dict[int, tuple[int, ...]],
+    replacement: PayloadReplacementObject,
+) -> Iterator[XmlOperation]:
+    target = replacement.target.strip()
+    value_step = XPATH_VALUE_STEP_PATTERN.fullmatch(target)
+    path = value_step.group("path") if value_step else target
+    attribute = value_step.group("attribute") if value_step else None
+    text = value_step is not None and value_step.group("text") is not None
+    elements = compile_xpath(path).find(document)
+    if not elements:
+        raise ExpressionError(f"Target {target!r} selects nothing in the payload")
+    evaluate = compile_value(replacement.value)
+    for element in elements:
+        if not isinstance(element, ET.Element) or id(element) not in paths:
+            raise ExpressionError(f"Target {target!r} does not select elements, attributes or texts")
+        yield paths[id(element)], attribute, text, evaluate
+
+
+def _compile_xml(payload: str, replacements: Sequence[PayloadReplacementObject]) -> Callable[[ExpressionContext], Any]:
+    # the parsed payload is shared with the XPath cache, and never modified
+    document = parse_xml(payload)
+    paths = _element_paths(document)
+    operations = list(_xml_expressions(document, paths))
+    for replacement in replacements:
+        operations.extend(_xml_operations(document, paths, replacement))
+    if not operations:
+        return lambda _: payload
+
+    def build(context: ExpressionContext) -> str:
+        copies: dict[int, Any] = {}
+        top = copy.copy(document)
+        copies[id(top)] = top
+        for path, attribute, text, evaluate in operations:
+            element = top
+            for index in path:
+                child = element[index]
+                if id(child) not in copies:
+                    child = copy.copy(child)
+                    copies[id(child)] = child
+                    element[index] = child
+                element = child
+            value = _text(evaluate(context))
+            if attribute is not None:
+                element.attrib = {**element.attrib, attribute: value}
+            elif text:
+                # the children of the element are kept
+                element.text = value
+            else:
+                # the text replaces the content of the element
+                del element[:]
+                element.text = value
+        return ET.tostring(top[0], encoding="unicode")
+
+    return build
+
+
+def compile_payload(
+    payload: Any,
+    replacements: Sequence[PayloadReplacementObject] = (),
+    content_type: str | None = None,
+) -> CompiledPayload:
+    """Compile the payload of a request body and its replacements.
+
+    JSON payloads (objects, arrays, and JSON text when there are replacements) take JSON Pointer
+    targets, XML payloads take XPath targets, selecting elements (whose content is replaced), or
+    ending with an attribute (`/@id`) or a text (`/text()`) step.
+
+    Args:
+        payload (Any): payload, which may hold runtime expressions
+        replacements (Sequence[PayloadReplacementObject]): replacements, applied in turn
+        content_type (str | None): Content-Type of the request body, XML payloads are recognized by default
+
+    Raises:
+        ExpressionError: when an expression, a target, or a JSON text is malformed, or a target is not in the payload
+
+    Returns:
+        CompiledPayload: the compiled payload
+    """
+    if _is_xml(payload, content_type):
+        return CompiledPayload(payload, content_type, _compile_xml(payload, replacements))
+    if isinstance(payload, str) and replacements:
+        try:
+            payload = json.loads(payload)
+        except ValueError as e:
+            raise ExpressionError(f"Replacements apply to JSON or XML payloads: {e}") from e
+    return CompiledPayload(payload, content_type, _compile_json(payload, replacements))
+
+
+def compile_request_body(request_body: RequestBodyObject) -> CompiledPayload:
+    """Compile the request body of a step.
+
+    Args:
+        request_body (RequestBodyObject): request body
+
+    Raises:
+        ExpressionError: when the payload or a replacement is malformed
+
+    Returns:
+        CompiledPayload: the compiled request body
+    """
+    return compile_payload(request_body.payload, request_body.replacements, request_body.content_type)
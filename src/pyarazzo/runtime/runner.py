@@ -0,0 +1,670 @@
+"""Execution of workflows.
+
+A `WorkflowRunner` executes the workflows of an Arazzo specification step by step. Each step is
+compiled once into a `StepPlan`: its operation is resolved through the `OperationRegistry` of the
+source descriptions, and its parameters, request body, success criteria, actions and outputs are
+compiled. A plan is then executed as many times as the goto and retry actions require, sending its
+requests on the shared keep-alive HTTP client (see `pyarazzo.http_client`).
+
+With `parallel_steps`, the consecutive steps without actions run concurrently when they do not
+reference each other's outputs, see `pyarazzo.runtime.dataflow`.
+
+A step succeeds when all its success criteria are satisfied, or, without criteria, when the
+status code of the response is 2xx. The first action whose criteria are satisfied is then taken:
+`end` ends the workflow, `goto` transfers to a step or to another workflow, and `retry` executes
+the failed step again. A successful step without action is followed by the next step; a failed
+step without action fails the workflow. A workflow run again by a step or an action of its own run,
+directly or through other workflows, is a cycle that would never end and raises a `SpecificationError`.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable, Mapping, MutableMapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
+from urllib.parse import quote, urljoin
+
+import httpx
+
+from pyarazzo.config import RUN_DEFAULT_RETRY_LIMIT, RUN_MAX_CONCURRENT_STEPS, RUN_MAX_STEP_EXECUTIONS
+from pyarazzo.exceptions import ExecutionError, LoadError, SpecificationError
+from pyarazzo.http_client import get_http_client
+from pyarazzo.model.arazzo import (
+    ArazzoSpecification,
+    FailureActionObject,
+    FailureActionObjectType,
+    RequestBodyObject,
+    SourceType,
+    Step,
+    SuccessActionObject,
+    SuccessActionObjectType,
+    Workflow,
+)
+from pyarazzo.model.openapi import (
+    OPERATION_PATH_PATTERN,
+    QUALIFIED_OPERATION_ID_PATTERN,
+    OpenApiLoader,
+    OperationRecord,
+    OperationRegistry,
+)
+from pyarazzo.runtime.criteria import CompiledCriteria
+from pyarazzo.runtime.dataflow import StepGraph
+from pyarazzo.runtime.expression import Evaluator, ExpressionContext, compile_value
+from pyarazzo.runtime.payload import CompiledPayload, compile_request_body
+
+LOGGER = logging.getLogger(__name__)
+
+# `{name}` of a path template
+PATH_PARAMETER_PATTERN = re.compile(r"\{([^{}]+)\}")
+# location of the parameters of an operation step without `in` nor declaration in the operation
+DEFAULT_PARAMETER_LOCATION = "query"
+
+
+@dataclass
+class StepResult:
+    """Outcome of an execution of a step."""
+
+    step_id: str
+    """Id of the step."""
+    success: bool
+    """Whether the step succeeded."""
+    status_code: int | None = None
+    """Status code of the response, None for workflow steps and failed requests."""
+    outputs: dict[str, Any] = field(default_factory=dict)
+    """Outputs of the step, when it succeeded."""
+    attempt: int = 1
+    """Attempt number, greater than 1 for the executions of retry actions."""
+    elapsed: float = 0.0
+    """Duration of the execution, in seconds."""
+    error: str | None = None
+    """Reason of the failure of the step, if any."""
+
+
+@dataclass
+class WorkflowResult:
+    """Outcome of a run of a workflow."""
+
+    workflow_id: str
+    """Id of the workflow."""
+    success: bool
+    """Whether the workflow succeeded."""
+    inputs: dict[str, Any] = field(default_factory=dict)
+    """Inputs of the workflow, defaults included."""
+    outputs: dict[str, Any] = field(default_factory=dict)
+    """Outputs of the workflow, when it succeeded."""
+    steps: list[StepResult] = field(default_factory=list)
+    """Executions of the steps, in order."""
+    error: str | None = None
+    """Reason of the failure, if any."""
+    elapsed: float = 0.0
+    """Duration of the run, in seconds."""
+
+
+class CompiledAction(NamedTuple):
+    """Success or failure action, with its compiled criteria."""
+
+    action: SuccessActionObject | FailureActionObject
+    criteria: CompiledCriteria
+
+
+class StepPlan:
+    """Step compiled for execution."""
+
+    __slots__ = (
+        "base_url",
+        "body",
+        "criteria",
+        "method",
+        "on_failure",
+        "on_success",
+        "operation",
+        "outputs",
+        "parameters",
+        "path",
+        "step_id",
+        "workflow_id",
+    )
+
+    def __init__(
+        self,
+        step_id: str,
+        parameters: list[tuple[str, str, Evaluator]],
+        criteria: CompiledCriteria,
+        *,
+        on_success: list[CompiledAction],
+        on_failure: list[CompiledAction],
+        outputs: dict[str, Evaluator],
+        operation: OperationRecord | None = None,
+        base_url: str = "",
+        body: CompiledPayload | None = None,
+        workflow_id: str | None = None,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            step_id (str): id of the step
+            parameters (list[tuple[str, str, Evaluator]]): name, location and value of each parameter
+            criteria (CompiledCriteria): success criteria
+            on_success (list[CompiledAction]): success actions, in order
+            on_failure (list[CompiledAction]): failure actions, in order
+            outputs (dict[str, Evaluator]): outputs of the step
+            operation (OperationRecord | None): operation called by the step
+            base_url (str): url of the server of the operation
+            body (CompiledPayload | None): request body
+            workflow_id (str | None): workflow called by the step, instead of an operation
+        """
+        self.step_id = step_id
+        self.parameters = parameters
+        self.criteria = criteria
+        self.on_success = on_success
+        self.on_failure = on_failure
+        self.outputs = outputs
+        self.operation = operation
+        self.base_url = base_url.rstrip("/")
+        self.body = body
+        self.workflow_id = workflow_id
+        self.method = operation.method.value.upper() if operation is not None and operation.method else "GET"
+        self.path = PATH_PARAMETER_PATTERN.split(operation.path) if operation is not None else []
+
+    def url(self, path_parameters: Mapping[str, Any]) -> str:
+        """Return the url of a request, given the values of the path parameters.
+
+        Args:
+            path_parameters (Mapping[str, Any]): values of the path parameters, by name
+
+        Raises:
+            ExecutionError: when a parameter of the path template has no value
+
+        Returns:
+            str: url of the request
+        """
+        # odd pieces of the path template are parameter names
+        missing = [name for name in self.path[1::2] if path_parameters.get(name) is None]
+        if missing:
+            path = self.operation.path if self.operation is not None else ""
+            raise ExecutionError(f"No value for the path parameters {', '.join(missing)} of {path}")
+        return self.base_url + "".join(
+            quote(str(path_parameters[piece]), safe="") if index % 2 else piece for index, piece in enumerate(self.path)
+        )
+
+    def action(self, actions: list[CompiledAction], context: ExpressionContext) -> Any:
+        """Return the first action whose criteria are satisfied.
+
+        Args:
+            actions (list[CompiledAction]): success or failure actions of the step
+            context (ExpressionContext): context of the execution of the step
+
+        Returns:
+            SuccessActionObject | FailureActionObject | None: the action, None when no action applies
+        """
+        return next((action.action for action in actions if action.criteria(context)), None)
+
+    def __repr__(self) -> str:
+        target = self.workflow_id or f"{self.method} {self.operation.path if self.operation else ''}"
+        return f"StepPlan({self.step_id}: {target})"
+
+
+def _response_body(response: httpx.Response) -> Any:
+    if not response.content:
+        return None
+    if "json" in response.headers.get("Content-Type", ""):
+        try:
+            return response.json()
+        except ValueError:
+            return response.text
+    return response.text
+
+
+def _default_inputs(workflow: Workflow) -> dict[str, Any]:
+    # defaults of the properties of the JSON Schema of the inputs
+    schema = workflow.inputs if isinstance(workflow.inputs, dict) else {}
+    properties = schema.get("properties")
+    if not isinstance(properties, dict):
+        return {}
+    return {
+        name: definition["default"]
+        for name, definition in properties.items()
+        if isinstance(definition, dict) and "default" in definition
+    }
+
+
+class WorkflowRunner:
+    """Runner of the workflows of a specification."""
+
+    def __init__(
+        self,
+        specification: ArazzoSpecification,
+        *,
+        registry: OperationRegistry | None = None,
+        servers: Mapping[str, str] | None = None,
+        client: httpx.Client | None = None,
+        request_limit: threading.Semaphore | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        parallel_steps: bool = False,
+        max_steps: int = RUN_MAX_CONCURRENT_STEPS,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            specification (ArazzoSpecification): the specification
+            registry (OperationRegistry | None): operations of the source descriptions, loaded on first use by default
+            servers (Mapping[str, str] | None): url of the server of each source description, by name,
+                the first server of the OpenAPI description by default
+            client (httpx.Client | None): HTTP client, the shared keep-alive client by default
+            request_limit (threading.Semaphore | None): bounds the requests in flight across threads
+            sleep (Callable[[float], None]): waits before retrying a step
+            parallel_steps (bool): run the consecutive steps without actions concurrently, along their data flow
+            max_steps (int): maximum number of steps of a workflow run concurrently
+        """
+        self.specification = specification
+        self.servers = dict(servers or {})
+        self.client = client
+        self.request_limit = request_limit
+        self._registry = registry
+        self._sleep = sleep
+        self.parallel_steps = parallel_steps
+        self.max_steps = max_steps
+        self._step_graphs: dict[str, StepGraph] = {}
+        self._plans: dict[tuple[str, str], StepPlan] = {}
+        self._source_descriptions: dict[str, Any] | None = None
+        self._components: dict[str, Any] | None = None
+        # workflows may be run by several threads, the registry is loaded by one of them
+        self._registry_lock = threading.Lock()
+
+    @property
+    def registry(self) -> OperationRegistry:
+        """Operations of the OpenAPI source descriptions, loaded on first access."""
+        with self._registry_lock:
+            if self._registry is None:
+                sources = [
+                    source for source in self.specification.source_descriptions if source.type == SourceType.openapi
+                ]
+                registry = OperationRegistry(operations={})
+                registry.extend([source.url for source in sources], sources=[source.name for source in sources])
+                self._registry = registry
+        return self._registry
+
+    def _base_url(self, source_name: str) -> str:
+        if source_name in self.servers:
+            return self.servers[source_name]
+        source = next(source for source in self.specification.source_descriptions if source.name == source_name)
+        location, content, fmt = OpenApiLoader.read(source.url)
+        servers = OpenApiLoader.parse(location, content, fmt).get("servers") or []
+        if not servers or not isinstance(servers[0], dict) or "url" not in servers[0]:
+            raise ExecutionError(f"No server url for source description {source_name}, give it with --server")
+        server = servers[0]
+        url = PATH_PARAMETER_PATTERN.sub(
+            lambda match: str(server.get("variables", {}).get(match[1], {}).get("default", "")),
+            server["url"],
+        )
+        if not urljoin(location, url).startswith(("http://", "https://")):
+            raise ExecutionError(f"Server url {url} of source description {source_name} is not absolute")
+        self.servers[source_name] = urljoin(location, url)
+        return self.servers[source_name]
+
+    def _source_of(self, step: Step) -> str:
+        operation_id, operation_path = step.operation_id, step.operation_path
+        if operation_path is not None and (match := OPERATION_PATH_PATTERN.match(operation_path)):
+            return match["source"]
+        if operation_id is not None and (match := QUALIFIED_OPERATION_ID_PATTERN.match(operation_id)):
+            return match["source"]
+        sources = [source for source in self.specification.source_descriptions if source.type == SourceType.openapi]
+        for source in sources:
+            if len(sources) == 1:
+                return source.name
+            if operation_id is not None and self.registry.get(operation_id, source=source.name) is not None:
+                return source.name
+            if operation_path is not None and operation_path.partition("#")[0] == source.url:
+                return source.name
+        raise SpecificationError(f"Unable to find the source description of operation {operation_id or operation_path}")
+
+    def plan(self, workflow_id: str, step: Step) -> StepPlan:
+        """Compile a step, compiled steps are kept for the later executions.
+
+        Args:
+            workflow_id (str): id of the workflow of the step
+            step (Step): the step
+
+        Raises:
+            SpecificationError: when the operation cannot be resolved, or an expression is malformed
+            ExecutionError: when the url of the server of the operation is unknown
+
+        Returns:
+            StepPlan: the compiled step
+        """
+        step_id = str(step.step_id)
+        plan = self._plans.get((workflow_id, step_id))
+        if plan is not None:
+            return plan
+
+        references = self.specification.component_table.for_step(workflow_id, step_id)
+        operation = None
+        base_url = ""
+        if step.workflow_id is None:
+            operation = self.registry.resolve(operation_id=step.operation_id, operation_path=step.operation_path)
+            try:
+                base_url = self._base_url(self._source_of(step))
+            except LoadError as e:
+                raise ExecutionError(f"Step {step_id} of workflow {workflow_id}: {e}") from e
+        locations: dict[str, str] = operation.parameters if operation is not None else {}
+        parameters = [
+            (
+                parameter.name,
+                parameter.in_.value
+                if parameter.in_ is not None
+                else locations.get(parameter.name, DEFAULT_PARAMETER_LOCATION),
+                compile_value(parameter.value),
+            )
+            for parameter in references.parameters
+        ]
+        plan = StepPlan(
+            step_id,
+            parameters,
+            CompiledCriteria(step.success_criteria or []),
+            on_success=[
+                CompiledAction(action, CompiledCriteria(action.criteria or [])) for action in references.success_actions
+            ],
+            on_failure=[
+                CompiledAction(action, CompiledCriteria(action.criteria or [])) for action in references.failure_actions
+            ],
+            outputs={name: compile_value(value) for name, value in (step.outputs or {}).items()},
+            operation=operation,
+            base_url=base_url,
+            body=compile_request_body(step.request_body) if isinstance(step.request_body, RequestBodyObject) else None,
+            workflow_id=str(step.workflow_id) if step.workflow_id is not None else None,
+        )
+        self._plans[(workflow_id, step_id)] = plan
+        return plan
+
+    def step_graph(self, workflow: Workflow) -> StepGraph:
+        """Analyse the data flow of the steps of a workflow, analysed workflows are kept for the later runs.
+
+        Args:
+            workflow (Workflow): the workflow
+
+        Returns:
+            StepGraph: data dependencies and control flow of the steps
+        """
+        workflow_id = str(workflow.workflow_id)
+        graph = self._step_graphs.get(workflow_id)
+        if graph is None:
+            graph = self._step_graphs[workflow_id] = StepGraph.from_workflow(
+                workflow,
+                self.specification.component_table,
+            )
+        return graph
+
+    def _context(
+        self,
+        inputs: Mapping[str, Any],
+        steps: Mapping[str, Any],
+        workflows: Mapping[str, Any],
+    ) -> ExpressionContext:
+        if self._source_descriptions is None:
+            self._source_descriptions = {
+                source.name: source.model_dump(mode="json", by_alias=True, exclude_none=True)
+                for source in self.specification.source_descriptions
+            }
+        if self._components is None:
+            components = self.specification.components
+            self._components = (
+                components.model_dump(mode="json", by_alias=True, exclude_none=True) if components is not None else {}
+            )
+        return ExpressionContext(
+            inputs=inputs,
+            steps=steps,
+            workflows=workflows,
+            source_descriptions=self._source_descriptions,
+            components=self._components,
+        )
+
+    def _send(self, plan: StepPlan, context: ExpressionContext) -> httpx.Response:
+        path: dict[str, Any] = {}
+        query: dict[str, Any] = {}
+        headers: dict[str, str] = {}
+        cookies: list[str] = []
+        for name, location, evaluate in plan.parameters:
+            value = evaluate(context)
+            if value is None:
+                continue
+            if location == "path":
+                path[name] = value
+            elif location == "header":
+                headers[name] = str(value)
+            elif location == "cookie":
+                cookies.append(f"{name}={value}")
+            else:
+                query[name] = value
+        if cookies:
+            headers["Cookie"] = "; ".join(cookies)
+
+        content: dict[str, Any] = {}
+        body = plan.body.build(context) if plan.body is not None else None
+        if plan.body is not None and body is not None:
+            content_type = plan.body.content_type or ""
+            if content_type:
+                headers.setdefault("Content-Type", content_type)
+            if isinstance(body, str | bytes):
+                content["content"] = body
+            elif "form" in content_type and isinstance(body, dict):
+                content["data"] = body
+            else:
+                content["json"] = body
+
+        context.url = plan.url(path)
+        context.method = plan.method
+        context.request_path = path
+        context.request_query = query
+        context.request_headers = headers
+        context.request_body = body
+        client = self.client or get_http_client()
+        LOGGER.debug(f"{plan.method} {context.url}")
+        if self.request_limit is None:
+            return client.request(plan.method, context.url, params=query, headers=headers, **content)
+        with self.request_limit:
+            return client.request(plan.method, context.url, params=query, headers=headers, **content)
+
+    def execute(
+        self,
+        plan: StepPlan,
+        context: ExpressionContext,
+        workflows: MutableMapping[str, Any],
+        *,
+        callers: tuple[str, ...] = (),
+    ) -> StepResult:
+        """Execute a step once.
+
+        Args:
+            plan (StepPlan): the compiled step
+            context (ExpressionContext): context of the workflow, completed with the request and the response
+            workflows (MutableMapping[str, Any]): inputs and outputs of the workflows already run, by id
+            callers (tuple[str, ...]): ids of the workflows in progress, the workflow of the step last
+
+        Raises:
+            SpecificationError: when the step calls a workflow in progress
+
+        Returns:
+            StepResult: outcome of the execution
+        """
+        start = time.perf_counter()
+        if plan.workflow_id is not None:
+            inputs = {name: evaluate(context) for name, _, evaluate in plan.parameters}
+            called = self.run(plan.workflow_id, inputs, workflows=workflows, callers=callers)
+            context.outputs = called.outputs
+            success = called.success and plan.criteria(context)
+            error = called.error
+        else:
+            try:
+                response = self._send(plan, context)
+            except (httpx.HTTPError, ExecutionError) as e:
+                return StepResult(plan.step_id, success=False, elapsed=time.perf_counter() - start, error=str(e))
+            context.status_code = response.status_code
+            context.response_headers = response.headers
+            context.response_body = _response_body(response)
+            success = plan.criteria(context) if len(plan.criteria) else response.is_success
+            error = None if success else f"Status {response.status_code}, unsatisfied criteria"
+        outputs = {name: evaluate(context) for name, evaluate in plan.outputs.items()} if success else {}
+        return StepResult(
+            plan.step_id,
+            success=success,
+            status_code=context.status_code,
+            outputs=outputs,
+            elapsed=time.perf_counter() - start,
+            error=error,
+        )
+
+    def _execute_batch(
+        self,
+        plans: Mapping[int, StepPlan],
+        predecessors: Mapping[int, list[int]],
+        inputs: Mapping[str, Any],
+        step_outputs: dict[str, Any],
+        workflows: MutableMapping[str, Any],
+        *,
+        callers: tuple[str, ...],
+    ) -> list[StepResult]:
+        # execute steps without actions concurrently, each one once its predecessors succeeded;
+        # after a failure, no step is started and the steps already running complete
+        results: dict[int, StepResult] = {}
+        running: dict[Future[StepResult], int] = {}
+        failed = False
+        with ThreadPoolExecutor(max_workers=min(len(plans), self.max_steps)) as executor:
+            while True:
+                started = set(running.values())
+                for position, plan in plans.items():
+                    if failed:
+                        break
+                    if position in results or position in started:
+                        continue
+                    if all(before in results for before in predecessors[position]):
+                        context = self._context(inputs, step_outputs, workflows)
+                        running[executor.submit(self.execute, plan, context, workflows, callers=callers)] = position
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    position = running.pop(future)
+                    step = results[position] = future.result()
+                    if step.success:
+                        step_outputs[step.step_id] = {"outputs": step.outputs}
+                    else:
+                        failed = True
+        return [results[position] for position in sorted(results)]
+
+    def run(
+        self,
+        workflow_id: str,
+        inputs: Mapping[str, Any] | None = None,
+        *,
+        workflows: MutableMapping[str, Any] | None = None,
+        callers: tuple[str, ...] = (),
+    ) -> WorkflowResult:
+        """Run a workflow.
+
+        Args:
+            workflow_id (str): id of the workflow
+            inputs (Mapping[str, Any] | None): inputs of the workflow, completed with the defaults of its schema
+            workflows (MutableMapping[str, Any] | None): `{"inputs": ..., "outputs": ...}` of the workflows
+                already run, by id, for `$workflows` expressions; completed with this run
+            callers (tuple[str, ...]): ids of the workflows in progress whose steps or actions run this workflow
+
+        Raises:
+            SpecificationError: when the workflow is unknown or already in progress, or a step cannot be compiled
+            ExecutionError: when the url of the server of an operation is unknown
+
+        Returns:
+            WorkflowResult: outcome of the run
+        """
+        start = time.perf_counter()
+        if workflow_id in callers:
+            cycle = " -> ".join([*callers[callers.index(workflow_id) :], workflow_id])
+            raise SpecificationError(f"Workflows call each other in a cycle: {cycle}")
+        callers = (*callers, workflow_id)
+        workflow = self.specification.get_workflow(workflow_id)
+        workflows = {} if workflows is None else workflows
+        result = WorkflowResult(workflow_id, success=False, inputs={**_default_inputs(workflow), **(inputs or {})})
+        step_outputs: dict[str, Any] = {}
+        positions = {str(step.step_id): index for index, step in enumerate(workflow.steps)}
+        retries: dict[str, int] = {}
+        position = 0
+        while position < len(workflow.steps):
+            if len(result.steps) >= RUN_MAX_STEP_EXECUTIONS:
+                result.error = f"More than {RUN_MAX_STEP_EXECUTIONS} steps executed, the actions loop"
+                break
+            batch = self.step_graph(workflow).batch(position) if self.parallel_steps else []
+            if len(batch) > 1:
+                graph = self.step_graph(workflow)
+                plans = {index: self.plan(workflow_id, workflow.steps[index]) for index in batch}
+                executed = self._execute_batch(
+                    plans,
+                    graph.predecessors(batch),
+                    result.inputs,
+                    step_outputs,
+                    workflows,
+                    callers=callers,
+                )
+                result.steps.extend(executed)
+                for step in executed:
+                    outcome = "success" if step.success else "failure"
+                    LOGGER.info(f"Workflow {workflow_id}, step {step.step_id}: {outcome}")
+                failure = next((step for step in executed if not step.success), None)
+                if failure is not None:
+                    result.error = f"Step {failure.step_id} failed: {failure.error}"
+                    break
+                position = batch[-1] + 1
+                continue
+
+            plan = self.plan(workflow_id, workflow.steps[position])
+            context = self._context(result.inputs, step_outputs, workflows)
+            step = self.execute(plan, context, workflows, callers=callers)
+            step.attempt = retries.get(plan.step_id, 0) + 1
+            result.steps.append(step)
+            LOGGER.info(f"Workflow {workflow_id}, step {plan.step_id}: {'success' if step.success else 'failure'}")
+
+            if step.success:
+                retries.pop(plan.step_id, None)
+                step_outputs[plan.step_id] = {"outputs": step.outputs}
+                action = plan.action(plan.on_success, context)
+                if action is None:
+                    position += 1
+                    continue
+            else:
+                action = plan.action(plan.on_failure, context)
+                if action is None or action.type == FailureActionObjectType.end:
+                    result.error = f"Step {plan.step_id} failed: {step.error}"
+                    break
+                if action.type == FailureActionObjectType.retry:
+                    limit = action.retry_limit if action.retry_limit is not None else RUN_DEFAULT_RETRY_LIMIT
+                    if retries.get(plan.step_id, 0) >= limit:
+                        result.error = f"Step {plan.step_id} failed after {limit} retries: {step.error}"
+                        break
+                    retries[plan.step_id] = retries.get(plan.step_id, 0) + 1
+                    self._sleep(action.retry_after or 0)
+                    continue
+
+            if action.type in (SuccessActionObjectType.end, FailureActionObjectType.end):
+                position = len(workflow.steps)
+            elif action.workflow_id is not None:
+                # transfer to another workflow, which ends this one
+                transferred = self.run(str(action.workflow_id), workflows=workflows, callers=callers)
+                if not transferred.success:
+                    result.error = f"Workflow {action.workflow_id} failed: {transferred.error}"
+                    break
+                position = len(workflow.steps)
+            elif str(action.step_id) in positions:
+                position = positions[str(action.step_id)]
+            else:
+                raise SpecificationError(
+                    f"Step {plan.step_id} of workflow {workflow_id}: unknown step {action.step_id}",
+                )
+        else:
+            context = self._context(result.inputs, step_outputs, workflows)
+            result.outputs = {name: compile_value(value)(context) for name, value in (workflow.outputs or {}).items()}
+            result.success = True
+
+        workflows[workflow_id] = {"inputs": result.inputs, "outputs": result.outputs}
+        result.elapsed = time.perf_counter() - start
+        return result
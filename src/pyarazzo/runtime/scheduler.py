@@ -0,0 +1,224 @@
+"""Concurrent execution of the workflows of a specification.
+
+Most workflows of a specification do not depend on each other. A `WorkflowScheduler` runs a set
+of workflows on an asyncio event loop, starting each workflow as soon as the workflows of its
+`dependsOn` have completed, so independent workflows run at the same time. Workflows are run by a
+`WorkflowRunner` in worker threads; the workflows in flight are bounded by an asyncio semaphore,
+and the requests in flight, across every workflow, by a semaphore shared with the runner.
+Outputs pass between workflows through the shared `$workflows` mapping: a dependency always
+completes before its dependents start. A workflow whose dependency failed is not run.
+
+The schedule reports the sum of the durations of the workflows, the duration of the critical
+path (the longest chain of dependent workflows) and the wall time, which together show the
+speedup over a sequential run.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from pyarazzo.config import RUN_MAX_CONCURRENT_REQUESTS, RUN_MAX_CONCURRENT_WORKFLOWS
+from pyarazzo.exceptions import ArazzoError
+from pyarazzo.model.graph import WorkflowGraph
+from pyarazzo.runtime.runner import WorkflowResult, WorkflowRunner
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class ScheduleResult:
+    """Outcome of a concurrent run of workflows."""
+
+    results: dict[str, WorkflowResult] = field(default_factory=dict)
+    """Outcome of each workflow, in completion order."""
+    skipped: list[str] = field(default_factory=list)
+    """Workflows not run because one of their dependencies failed."""
+    critical_path: list[str] = field(default_factory=list)
+    """Longest chain of dependent workflows, dependencies first."""
+    critical_path_time: float = 0.0
+    """Sum of the durations of the workflows of the critical path, in seconds."""
+    total: float = 0.0
+    """Sum of the durations of the workflows, the duration of a sequential run, in seconds."""
+    elapsed: float = 0.0
+    """Wall time of the run, in seconds."""
+
+    @property
+    def success(self) -> bool:
+        """Whether every workflow succeeded."""
+        return all(result.success for result in self.results.values())
+
+    @property
+    def speedup(self) -> float:
+        """Ratio of the duration of a sequential run to the wall time."""
+        return self.total / self.elapsed if self.elapsed else 1.0
+
+
+def _critical_path(graph: WorkflowGraph, results: Mapping[str, WorkflowResult]) -> tuple[list[str], float]:
+    # longest path weighted by durations, in topological order: the finish time of a workflow
+    # is its duration after the latest finish of its dependencies
+    finish: dict[str, float] = {}
+    previous: dict[str, str | None] = {}
+    for workflow_id in graph.order:
+        if workflow_id not in results:
+            continue
+        dependencies = [dependency for dependency in graph.dependencies[workflow_id] if dependency in finish]
+        latest = max(dependencies, key=finish.__getitem__, default=None)
+        previous[workflow_id] = latest
+        finish[workflow_id] = results[workflow_id].elapsed + (finish[latest] if latest is not None else 0.0)
+    if not finish:
+        return [], 0.0
+    last = max(finish, key=finish.__getitem__)
+    path = [last]
+    while (dependency := previous[path[-1]]) is not None:
+        path.append(dependency)
+    return path[::-1], finish[last]
+
+
+class WorkflowScheduler:
+    """Scheduler running the workflows of a specification along their `dependsOn` dependencies."""
+
+    def __init__(
+        self,
+        runner: WorkflowRunner,
+        *,
+        max_workflows: int = RUN_MAX_CONCURRENT_WORKFLOWS,
+        max_requests: int = RUN_MAX_CONCURRENT_REQUESTS,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            runner (WorkflowRunner): runner of the workflows, its request limit is set when it has none
+            max_workflows (int): maximum number of workflows in flight
+            max_requests (int): maximum number of requests in flight, across every workflow
+
+        Raises:
+            ValueError: when a maximum is lower than 1
+        """
+        if max_workflows < 1 or max_requests < 1:
+            raise ValueError("The maximum numbers of workflows and requests in flight must be at least 1")
+        self.runner = runner
+        self.max_workflows = max_workflows
+        if runner.request_limit is None:
+            runner.request_limit = threading.BoundedSemaphore(max_requests)
+
+    def _selection(self, workflow_ids: Iterable[str] | None) -> WorkflowGraph:
+        # graph of the `dependsOn` edges of the requested workflows and of their dependencies, the
+        # workflows called by steps are run by their callers; every workflow is built up front as
+        # building a workflow left out of a selective load is not thread-safe
+        specification = self.runner.specification
+        if workflow_ids is None:
+            workflow_ids = [str(workflow.workflow_id) for workflow in specification.workflows]
+            workflow_ids.extend(specification.deferred_workflow_ids)
+        dependencies: dict[str, list[str]] = {}
+        pending = list(workflow_ids)
+        while pending:
+            workflow_id = pending.pop()
+            if workflow_id in dependencies:
+                continue
+            workflow = specification.get_workflow(workflow_id)
+            # dependencies on workflows of other source descriptions are not run
+            targets = dependencies[workflow_id] = [str(target) for target in workflow.depends_on or []]
+            pending.extend(target for target in targets if not target.startswith("$"))
+        for workflow in specification.workflows:
+            for step in workflow.steps:
+                if step.workflow_id is not None and not str(step.workflow_id).startswith("$"):
+                    specification.get_workflow(str(step.workflow_id))
+        return WorkflowGraph(dependencies)
+
+    async def run_async(
+        self,
+        workflow_ids: Iterable[str] | None = None,
+        inputs: Mapping[str, Mapping[str, Any]] | None = None,
+        *,
+        workflows: dict[str, Any] | None = None,
+    ) -> ScheduleResult:
+        """Run workflows concurrently.
+
+        Args:
+            workflow_ids (Iterable[str] | None): ids of the workflows to run with their dependencies, all by default
+            inputs (Mapping[str, Mapping[str, Any]] | None): inputs of the workflows, by id
+            workflows (dict[str, Any] | None): `{"inputs": ..., "outputs": ...}` of the workflows already run,
+                by id, for `$workflows` expressions; completed with the workflows run
+
+        Raises:
+            SpecificationError: when a workflow is unknown, or the workflows depend on each other in a cycle
+
+        Returns:
+            ScheduleResult: outcome of the run
+        """
+        start = time.perf_counter()
+        graph = self._selection(workflow_ids)
+        inputs = inputs or {}
+        workflows = {} if workflows is None else workflows
+        schedule = ScheduleResult()
+        remaining = {workflow_id: len(dependencies) for workflow_id, dependencies in graph.dependencies.items()}
+        limit = asyncio.Semaphore(self.max_workflows)
+        loop = asyncio.get_running_loop()
+        tasks: dict[asyncio.Task[WorkflowResult], str] = {}
+
+        def run(workflow_id: str) -> WorkflowResult:
+            try:
+                return self.runner.run(workflow_id, inputs.get(workflow_id), workflows=workflows)
+            except ArazzoError as e:
+                return WorkflowResult(workflow_id, success=False, error=str(e))
+
+        async def submit(workflow_id: str, executor: ThreadPoolExecutor) -> WorkflowResult:
+            async with limit:
+                LOGGER.info(f"Workflow {workflow_id} started")
+                return await loop.run_in_executor(executor, run, workflow_id)
+
+        def complete(workflow_id: str, result: WorkflowResult, executor: ThreadPoolExecutor) -> None:
+            schedule.results[workflow_id] = result
+            for dependent in graph.dependents[workflow_id]:
+                remaining[dependent] -= 1
+                if not result.success:
+                    # the dependent is skipped once, by its first failed dependency
+                    if dependent not in schedule.results:
+                        schedule.skipped.append(dependent)
+                        error = f"Dependency {workflow_id} failed"
+                        complete(dependent, WorkflowResult(dependent, success=False, error=error), executor)
+                elif remaining[dependent] == 0 and dependent not in schedule.results:
+                    tasks[asyncio.create_task(submit(dependent, executor))] = dependent
+
+        with ThreadPoolExecutor(max_workers=self.max_workflows, thread_name_prefix="pyarazzo-workflow") as executor:
+            for workflow_id in graph.levels[0] if graph.levels else []:
+                tasks[asyncio.create_task(submit(workflow_id, executor))] = workflow_id
+            while tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    workflow_id = tasks.pop(task)
+                    result = task.result()
+                    LOGGER.info(f"Workflow {workflow_id}: {'success' if result.success else 'failure'}")
+                    complete(workflow_id, result, executor)
+
+        schedule.critical_path, schedule.critical_path_time = _critical_path(graph, schedule.results)
+        schedule.total = sum(result.elapsed for result in schedule.results.values())
+        schedule.elapsed = time.perf_counter() - start
+        return schedule
+
+    def run(
+        self,
+        workflow_ids: Iterable[str] | None = None,
+        inputs: Mapping[str, Mapping[str, Any]] | None = None,
+        *,
+        workflows: dict[str, Any] | None = None,
+    ) -> ScheduleResult:
+        """Run workflows concurrently, on a new event loop.
+
+        Args:
+            workflow_ids (Iterable[str] | None): ids of the workflows to run with their dependencies, all by default
+            inputs (Mapping[str, Mapping[str, Any]] | None): inputs of the workflows, by id
+            workflows (dict[str, Any] | None): `{"inputs": ..., "outputs": ...}` of the workflows already run, by id
+
+        Raises:
+            SpecificationError: when a workflow is unknown, or the workflows depend on each other in a cycle
+
+        Returns:
+            ScheduleResult: outcome of the run
+        """
+        return asyncio.run(self.run_async(workflow_ids, inputs, workflows=workflows))
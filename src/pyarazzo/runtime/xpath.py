@@ -0,0 +1,351 @@
+"""XPath expressions.
+
+A subset of XPath common to versions 1.0, 2.0 and 3.0, evaluated over `xml.etree.ElementTree`
+documents: absolute and relative location paths, child (`/`) and descendant (`//`) steps, name
+tests (`book`, `*`, matched by local name whatever the namespace), the current node (`.`),
+attribute (`@id`, `@*`) and text (`text()`) steps, and predicates, either positional (`[1]`,
+`[last()]`) or boolean (`[@lang='en' and price > 10]`, `[contains(title, 'XML')]`).
+Paths are compiled once into a list of steps and cached by source text; documents are parsed once
+and can be queried by many paths.
+"""
+
+import functools
+import re
+import xml.etree.ElementTree as ET
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from pyarazzo.config import EXPRESSION_CACHE_SIZE, XML_DOCUMENT_CACHE_SIZE
+from pyarazzo.exceptions import ExpressionError
+from pyarazzo.runtime.condition import Evaluator, compile_condition, truthy
+
+# tag of the document node, parent of the root element
+DOCUMENT_TAG = "#document"
+# tokens of predicates: strings, numbers, operators, function calls, attributes and names
+PREDICATE_TOKEN_PATTERN = re.compile(
+    r"""\s+|'[^']*'|"[^"]*"|\d+(?:\.\d+)?|!=|<=|>=|=|<|>|\(|\)|,|@[\w\-.:*]+|[A-Za-z_][\w\-.:]*(?:\s*\()?|\.""",
+)
+PREDICATE_KEYWORDS = {"and": "&&", "or": "||"}
+
+
+def _string(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, ET.Element):
+        return "".join(value.itertext())
+    return str(value)
+
+
+# XPath functions available in predicates, under their name in the condition language
+PREDICATE_FUNCTIONS: dict[str, Callable[..., Any]] = {
+    "not": lambda value: not truthy(value),
+    "contains": lambda text, part: _string(part) in _string(text),
+    "starts_with": lambda text, prefix: _string(text).startswith(_string(prefix)),
+    "string_length": lambda text: len(_string(text)),
+    "string": _string,
+}
+
+# selects the nodes of a step from a context node
+Step = Callable[[ET.Element], list[Any]]
+
+
+def _local_name(tag: Any) -> str:
+    return tag.rpartition("}")[2] if isinstance(tag, str) else ""
+
+
+@functools.lru_cache(maxsize=XML_DOCUMENT_CACHE_SIZE)
+def _parse(content: str | bytes) -> ET.Element:
+    try:
+        # expat rejects external entities and bounds the expansion of internal ones
+        root = ET.fromstring(content)  # noqa: S314
+    except ET.ParseError as e:
+        raise ExpressionError(f"Invalid XML document: {e}") from e
+    document = ET.Element(DOCUMENT_TAG)
+    document.append(root)
+    return document
+
+
+def parse_xml(content: str | bytes | ET.Element) -> ET.Element:
+    """Parse an XML document, recently parsed documents are cached by content.
+
+    Args:
+        content (str | bytes | ET.Element): raw document, or its root element
+
+    Raises:
+        ExpressionError: when the document is not well-formed
+
+    Returns:
+        ET.Element: document node, parent of the root element
+    """
+    if isinstance(content, ET.Element):
+        if content.tag == DOCUMENT_TAG:
+            return content
+        document = ET.Element(DOCUMENT_TAG)
+        document.append(content)
+        return document
+    return _parse(content)
+
+
+def _translate_predicate(predicate: str) -> str:
+    # rewrite an XPath predicate in the condition language: child names become `$name`
+    # operands, `.` and `text()` the `$.` operand, `=` becomes `==`, `and`/`or` become `&&`/`||`
+    translated = []
+    position = 0
+    while position < len(predicate):
+        token = PREDICATE_TOKEN_PATTERN.match(predicate, position)
+        if token is None:
+            raise ExpressionError(f"Unsupported XPath predicate {predicate!r}")
+        text = token.group()
+        position = token.end()
+        if text in ("=", "."):
+            translated.append("==" if text == "=" else "$.")
+        elif text in PREDICATE_KEYWORDS:
+            translated.append(PREDICATE_KEYWORDS[text])
+        elif text == "text(" and predicate.startswith(")", position):
+            translated.append("$.")
+            position += 1
+        elif text.endswith("("):
+            name = text[:-1].strip().replace("-", "_")
+            translated.append(f"{name}(")
+        elif text[0].isalpha() or text[0] == "_":
+            translated.append(f"${text}")
+        else:
+            translated.append(text)
+    return "".join(translated)
+
+
+def _predicate_operand(source: str) -> Evaluator:
+    if source == "$.":
+        return _string
+    if source.startswith("@"):
+        name = source[1:]
+        return lambda element: _attribute(element, name)
+    name = source[1:].rpartition(":")[2]
+
+    def child(element: ET.Element) -> str | None:
+        # a child is compared by its string value, and missing when there is no such child
+        found = next((child for child in element if _local_name(child.tag) == name), None)
+        return None if found is None else _string(found)
+
+    return child
+
+
+def _attribute(element: ET.Element, name: str) -> str | None:
+    value = element.get(name)
+    if value is not None:
+        return value
+    return next((value for key, value in element.attrib.items() if _local_name(key) == name), None)
+
+
+def _compile_predicate(predicate: str) -> Callable[[list[Any]], list[Any]]:
+    predicate = predicate.strip()
+    if predicate.isdigit():
+        index = int(predicate) - 1
+        return lambda nodes: nodes[index : index + 1] if index >= 0 else []
+    if re.fullmatch(r"last\(\s*\)", predicate):
+        return lambda nodes: nodes[-1:]
+    condition = compile_condition(_translate_predicate(predicate), _predicate_operand, PREDICATE_FUNCTIONS)
+
+    def filter_nodes(nodes: list[Any]) -> list[Any]:
+        return [node for node in nodes if truthy(condition(node))]
+
+    return filter_nodes
+
+
+def _descendants_or_self(element: ET.Element) -> Iterator[ET.Element]:
+    return element.iter()
+
+
+def _split_steps(path: str) -> list[tuple[bool, str]]:
+    # (descendant axis, step) pairs, `/` inside predicates and strings does not split
+    steps = []
+    depth = 0
+    quote = ""
+    start = 0
+    descendant = False
+    position = 0
+    while position <= len(path):
+        char = path[position] if position < len(path) else "/"
+        if quote:
+            quote = "" if char == quote else quote
+        elif char in "'\"":
+            quote = char
+        elif char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        elif char == "/" and not depth:
+            if position > start:
+                steps.append((descendant, path[start:position].strip()))
+                descendant = False
+            elif steps or start:
+                # `//`: the next step uses the descendant axis
+                descendant = True
+            start = position + 1
+        position += 1
+    if depth or quote:
+        raise ExpressionError(f"Unbalanced predicate in XPath {path!r}")
+    return steps
+
+
+class XPath:
+    """Compiled XPath expression."""
+
+    __slots__ = ("source", "steps")
+
+    def __init__(self, source: str, steps: list[Step]) -> None:
+        """Constructor.
+
+        Args:
+            source (str): source text
+            steps (list[Step]): steps applied in turn from the document node
+        """
+        self.source = source
+        self.steps = steps
+
+    def find(self, document: str | bytes | ET.Element) -> list[Any]:
+        """Return the nodes selected in a document.
+
+        Args:
+            document (str | bytes | ET.Element): raw or parsed document, see `parse_xml`
+
+        Raises:
+            ExpressionError: when a raw document is not well-formed
+
+        Returns:
+            list[Any]: selected elements, or strings for attribute and text steps, in document order
+        """
+        nodes: list[Any] = [parse_xml(document)]
+        for step in self.steps:
+            nodes = [selected for node in nodes for selected in step(node)]
+            if not nodes:
+                break
+        return nodes
+
+    def first(self, document: str | bytes | ET.Element) -> Any:
+        """Return the first node selected in a document.
+
+        Args:
+            document (str | bytes | ET.Element): raw or parsed document
+
+        Returns:
+            Any: first selected node, None when nothing is selected
+        """
+        nodes = self.find(document)
+        return nodes[0] if nodes else None
+
+    def find_many(self, documents: Iterable[str | bytes | ET.Element]) -> list[list[Any]]:
+        """Evaluate the expression against many documents.
+
+        Args:
+            documents (Iterable[str | bytes | ET.Element]): raw or parsed documents
+
+        Returns:
+            list[list[Any]]: for each document, the selected nodes
+        """
+        return [self.find(document) for document in documents]
+
+    def __repr__(self) -> str:
+        return f"XPath({self.source!r})"
+
+
+def _step(source: str, step: str, *, descendant: bool, last: bool) -> Step:
+    test, _, rest = step.partition("[")
+    test = test.strip()
+    predicates = [_compile_predicate(predicate) for predicate in _split_predicates(f"[{rest}" if rest else "", source)]
+
+    if test == "text()" or test.startswith("@"):
+        if not last or predicates:
+            raise ExpressionError(f"Attribute and text steps must end XPath {source!r}")
+        return _value_step(test, descendant=descendant)
+
+    if test == ".":
+        if descendant:
+            return lambda node: list(_descendants_or_self(node))
+        return lambda node: [node]
+    if not re.fullmatch(r"\*|[A-Za-z_][\w\-.]*(:[A-Za-z_][\w\-.]*)?", test):
+        raise ExpressionError(f"Unsupported step {step!r} in XPath {source!r}")
+    name = test.rpartition(":")[2]
+
+    def select(node: ET.Element) -> list[Any]:
+        contexts = _descendants_or_self(node) if descendant else (node,)
+        selected = []
+        for context in contexts:
+            children = [child for child in context if name == "*" or _local_name(child.tag) == name]
+            for predicate in predicates:
+                children = predicate(children)
+            selected.extend(children)
+        return selected
+
+    return select
+
+
+def _value_step(test: str, *, descendant: bool) -> Step:
+    # text or attribute values of the context node, or of its descendants
+    if test == "text()":
+
+        def values(element: ET.Element) -> list[Any]:
+            return [element.text] if element.text is not None else []
+
+    elif test == "@*":
+
+        def values(element: ET.Element) -> list[Any]:
+            return list(element.attrib.values())
+
+    else:
+        name = test[1:].rpartition(":")[2]
+
+        def values(element: ET.Element) -> list[Any]:
+            value = _attribute(element, name)
+            return [] if value is None else [value]
+
+    if descendant:
+        return lambda node: [value for element in node.iter() for value in values(element)]
+    return values
+
+
+def _split_predicates(text: str, source: str) -> list[str]:
+    predicates = []
+    depth = 0
+    quote = ""
+    start = 0
+    for position, char in enumerate(text):
+        if quote:
+            quote = "" if char == quote else quote
+        elif char in "'\"":
+            quote = char
+        elif char == "[":
+            if depth == 0:
+                start = position + 1
+            depth += 1
+        elif char == "]":
+            depth -= 1
+            if depth == 0:
+                predicates.append(text[start:position])
+    if depth or quote:
+        raise ExpressionError(f"Unbalanced predicate in XPath {source!r}")
+    return predicates
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_xpath(source: str) -> XPath:
+    """Compile an XPath expression, compiled expressions are cached by source text.
+
+    Args:
+        source (str): XPath expression, e.g. `/store/book[price > 10]/@id`
+
+    Raises:
+        ExpressionError: when the expression is malformed or out of the supported subset
+
+    Returns:
+        XPath: the compiled expression
+    """
+    source = source.strip()
+    parts = _split_steps(source)
+    if not parts:
+        raise ExpressionError(f"Invalid XPath {source!r}")
+    steps = [
+        _step(source, step, descendant=descendant, last=index == len(parts) - 1)
+        for index, (descendant, step) in enumerate(parts)
+    ]
+    return XPath(source, steps)
@@ -6,53 +6,131 @@ This module provides utilities for:
 - Supporting both JSON and YAML formats
 """
 
+import functools
+import hashlib
 import importlib.resources
 import json
 import logging
+from typing import Any
 from urllib.parse import urlparse
 
-import requests
+import httpx
 import yaml
-from jsonschema import ValidationError, validate
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 
+from pyarazzo import http_client
+from pyarazzo.cache import get_parse_cache, get_validation_ledger
 from pyarazzo.config import (
     CONTENT_TYPE_JSON,
     CONTENT_TYPE_YAML,
-    HTTP_REQUEST_TIMEOUT,
 )
 from pyarazzo.exceptions import LoadError
 from pyarazzo.exceptions import ValidationError as ArazzoValidationError
 
 LOGGER = logging.getLogger(__name__)
 
-# Load tge arazzo specification Schema for resources
-with importlib.resources.files("pyarazzo").joinpath("schema.yaml").open("r") as schema_file:
-    schema = yaml.safe_load(schema_file)
 
+@functools.cache
+def load_schema() -> dict:
+    """Load the Arazzo specification JSON Schema shipped with the package.
 
-def load_spec(path_or_url: str) -> dict:
+    Returns:
+        dict: the JSON Schema, parsed once per process.
+    """
+    with importlib.resources.files("pyarazzo").joinpath("schema.yaml").open("r") as schema_file:
+        return yaml.safe_load(schema_file)
+
+
+@functools.cache
+def schema_digest() -> str:
+    """Hash the Arazzo specification JSON Schema shipped with the package.
+
+    Returns:
+        str: hex digest of the schema, validation ledger entries are bound to it.
+    """
+    return hashlib.sha256(importlib.resources.files("pyarazzo").joinpath("schema.yaml").read_bytes()).hexdigest()
+
+
+@functools.cache
+def get_validator() -> Validator:
+    """Build the validator of the Arazzo specification JSON Schema.
+
+    The schema is checked against its meta-schema only once, the validator is then
+    reused by every validation.
+
+    Returns:
+        Validator: validator instance for the Arazzo JSON Schema.
+    """
+    schema = load_schema()
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+def __getattr__(name: str) -> Any:
+    # the schema used to be parsed at import time and exposed as `schema`
+    if name == "schema":
+        return load_schema()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def validation_errors(spec: dict) -> list[str]:
+    """Collect every schema violation of a specification in a single pass.
+
+    Args:
+        spec (dict): The specification to validate.
+
+    Returns:
+        list[str]: one message per violation, prefixed by the JSON Pointer of the invalid element.
+    """
+    errors = sorted(get_validator().iter_errors(spec), key=lambda error: list(map(str, error.absolute_path)))
+    return [f"/{'/'.join(map(str, error.absolute_path))}: {error.message}" for error in errors]
+
+
+def load_spec(path_or_url: str, *, all_errors: bool = False, trusted: bool = False) -> dict:
     """Load a specification from file in the json or yaml format.
 
+    Schema validation is skipped for trusted documents, and for documents whose content
+    already passed validation against the same schema (see `ValidationLedger`).
+
     Args:
         path_or_url (str): file path to the specification
+        all_errors (bool): report every schema violation instead of the most relevant one
+        trusted (bool): skip schema validation, for documents produced or checked beforehand
 
     Raises:
         ArazzoValidationError: when specification fails schema validation
+        LoadError: when the specification cannot be read or parsed
 
     Returns:
         dict: specification as a dict
     """
-    document = load_data(path_or_url)
+    content, fmt = read_data(path_or_url)
+    try:
+        document = parse_content(content, fmt)
+    except (json.JSONDecodeError, yaml.YAMLError) as e:
+        LOGGER.exception(f"Failed to parse {path_or_url}")
+        raise LoadError(f"Failed to parse {path_or_url}: {e!s}") from e
+
+    ledger = get_validation_ledger()
+    if trusted or ledger.is_validated(content, schema_digest()):
+        LOGGER.debug(f"Skipping schema validation of {path_or_url}")
+        return document
     try:
-        validate(document, schema)
-    except ValidationError as e:
+        schema_validation(document, all_errors=all_errors)
+    except ArazzoValidationError:
         LOGGER.exception(f"Schema validation failed for {path_or_url}")
-        raise ArazzoValidationError(f"Invalid specification: {e.message}") from e
+        raise
+    ledger.record(content, schema_digest())
     return document
 
 
-def load_from_url(url: str) -> dict:
-    """Load data from an url supporting JSON and YAML formats.
+def read_from_url(url: str) -> tuple[bytes, str]:
+    """Read the raw content of a JSON or YAML document served at an url.
+
+    The document is fetched with the shared HTTP client and revalidated against the HTTP cache.
 
     Args:
         url (str): url to a file.
@@ -61,32 +139,105 @@ def load_from_url(url: str) -> dict:
         LoadError: when HTTP request fails or content type is unsupported.
 
     Returns:
-        dict: Document as dict.
+        tuple[bytes, str]: raw content and format (json or yaml).
     """
     try:
-        response = requests.get(url, timeout=HTTP_REQUEST_TIMEOUT)
-        response.raise_for_status()
-    except requests.RequestException as e:
+        document = http_client.fetch_document(url)
+    except httpx.HTTPError as e:
         LOGGER.exception(f"HTTP request failed for {url}")
         raise LoadError(f"Failed to load from URL {url}: {e!s}") from e
 
-    content_type = response.headers.get("Content-Type", "")
-    try:
-        if CONTENT_TYPE_JSON in content_type or url.endswith(".json"):
-            return response.json()
+    content_type = document.content_type
+    path = urlparse(url).path
+    if CONTENT_TYPE_JSON in content_type or path.endswith(".json"):
+        return document.content, "json"
+    if any(ct in content_type for ct in CONTENT_TYPE_YAML) or path.endswith((".yaml", ".yml")):
+        return document.content, "yaml"
+    raise LoadError(f"Unsupported content type: {content_type}")
+
+
+def load_from_url(url: str) -> dict:
+    """Load data from an url supporting JSON and YAML formats.
+
+    The document is fetched with the shared HTTP client, revalidated against the HTTP cache,
+    and parsed through the parse cache.
+
+    Args:
+        url (str): url to a file.
 
-        if any(ct in content_type for ct in CONTENT_TYPE_YAML) or url.endswith((".yaml", ".yml")):
-            return yaml.safe_load(response.text)
+    Raises:
+        LoadError: when HTTP request fails or content type is unsupported.
 
-        raise LoadError(f"Unsupported content type: {content_type}")
+    Returns:
+        dict: Document as dict.
+    """
+    content, fmt = read_from_url(url)
+    try:
+        return parse_content(content, fmt)
     except (json.JSONDecodeError, yaml.YAMLError) as e:
         LOGGER.exception(f"Failed to parse response from {url}")
         raise LoadError(f"Failed to parse content from {url}: {e!s}") from e
 
 
+def _parse_json(content: bytes) -> dict:
+    return json.loads(content)
+
+
+def _parse_yaml(content: bytes) -> dict:
+    return yaml.safe_load(content)
+
+
+def parse_content(content: bytes, fmt: str) -> dict:
+    """Parse the raw content of a document through the parse cache.
+
+    Args:
+        content (bytes): raw document content
+        fmt (str): document format (json or yaml)
+
+    Raises:
+        json.JSONDecodeError: when a JSON document is malformed.
+        yaml.YAMLError: when a YAML document is malformed.
+
+    Returns:
+        dict: Document as dict.
+    """
+    parser = _parse_json if fmt == "json" else _parse_yaml
+    return get_parse_cache().parse(content, fmt, parser)
+
+
+def read_from_file(path: str) -> tuple[bytes, str]:
+    """Read the raw content of a local JSON or YAML file.
+
+    Args:
+        path (str): Path to a local file.
+
+    Raises:
+        LoadError: when the file cannot be read or its extension is unsupported.
+
+    Returns:
+        tuple[bytes, str]: raw content and format (json or yaml).
+    """
+    if path.endswith(".json"):
+        fmt = "json"
+    elif path.endswith((".yaml", ".yml")):
+        fmt = "yaml"
+    else:
+        raise LoadError(f"Unsupported file extension: {path}")
+
+    try:
+        with open(path, "rb") as file:
+            return file.read(), fmt
+    except FileNotFoundError as e:
+        LOGGER.exception(f"File not found: {path}")
+        raise LoadError(f"File not found: {path}") from e
+
+
 def load_from_file(path: str) -> dict:
     """Load data from a local path supporting JSON and YAML formats.
 
+    Parsed documents are kept in the parse cache, keyed by the file content,
+    so unchanged files are not parsed again.
+
     Args:
         path (str): Path to a local file.
 
@@ -96,23 +247,33 @@ def load_from_file(path: str) -> dict:
     Returns:
         dict: Document as dict.
     """
+    content, fmt = read_from_file(path)
     try:
-        if path.endswith(".json"):
-            with open(path) as file:
-                return json.load(file)
-        elif path.endswith((".yaml", ".yml")):
-            with open(path) as file:
-                return yaml.safe_load(file)
-        else:
-            raise LoadError(f"Unsupported file extension: {path}")
-    except FileNotFoundError as e:
-        LOGGER.exception(f"File not found: {path}")
-        raise LoadError(f"File not found: {path}") from e
+        return parse_content(content, fmt)
     except (json.JSONDecodeError, yaml.YAMLError) as e:
         LOGGER.exception(f"Failed to parse file: {path}")
         raise LoadError(f"Failed to parse file {path}: {e!s}") from e
 
 
+def read_data(path_or_url: str) -> tuple[bytes, str]:
+    """Read the raw content of a local path or a URL, supporting JSON and YAML formats.
+
+    Args:
+        path_or_url (str): Path to a local file or a URL to a resource.
+
+    Returns:
+        tuple[bytes, str]: raw content and format (json or yaml).
+
+    Raises:
+        LoadError: when data cannot be read.
+    """
+    result = urlparse(path_or_url)
+    if all([result.scheme, result.netloc]):
+        return read_from_url(path_or_url)
+
+    return read_from_file(path_or_url)
+
+
 def load_data(path_or_url: str) -> dict:
     """Load data from a local path or a URL, supporting JSON and YAML formats.
 
@@ -132,18 +293,26 @@ def load_data(path_or_url: str) -> dict:
     return load_from_file(path_or_url)
 
 
-def schema_validation(spec: dict) -> None:
+def schema_validation(spec: dict, *, all_errors: bool = False) -> None:
     """Validate the specification against the JSON Schema.
 
     Args:
         spec (dict): The specification to validate.
+        all_errors (bool): report every schema violation instead of the most relevant one.
 
     Raises:
         ArazzoValidationError: when specification fails schema validation.
     """
-    try:
-        validate(instance=spec, schema=schema)
+    if all_errors:
+        messages = validation_errors(spec)
+        if messages:
+            LOGGER.error("Specification validation failed")
+            raise ArazzoValidationError("Invalid specification:\n" + "\n".join(messages))
         LOGGER.info("Specification is valid")
-    except ValidationError as exc:
-        LOGGER.exception("Specification validation failed")
-        raise ArazzoValidationError(f"Invalid specification: {exc.message}") from exc
+        return
+
+    error = best_match(get_validator().iter_errors(spec))
+    if error is not None:
+        LOGGER.error("Specification validation failed")
+        raise ArazzoValidationError(f"Invalid specification: {error.message}") from error
+    LOGGER.info("Specification is valid")
@@ -1,7 +1,39 @@
 """Configuration for the pytest test suite."""
 
 import sys
+from collections.abc import Generator
 from pathlib import Path
 
+import pytest
+
+from tests.stub_server import StubServer
+
 # Add src directory to path so tests can import pyarazzo
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Path]:
+    """Point the pyarazzo caches to a temporary directory."""
+    from pyarazzo import cache, http_client  # noqa: PLC0415
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("PYARAZZO_CACHE_DIR", str(cache_dir))
+    monkeypatch.delenv("PYARAZZO_NO_CACHE", raising=False)
+    monkeypatch.delenv("PYARAZZO_OFFLINE", raising=False)
+    cache.reset_caches()
+    yield cache_dir
+    cache.reset_caches()
+    http_client.set_offline(offline=None)
+
+
+@pytest.fixture
+def stub_server() -> Generator[StubServer]:
+    """Start a local stand-in HTTP server."""
+    from pyarazzo.http_client import close_http_client  # noqa: PLC0415
+
+    server = StubServer()
+    server.start()
+    yield server
+    close_http_client()
+    server.stop()
@@ -1,10 +1,37 @@
 """Test Arazzo model conformity."""
 
+from pathlib import Path
+
 import pytest
 import yaml
 from pydantic import ValidationError
 
-from pyarazzo.model.arazzo import ArazzoSpecification
+from pyarazzo.exceptions import SpecificationError
+from pyarazzo.model.arazzo import ArazzoSpecification, ArazzoSpecificationLoader, select_workflows
+
+
+def workflow(workflow_id: str, **step: object) -> dict:
+    """Build a raw workflow of a single step."""
+    target = {} if "workflowId" in step else {"operationId": "op"}
+    return {"workflowId": workflow_id, "steps": [{"stepId": "step", **target, **step}]}
+
+
+@pytest.fixture
+def chained_spec() -> dict:
+    """Specification whose workflows reference each other in every possible way."""
+    return {
+        "arazzo": "1.0.0",
+        "info": {"title": "chained", "version": "1.0.0"},
+        "sourceDescriptions": [{"name": "api", "url": "api.yaml", "type": "openapi"}],
+        "workflows": [
+            {**workflow("a"), "dependsOn": ["b"]},
+            workflow("b", workflowId="c"),
+            workflow("c", onSuccess=[{"reference": "$components.successActions.to-d"}]),
+            workflow("d", onSuccess=[{"name": "again", "type": "goto", "workflowId": "d"}]),
+            workflow("e"),
+        ],
+        "components": {"successActions": {"to-d": {"name": "to-d", "type": "goto", "workflowId": "d"}}},
+    }
 
 
 @pytest.mark.parametrize("path", [("./tests/data/models/v1/pet-coupons-example.yaml")])
@@ -23,3 +50,28 @@ def test_invalid_spec(path: str) -> None:
         spec_dict = yaml.safe_load(file)
     with pytest.raises(ValidationError):
         ArazzoSpecification(**spec_dict)
+
+
+def test_select_workflows_closure(chained_spec: dict) -> None:
+    """Selected workflows bring the workflows they depend on, call and transfer to."""
+    selected, deferred = select_workflows(chained_spec, ["a"])
+    assert [raw["workflowId"] for raw in selected] == ["a", "b", "c", "d"]
+    assert [raw["workflowId"] for raw in deferred] == ["e"]
+    selected, _ = select_workflows(chained_spec, ["c"])
+    assert [raw["workflowId"] for raw in selected] == ["c", "d"]
+    with pytest.raises(SpecificationError):
+        select_workflows(chained_spec, ["unknown"])
+
+
+def test_selective_load(chained_spec: dict, tmp_path: Path) -> None:
+    """Workflows left out of a selective load are only built when requested."""
+    spec_path = tmp_path / "chained.yaml"
+    spec_path.write_text(yaml.safe_dump(chained_spec))
+    spec = ArazzoSpecificationLoader.load(str(spec_path), workflow_ids=["c"])
+    assert [wf.workflow_id for wf in spec.workflows] == ["c", "d"]
+    assert spec.deferred_workflow_ids == ["a", "b", "e"]
+    assert spec.get_workflow("e").workflow_id == "e"
+    assert spec.get_workflow("e") is spec.get_workflow("e")
+    assert spec.deferred_workflow_ids == ["a", "b"]
+    with pytest.raises(SpecificationError):
+        spec.get_workflow("unknown")
@@ -0,0 +1,71 @@
+"""Test the resolution of references to reusable components."""
+
+import pytest
+
+from pyarazzo.exceptions import SpecificationError
+from pyarazzo.model.arazzo import ArazzoSpecification
+from pyarazzo.model.components import ComponentTable
+
+
+def specification(**step: object) -> ArazzoSpecification:
+    """Build a specification of a single workflow using reusable components."""
+    return ArazzoSpecification(
+        arazzo="1.0.0",
+        info={"title": "components", "version": "1.0.0"},
+        sourceDescriptions=[{"name": "api", "url": "api.yaml", "type": "openapi"}],
+        workflows=[
+            {
+                "workflowId": "wf",
+                "parameters": [
+                    {"reference": "$components.parameters.page"},
+                    {"name": "limit", "in": "query", "value": 10},
+                ],
+                "successActions": [{"reference": "$components.successActions.done"}],
+                "steps": [{"stepId": "step", "operationId": "op", **step}],
+            },
+        ],
+        components={
+            "parameters": {"page": {"name": "page", "in": "query", "value": 1}},
+            "successActions": {
+                "done": {"name": "done", "type": "end"},
+                "next": {"name": "done", "type": "goto", "stepId": "step"},
+            },
+        },
+    )
+
+
+def test_step_references_resolved() -> None:
+    """Step parameters and actions override those of the workflow with the same name."""
+    spec = specification(
+        parameters=[{"reference": "$components.parameters.page", "value": 3}],
+        onSuccess=[{"reference": "$components.successActions.next"}],
+    )
+    table = spec.component_table
+    assert table is spec.component_table
+    assert [(p.name, p.value) for p in table.for_workflow("wf").parameters] == [("page", 1), ("limit", 10)]
+    resolved = table.for_step("wf", "step")
+    assert [(p.name, p.value) for p in resolved.parameters] == [("page", 3), ("limit", 10)]
+    assert [action.type.value for action in resolved.success_actions] == ["goto"]
+    assert resolved.failure_actions == ()
+    assert spec.components.parameters["page"].value == 1
+
+
+def test_resolved_parameters_are_shared() -> None:
+    """References with the same value resolve to the same parameter."""
+    spec = specification(parameters=[{"reference": "$components.parameters.page"}])
+    table = spec.component_table
+    assert table.for_step("wf", "step").parameters[0] is table.for_workflow("wf").parameters[0]
+    assert table.for_workflow("wf").parameters[0] is spec.components.parameters["page"]
+
+
+@pytest.mark.parametrize(
+    ("step", "message"),
+    [
+        ({"parameters": [{"reference": "$components.parameters.missing"}]}, "Unresolvable reference"),
+        ({"onSuccess": [{"reference": "$components.parameters.page"}]}, "does not target successActions"),
+    ],
+)
+def test_dangling_references(step: dict, message: str) -> None:
+    """Dangling references are reported with the step using them."""
+    with pytest.raises(SpecificationError, match=f"Step step of workflow wf: .*{message}"):
+        ComponentTable.from_specification(specification(**step))
@@ -0,0 +1,53 @@
+"""Test the workflow dependency graph."""
+
+import pytest
+
+from pyarazzo.exceptions import SpecificationError
+from pyarazzo.model.arazzo import ArazzoSpecification
+from pyarazzo.model.graph import WorkflowGraph
+
+
+def test_levels_and_reverse_edges() -> None:
+    """Workflows are ordered in levels of independent workflows."""
+    graph = WorkflowGraph({"a": ["b", "c"], "b": ["d"], "c": ["d", "d"], "d": [], "e": ["$sourceDescriptions.x.y"]})
+    assert graph.levels == [["d", "e"], ["b", "c"], ["a"]]
+    assert graph.order == ["d", "e", "b", "c", "a"]
+    assert graph.dependencies["c"] == ["d"]
+    assert graph.dependents["d"] == ["b", "c"]
+    assert graph.level_of("a") == 2
+    assert graph.ancestors("a") == {"b", "c", "d"}
+    assert len(graph) == 5
+    assert "e" in graph
+
+
+def test_cycle_is_reported() -> None:
+    """A cycle is named in the error."""
+    with pytest.raises(SpecificationError, match="a -> b -> c -> a"):
+        WorkflowGraph({"root": ["a"], "a": ["b"], "b": ["c"], "c": ["a"]})
+    with pytest.raises(SpecificationError, match="self -> self"):
+        WorkflowGraph({"self": ["self"]})
+
+
+def test_large_graph() -> None:
+    """Long chains do not hit recursion limits."""
+    size = 10_000
+    graph = WorkflowGraph({f"wf{index}": [f"wf{index + 1}"] if index + 1 < size else [] for index in range(size)})
+    assert len(graph.levels) == size
+    assert graph.order[0] == f"wf{size - 1}"
+    assert len(graph.ancestors("wf0")) == size - 1
+
+
+def test_specification_graph_is_shared() -> None:
+    """The graph of a specification is built once, from dependsOn and step workflowIds."""
+    spec = ArazzoSpecification(
+        arazzo="1.0.0",
+        info={"title": "graph", "version": "1.0.0"},
+        sourceDescriptions=[{"name": "api", "url": "api.yaml", "type": "openapi"}],
+        workflows=[
+            {"workflowId": "a", "dependsOn": ["b"], "steps": [{"stepId": "s", "workflowId": "c"}]},
+            {"workflowId": "b", "steps": [{"stepId": "s", "operationId": "op"}]},
+            {"workflowId": "c", "steps": [{"stepId": "s", "operationId": "op"}]},
+        ],
+    )
+    assert spec.workflow_graph is spec.workflow_graph
+    assert spec.workflow_graph.levels == [["b", "c"], ["a"]]
@@ -0,0 +1,82 @@
+"""Tests for the on-disk operation index."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyarazzo.model.index import OperationIndex
+from pyarazzo.model.openapi import HttpMethod, OpenApiLoader, OperationRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+PETSTORE = "./tests/data/models/pet-coupons.openapi.yaml"
+
+
+@pytest.fixture
+def operation_index(tmp_path: Path) -> Generator[OperationIndex]:
+    """Empty operation index."""
+    with OperationIndex(str(tmp_path / "index.sqlite")) as index:
+        yield index
+
+
+def test_index_lookups(operation_index: OperationIndex) -> None:
+    """Indexed operations are found by operationId, method and path, and pointer."""
+    digest = operation_index.add_document(PETSTORE)
+    assert operation_index.count(digest) == operation_index.count() == 11
+
+    operation = operation_index.get(digest, "findPetsByStatus")
+    assert operation is not None
+    assert operation.query_parameters == {"status": False, "page": True, "pageSize": False}
+    assert operation_index.find(digest, HttpMethod.get, operation.path) == operation
+    assert operation_index.find_by_pointer(digest, operation.pointer) == operation
+    assert operation_index.get(digest, "unknown") is None
+
+
+def test_index_skips_unchanged_documents(operation_index: OperationIndex, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Documents are only scanned again when their content changes."""
+    digest = operation_index.add_document(PETSTORE)
+    monkeypatch.setattr(OpenApiLoader, "extract", pytest.fail)
+    assert operation_index.add_document(PETSTORE) == digest
+
+
+def test_index_replaces_modified_documents(operation_index: OperationIndex, tmp_path: Path) -> None:
+    """The operations of the former version of a document are dropped."""
+    document = tmp_path / "api.yaml"
+    document.write_text("paths:\n  /a:\n    get:\n      operationId: a\n")
+    first = operation_index.add_document(str(document))
+    document.write_text("paths:\n  /b:\n    get:\n      operationId: b\n    post: {}\n")
+    second = operation_index.add_document(str(document))
+    assert first != second
+    assert operation_index.count(first) == 0
+    assert operation_index.count() == 2
+    assert operation_index.get(first, "a") is None
+
+
+def test_index_persistent(tmp_path: Path) -> None:
+    """The index is kept between runs."""
+    path = str(tmp_path / "index.sqlite")
+    with OperationIndex(path) as index:
+        digest = index.add_document(PETSTORE)
+    with OperationIndex(path) as index:
+        assert index.get(digest, "findPetsByStatus") is not None
+
+
+def test_registry_pages_in_operations(operation_index: OperationIndex) -> None:
+    """A registry backed by an index only loads the operations it is asked for."""
+    registry = OperationRegistry(operations={})
+    registry.use_index(operation_index)
+    registry.extend([PETSTORE, PETSTORE], sources=["first", "petstore"])
+    assert registry.operations == {}
+
+    operation = registry.resolve(operation_id="$sourceDescriptions.petstore.findPetsByStatus")
+    assert registry.operations == {}
+    assert registry.get("findPetsByStatus", source="petstore") is operation
+    assert registry.find("GET", operation.path, source="petstore") is operation
+    assert registry.find_by_operation_path(f"{{$sourceDescriptions.petstore.url}}#{operation.pointer}") is not None
+    assert registry.resolve(operation_id="findPetsByStatus") == operation
+    assert "findPetsByStatus" in registry.operations
+    assert registry.get("unknown") is None
@@ -0,0 +1,79 @@
+"""Tests for the path template matcher."""
+
+from __future__ import annotations
+
+import pytest
+
+from pyarazzo.model.matcher import PathMatcher
+from pyarazzo.model.openapi import HttpMethod, OperationRecord, OperationRegistry
+
+
+def operation(method: str, path: str) -> OperationRecord:
+    """Build a bare operation."""
+    return OperationRecord.create("service", None, HttpMethod(method), path)
+
+
+@pytest.fixture
+def matcher() -> PathMatcher:
+    """Matcher of a few overlapping templates."""
+    path_matcher = PathMatcher()
+    for method, path in [
+        ("get", "/pets"),
+        ("get", "/pets/mine"),
+        ("get", "/pets/{petId}"),
+        ("delete", "/pets/{petId}"),
+        ("get", "/pets/{id}/coupons"),
+        ("get", "/pets/mine/coupons/{couponId}"),
+        ("get", "/files/{name}.{ext}"),
+    ]:
+        path_matcher.add(operation(method, path))
+    return path_matcher
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "template", "parameters"),
+    [
+        ("GET", "/pets", "/pets", {}),
+        ("GET", "/pets/", "/pets", {}),
+        ("GET", "/pets/mine", "/pets/mine", {}),
+        ("GET", "/pets/123", "/pets/{petId}", {"petId": "123"}),
+        ("DELETE", "/pets/123", "/pets/{petId}", {"petId": "123"}),
+        ("GET", "/pets/123/coupons?page=2", "/pets/{id}/coupons", {"id": "123"}),
+        ("GET", "/pets/mine/coupons", "/pets/{id}/coupons", {"id": "mine"}),
+        ("GET", "/pets/mine/coupons/7", "/pets/mine/coupons/{couponId}", {"couponId": "7"}),
+        ("GET", "/files/report.tar.gz", "/files/{name}.{ext}", {"name": "report", "ext": "tar.gz"}),
+        ("GET", "https://api.example.com/pets/a%20b", "/pets/{petId}", {"petId": "a b"}),
+    ],
+)
+def test_match(matcher: PathMatcher, method: str, path: str, template: str, parameters: dict) -> None:
+    """Literal segments win over templated ones, with backtracking on dead ends."""
+    result = matcher.match(method, path)
+    assert result is not None
+    assert result[0].path == template
+    assert result[1] == parameters
+
+
+@pytest.mark.parametrize(("method", "path"), [("POST", "/pets"), ("GET", "/pets/1/2"), ("GET", "/owners")])
+def test_no_match(matcher: PathMatcher, method: str, path: str) -> None:
+    """Unknown methods and paths do not match."""
+    assert matcher.match(method, path) is None
+
+
+def test_base_path() -> None:
+    """The server base path is removed before matching."""
+    path_matcher = PathMatcher(base_path="/v2/")
+    path_matcher.add(operation("get", "/pets/{petId}"))
+    assert path_matcher.match("get", "/v2/pets/1") is not None
+    assert path_matcher.match("get", "/pets/1") is None
+
+
+def test_from_registry() -> None:
+    """Every operation of a registry is compiled."""
+    registry = OperationRegistry(operations={})
+    registry.append("./tests/data/models/pet-coupons.openapi.yaml")
+    path_matcher = PathMatcher.from_registry(registry)
+    assert len(path_matcher) == 11
+    result = path_matcher.match("GET", "/pet/123/coupons")
+    assert result is not None
+    assert result[0].operation_id == "getPetCoupons"
+    assert result[1] == {"petId": "123"}
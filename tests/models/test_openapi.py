@@ -1,8 +1,16 @@
 """Test for OpenAPI Loader functionality."""
 
+import threading
+import time
+
 import pytest
+import yaml
 
-from pyarazzo.model.openapi import OpenApiLoader
+from pyarazzo.cache import set_cache_enabled
+from pyarazzo.exceptions import LoadError, SpecificationError
+from pyarazzo.http_client import set_offline
+from pyarazzo.model.openapi import ApiOperation, HttpMethod, OpenApiLoader, OperationRecord, OperationRegistry
+from tests.stub_server import Handler, StubRequest, StubResponse, StubServer
 
 
 @pytest.mark.parametrize("path", [("./tests/data/models/pet-coupons.openapi.yaml")])
@@ -10,4 +18,217 @@ def test_load_local_spec(path: str) -> None:
     """Test the trasnformation from yaml/json to an object model."""
     operations = OpenApiLoader.load(path)
     assert operations is not None
-    assert len(operations.items()) == 7
+    assert len(operations) == 11
+
+
+def test_load_remote_spec(stub_server: StubServer) -> None:
+    """Remote OpenAPI documents are fetched with the shared HTTP client."""
+    with open("./tests/data/models/pet-coupons.openapi.yaml") as file:
+        content = file.read()
+    stub_server.route("GET", "/a.openapi.yaml", StubResponse(body=content))
+    stub_server.route("GET", "/b.openapi.yaml", StubResponse(body=content))
+    assert len(OpenApiLoader.load(stub_server.url("/a.openapi.yaml"))) == 11
+    assert len(OpenApiLoader.load(stub_server.url("/b.openapi.yaml"))) == 11
+    assert stub_server.connections == 1
+
+
+def test_registry_extend_concurrently(stub_server: StubServer) -> None:
+    """Source descriptions are fetched concurrently and merged in declaration order."""
+    with open("./tests/data/models/pet-coupons.openapi.yaml") as file:
+        spec = yaml.safe_load(file)
+    # both requests must be in flight at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def handler(title: str, delay: float) -> Handler:
+        def serve(_request: StubRequest) -> StubResponse:
+            barrier.wait()
+            time.sleep(delay)
+            return StubResponse(body={**spec, "info": {**spec["info"], "title": title}})
+
+        return serve
+
+    stub_server.route("GET", "/first.json", handler("first", 0.2))
+    stub_server.route("GET", "/second.json", handler("second", 0.0))
+    registry = OperationRegistry(operations={})
+    registry.extend([stub_server.url("/first.json"), stub_server.url("/second.json")], max_workers=2)
+    assert len(registry.operations) == 11
+    assert {operation.service_name for operation in registry.operations.values()} == {"second"}
+
+
+@pytest.fixture
+def registry() -> OperationRegistry:
+    """Registry of the pet coupons example."""
+    registry = OperationRegistry(operations={})
+    registry.append("./tests/data/models/pet-coupons.openapi.yaml", source="petstore")
+    return registry
+
+
+def test_registry_keeps_all_methods(registry: OperationRegistry) -> None:
+    """Every method of a path is registered."""
+    methods = {registry.get(operation_id).method for operation_id in ("getPetById", "updatePetWithForm", "deletePet")}
+    assert methods == {HttpMethod.get, HttpMethod.post, HttpMethod.delete}
+
+
+def test_registry_lookup_by_operation_id(registry: OperationRegistry) -> None:
+    """Operations are found by plain or qualified operationId."""
+    operation = registry.get("getPetCoupons")
+    assert operation is not None
+    assert operation.path == "/pet/{petId}/coupons"
+    assert registry.get("$sourceDescriptions.petstore.getPetCoupons") is operation
+    assert registry.get("getPetCoupons", source="other") is None
+
+
+def test_registry_lookup_by_method_and_path(registry: OperationRegistry) -> None:
+    """Operations are found by method and path template."""
+    assert registry.find("delete", "/pet/{petId}").operation_id == "deletePet"
+    assert registry.find(HttpMethod.get, "/pet/{petId}", source="petstore").operation_id == "getPetById"
+    assert registry.find("patch", "/pet/{petId}") is None
+
+
+@pytest.mark.parametrize(
+    "operation_path",
+    [
+        "{$sourceDescriptions.petstore.url}#/paths/~1pet~1{petId}/delete",
+        "{$sourceDescriptions.petstore.url}#/paths/~1pet~1%7BpetId%7D/delete",
+        "./tests/data/models/pet-coupons.openapi.yaml#/paths/~1pet~1{petId}/delete",
+    ],
+)
+def test_registry_lookup_by_operation_path(registry: OperationRegistry, operation_path: str) -> None:
+    """Operations are found by Arazzo operationPath."""
+    assert registry.resolve(operation_path=operation_path).operation_id == "deletePet"
+
+
+def test_registry_resolve_unknown(registry: OperationRegistry) -> None:
+    """Unknown operations raise a SpecificationError."""
+    with pytest.raises(SpecificationError):
+        registry.resolve(operation_id="unknown")
+    with pytest.raises(SpecificationError):
+        registry.resolve(operation_path="{$sourceDescriptions.petstore.url}#/paths/~1unknown/get")
+
+
+def test_operation_parameters(registry: OperationRegistry) -> None:
+    """Parameters are recorded with their location."""
+    operation = registry.get("findPetsByStatus")
+    assert operation.parameters == {"status": "query", "page": "query", "pageSize": "query"}
+    assert operation.query_parameters == {"status": False, "page": True, "pageSize": False}
+
+
+def test_fast_extraction_matches_strict() -> None:
+    """Scanning the paths only yields the same operations as the full model."""
+    path = "./tests/data/models/pet-coupons.openapi.yaml"
+    fast = OpenApiLoader.load(path)
+    strict = OpenApiLoader.load(path, strict=True)
+    assert fast == strict
+
+
+def test_fast_extraction_ignores_components() -> None:
+    """Only the paths and the references they use are read in the default mode."""
+    document = {
+        "openapi": "3.0.0",
+        "info": {"title": "partial"},
+        "paths": {
+            "/items/{id}": {
+                "parameters": [{"$ref": "#/components/parameters/id"}],
+                "get": {"operationId": "getItem", "responses": {"200": {"description": "ok"}}},
+            },
+        },
+        "components": {
+            "parameters": {"id": {"name": "id", "in": "path", "required": True}},
+            "schemas": {"Broken": {"type": 42}},
+        },
+    }
+    (operation,) = OpenApiLoader.extract(document)
+    assert operation.operation_id == "getItem"
+    assert operation.service_name == "partial"
+    assert operation.parameters == {"id": "path"}
+    with pytest.raises(ValueError, match="validation error"):
+        OpenApiLoader.extract(document, strict=True)
+
+
+def test_fast_extraction_invalid_parameter() -> None:
+    """Parameters without a name or a location raise a SpecificationError."""
+    document = {"paths": {"/items": {"get": {"parameters": [{"name": "page"}]}}}}
+    with pytest.raises(SpecificationError):
+        OpenApiLoader.extract(document)
+
+
+def test_fast_extraction_path_extensions() -> None:
+    """Extensions under the paths are skipped, other path items must be objects."""
+    get = {"operationId": "getItem", "responses": {"200": {"description": "ok"}}}
+    document = {"paths": {"x-internal": True, "x-owner": {"get": get}, "/items": {"get": get}}}
+    (operation,) = OpenApiLoader.extract(document)
+    assert operation.path == "/items"
+    with pytest.raises(SpecificationError, match="/items"):
+        OpenApiLoader.extract({"paths": {"/items": True}})
+
+
+def test_operation_record_round_trip(registry: OperationRegistry) -> None:
+    """Records expand to the full models, which compact back to the same models."""
+    for record in registry.operations.values():
+        operation = record.to_model()
+        assert isinstance(operation, ApiOperation)
+        assert operation.parameters == record.parameters
+        assert operation.headers == record.headers
+        assert operation.query_parameters == record.query_parameters
+        assert OperationRecord.from_model(operation).to_model() == operation
+
+
+def test_operation_records_share_strings() -> None:
+    """Service names, paths and parameter lists are stored once."""
+    operations = OpenApiLoader.load("./tests/data/models/pet-coupons.openapi.yaml")
+    by_path: dict[str, list[OperationRecord]] = {}
+    for operation in operations:
+        by_path.setdefault(operation.path, []).append(operation)
+    pet = by_path["/pet/{petId}"]
+    assert len(pet) > 1
+    assert pet[0].path is pet[1].path
+    assert pet[0].service_name is operations[0].service_name
+    first = OperationRecord.create("service", None, HttpMethod.get, "/a", (("id", "path", True),))
+    second = OperationRecord.create("service", None, HttpMethod.put, "/a", (("id", "path", True),))
+    assert first.parameter_specs is second.parameter_specs
+
+
+def test_registry_accepts_models() -> None:
+    """Operation models given to the registry are compacted."""
+    model = ApiOperation(operation_id="listPets", method=HttpMethod.get, path="/pets")
+    registry = OperationRegistry(operations={"listPets": model})
+    assert registry.get("listPets") == OperationRecord.from_model(model)
+    registry.add(ApiOperation(operation_id="addPet", method=HttpMethod.post, path="/pets"))
+    assert isinstance(registry.find("post", "/pets"), OperationRecord)
+
+
+def test_registry_extend_with_processes() -> None:
+    """Specifications are loaded by worker processes and merged in declaration order."""
+    path = "./tests/data/models/pet-coupons.openapi.yaml"
+    (table, _) = OpenApiLoader.load_batch([path, path], workers=2)
+    assert table == OpenApiLoader.load(path)
+
+    registry = OperationRegistry(operations={})
+    registry.extend([path, path], sources=["first", "petstore"], processes=2)
+    assert registry.get("findPetsByStatus", source="petstore") is not None
+    assert len(registry.operations) == len({operation.operation_id for operation in table})
+
+
+def test_registry_extend_with_processes_offline(stub_server: StubServer) -> None:
+    """Worker processes follow the offline mode of the parent process."""
+    stub_server.route("GET", "/a.yaml", StubResponse(body="openapi: 3.0.3"))
+    stub_server.route("GET", "/b.yaml", StubResponse(body="openapi: 3.0.3"))
+    set_offline(offline=True)
+    registry = OperationRegistry(operations={})
+    with pytest.raises(LoadError):
+        registry.extend([stub_server.url("/a.yaml"), stub_server.url("/b.yaml")], processes=2)
+    assert stub_server.requests == []
+
+
+def test_load_batch_fills_the_table_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tables loaded by worker processes are not extracted again by the parent process."""
+    path = "./tests/data/models/pet-coupons.openapi.yaml"
+    # without the on-disk cache, only the tables sent back by the workers can be found
+    set_cache_enabled(enabled=False)
+    (table,) = OpenApiLoader.load_batch([path], workers=2)
+
+    def extract(*_args: object, **_kwargs: object) -> list[OperationRecord]:
+        raise AssertionError("extracted again")
+
+    monkeypatch.setattr(OpenApiLoader, "extract", extract)
+    assert OpenApiLoader.load(path) == table
@@ -0,0 +1,102 @@
+"""Tests for the lazy reference resolver."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+import yaml
+
+from pyarazzo.exceptions import SpecificationError
+from pyarazzo.model.openapi import OpenApiLoader
+from pyarazzo.model.refs import RefResolver
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+DOCUMENT = {
+    "components": {
+        "parameters": {
+            "page": {"name": "page", "in": "query", "required": True, "schema": {"type": "integer"}},
+            "alias": {"$ref": "#/components/parameters/page"},
+        },
+        "schemas": {
+            # recursive schema, never expanded
+            "Node": {
+                "type": "object",
+                "properties": {"children": {"type": "array", "items": {"$ref": "#/components/schemas/Node"}}},
+            },
+            "a/b": {"type": "string"},
+            "Loop": {"$ref": "#/components/schemas/Loop2"},
+            "Loop2": {"$ref": "#/components/schemas/Loop"},
+        },
+    },
+}
+
+
+def test_resolve_chain() -> None:
+    """Chains of references are followed."""
+    resolver = RefResolver(DOCUMENT)
+    assert resolver.resolve({"$ref": "#/components/parameters/alias"})["name"] == "page"
+
+
+def test_lookup_is_memoized() -> None:
+    """Each pointer is only walked once."""
+    resolver = RefResolver(DOCUMENT)
+    first = resolver.lookup("#/components/parameters/page")
+    assert resolver.lookup("#/components/parameters/page") is first
+    assert resolver.lookup("#/components/schemas/a~1b") == {"type": "string"}
+
+
+def test_circular_reference() -> None:
+    """References pointing to themselves raise."""
+    resolver = RefResolver(DOCUMENT)
+    with pytest.raises(SpecificationError):
+        resolver.resolve({"$ref": "#/components/schemas/Loop"})
+
+
+@pytest.mark.parametrize("ref", ["#/components/missing", "other.yaml#/components/schemas/Node"])
+def test_unresolvable_reference(ref: str) -> None:
+    """Missing and non local references raise."""
+    with pytest.raises(SpecificationError):
+        RefResolver(DOCUMENT).resolve({"$ref": ref})
+
+
+def test_view_resolves_on_access() -> None:
+    """Views resolve references lazily, including recursive ones."""
+    view = RefResolver(DOCUMENT).view()
+    node = view["components"]["schemas"]["Node"]
+    child = node["properties"]["children"]["items"]
+    assert child["properties"]["children"]["items"]["type"] == "object"
+    assert child is node
+    assert view["components"]["parameters"]["alias"]["in"] == "query"
+
+
+def test_loader_resolves_referenced_parameters(tmp_path: Path) -> None:
+    """Referenced parameters are resolved by the loader."""
+    spec = {
+        "openapi": "3.0.3",
+        "info": {"title": "refs", "version": "1.0.0"},
+        "paths": {
+            "/items": {
+                "parameters": [{"$ref": "#/components/parameters/tenant"}],
+                "get": {
+                    "operationId": "listItems",
+                    "parameters": [{"$ref": "#/components/parameters/alias"}],
+                    "responses": {"200": {"description": "ok"}},
+                },
+            },
+        },
+        "components": {
+            "parameters": {
+                **DOCUMENT["components"]["parameters"],
+                "tenant": {"name": "X-Tenant", "in": "header", "required": True, "schema": {"type": "string"}},
+            },
+            "schemas": {"Node": DOCUMENT["components"]["schemas"]["Node"]},
+        },
+    }
+    path = tmp_path / "refs.openapi.yaml"
+    path.write_text(yaml.safe_dump(spec))
+    (operation,) = OpenApiLoader.load(str(path))
+    assert operation.parameters == {"X-Tenant": "header", "page": "query"}
+    assert operation.headers == {"X-Tenant": True}
@@ -0,0 +1 @@
+"""Test Packages runtime."""
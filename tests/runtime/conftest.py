@@ -0,0 +1,64 @@
+"""Fixtures of the runtime tests."""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pyarazzo.model.arazzo import ArazzoSpecification, ArazzoSpecificationLoader
+from tests.stub_server import StubServer
+
+PETSTORE_PATHS = {
+    "/login": {"post": {"operationId": "login"}},
+    "/pets": {"get": {"operationId": "findPets", "parameters": [{"name": "status", "in": "query"}]}},
+    "/pets/{petId}": {
+        "parameters": [{"name": "petId", "in": "path", "required": True}],
+        "get": {"operationId": "getPet", "parameters": [{"name": "Authorization", "in": "header"}]},
+        "put": {"operationId": "updatePet"},
+    },
+    "/orders": {"post": {"operationId": "placeOrder"}},
+}
+
+
+@pytest.fixture
+def petstore(tmp_path: Path, stub_server: StubServer) -> Path:
+    """OpenAPI description of the pet store served by the stub server."""
+    path = tmp_path / "petstore.json"
+    document = {
+        "openapi": "3.0.3",
+        "info": {"title": "petstore", "version": "1.0.0"},
+        "servers": [{"url": stub_server.base_url}],
+        "paths": {
+            template: {
+                key: {**operation, "responses": {"200": {"description": "ok"}}} if key != "parameters" else operation
+                for key, operation in item.items()
+            }
+            for template, item in PETSTORE_PATHS.items()
+        },
+    }
+    path.write_text(json.dumps(document))
+    return path
+
+
+SpecificationFactory = Callable[..., ArazzoSpecification]
+
+
+@pytest.fixture
+def specification(tmp_path: Path, petstore: Path) -> SpecificationFactory:
+    """Build a specification of the pet store from its workflows."""
+
+    def build(*workflows: dict[str, Any], **fields: Any) -> ArazzoSpecification:
+        path = tmp_path / "arazzo.json"
+        document = {
+            "arazzo": "1.0.0",
+            "info": {"title": "petstore", "version": "1.0.0"},
+            "sourceDescriptions": [{"name": "petstore", "url": str(petstore), "type": "openapi"}],
+            "workflows": list(workflows),
+            **fields,
+        }
+        path.write_text(json.dumps(document))
+        return ArazzoSpecificationLoader.load(str(path))
+
+    return build
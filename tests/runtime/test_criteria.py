@@ -0,0 +1,98 @@
+"""Test the evaluation of criteria."""
+
+import pytest
+
+from pyarazzo.exceptions import ExpressionError
+from pyarazzo.model.arazzo import CriterionObject
+from pyarazzo.runtime.criteria import CompiledCriteria, compile_criterion, compile_criterion_source
+from pyarazzo.runtime.expression import ExpressionContext
+
+
+@pytest.fixture
+def context() -> ExpressionContext:
+    """Context of a successful response."""
+    return ExpressionContext(
+        status_code=200,
+        response_headers={"X-Rate-Remaining": "12"},
+        response_body={"status": "available", "pets": [{"id": 1, "name": "Rex"}, {"id": 2, "name": "Tom"}]},
+    )
+
+
+@pytest.mark.parametrize(
+    ("condition", "expected"),
+    [
+        ("$statusCode == 200", True),
+        ("$statusCode != 200", False),
+        ("$statusCode >= 200 && $statusCode < 300", True),
+        ("$statusCode == 404 || $response.body#/status == 'available'", True),
+        ("!($statusCode == 200)", False),
+        ("$response.header.X-Rate-Remaining > 10", True),
+        ('$response.body#/pets/1/name == "Tom"', True),
+        ("$response.body#/missing == null", True),
+        ("$response.body#/missing", False),
+        ("$response.body#/status < 3", False),
+    ],
+)
+def test_simple_conditions(context: ExpressionContext, condition: str, expected: bool) -> None:
+    """Simple conditions compare runtime expressions and literals."""
+    assert compile_criterion(CriterionObject(condition=condition))(context) is expected
+
+
+def test_regex_and_jsonpath_conditions(context: ExpressionContext) -> None:
+    """Regular expressions and JSONPath conditions apply to their context."""
+    assert compile_criterion(CriterionObject(context="$statusCode", condition="^2\\d\\d$", type="regex"))(context)
+    assert not compile_criterion_source("$response.body#/status", "^sold$", "regex")(context)
+    criterion = CriterionObject(context="$response.body", condition="$.pets[?(@.id > 1)]", type="jsonpath")
+    assert compile_criterion(criterion)(context)
+    assert not compile_criterion_source("$response.body", "$.pets[?(@.name == 'Max')]", "jsonpath")(context)
+
+
+def test_xpath_conditions() -> None:
+    """XPath conditions apply to XML bodies, in the version given by an expression type."""
+    context = ExpressionContext(response_body='<pets><pet id="1"><name>Rex</name></pet></pets>')
+    expression_type = {"type": "xpath", "version": "xpath-10"}
+    criterion = CriterionObject(context="$response.body", condition="/pets/pet[name='Rex']", type=expression_type)
+    assert compile_criterion(criterion)(context)
+    assert not compile_criterion_source("$response.body", "//pet[@id='2']", "xpath")(context)
+    assert not compile_criterion_source("$response.body", "//pet", "xpath")(ExpressionContext(response_body={}))
+    assert not compile_criterion_source("$response.body", "//pet", "xpath")(ExpressionContext(response_body="{"))
+    jsonpath = CriterionObject(
+        context="$response.body",
+        condition="$.pets",
+        type={"type": "jsonpath", "version": "draft-goessner-dispatch-jsonpath-00"},
+    )
+    assert not compile_criterion(jsonpath)(context)
+
+
+@pytest.mark.parametrize(
+    ("context", "condition", "type_"),
+    [
+        (None, "$statusCode ==", "simple"),
+        (None, "$statusCode == 200 200", "simple"),
+        (None, "unknown($statusCode)", "simple"),
+        (None, "^2", "regex"),
+        ("$statusCode", "(", "regex"),
+        ("$response.body", "pets", "jsonpath"),
+        ("$response.body", "/pets/pet[", "xpath"),
+        ("$response.body", "$.pets", "unknown"),
+    ],
+)
+def test_malformed_criteria(context: str | None, condition: str, type_: str) -> None:
+    """Malformed criteria are rejected when compiled."""
+    with pytest.raises(ExpressionError):
+        compile_criterion_source(context, condition, type_)
+
+
+def test_batch_evaluation(context: ExpressionContext) -> None:
+    """A list of criteria is evaluated against many responses."""
+    criteria = CompiledCriteria(
+        [
+            CriterionObject(condition="$statusCode == 200"),
+            CriterionObject(context="$response.body#/status", condition="avail", type="regex"),
+        ],
+    )
+    not_found = ExpressionContext(status_code=404, response_body={"status": "available"})
+    assert criteria.evaluate_many([context, not_found, context]) == [True, False, True]
+    assert [criterion.condition for criterion in criteria.failures(not_found)] == ["$statusCode == 200"]
+    assert compile_criterion_source(None, "$statusCode == 200") is criteria.criteria[0]
+    assert CompiledCriteria([])(not_found)
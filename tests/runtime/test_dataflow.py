@@ -0,0 +1,171 @@
+"""Test the data flow analysis of workflows and the concurrent execution of steps."""
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from pyarazzo.runtime.dataflow import StepGraph
+from pyarazzo.runtime.runner import WorkflowRunner
+from tests.runtime.conftest import SpecificationFactory
+from tests.runtime.test_runner import ADOPTION
+from tests.stub_server import StubRequest, StubResponse, StubServer
+
+DELAY = 0.2
+
+
+def step(step_id: str, **fields: Any) -> dict[str, Any]:
+    """Step placing an order."""
+    return {"stepId": step_id, "operationId": "placeOrder", **fields}
+
+
+ORDERS = {
+    "workflowId": "orders",
+    "steps": [
+        step("first", outputs={"id": "$response.body#/id"}),
+        step(
+            "second",
+            requestBody={"payload": {"after": "$steps.first.outputs.id"}},
+            outputs={"id": "$response.body#/id"},
+        ),
+        step("third", parameters=[{"name": "page", "in": "query", "value": "{$steps.unknown.outputs.page}"}]),
+        step(
+            "fourth",
+            requestBody={"payload": {}, "replacements": [{"target": "/id", "value": "$steps.third.outputs.id"}]},
+        ),
+        step(
+            "check",
+            successCriteria=[{"context": "$steps.second.outputs", "condition": "$.id", "type": "jsonpath"}],
+            onSuccess=[{"name": "done", "type": "end"}],
+        ),
+        step("fifth", outputs={"last": "$steps.check.outputs.id"}),
+    ],
+}
+
+
+class SlowRoutes:
+    """Routes answering after a delay, recording the requests in flight."""
+
+    def __init__(self, server: StubServer) -> None:
+        """Constructor."""
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self.responses = {
+            "/login": lambda request: {"token": request.json()["user"] * 2},
+            "/pets": lambda _: [{"id": 7}],
+            "/pets/7": lambda _: {"id": 7, "name": "Rex"},
+        }
+        server.route("POST", "/login", self)
+        server.route("GET", "/pets", self)
+        server.route("GET", "/pets/7", self)
+
+    def __call__(self, request: StubRequest) -> StubResponse:
+        """Answer after a delay."""
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(DELAY)
+        with self._lock:
+            self.in_flight -= 1
+        return StubResponse(body=self.responses[request.path](request))
+
+
+@pytest.fixture
+def slow_routes(stub_server: StubServer) -> SlowRoutes:
+    """Slow pet store routes."""
+    return SlowRoutes(stub_server)
+
+
+def test_step_graph(specification: SpecificationFactory) -> None:
+    """Steps depend on the steps they reference, steps with actions run alone."""
+    spec = specification(ORDERS)
+    graph = StepGraph.from_workflow(spec.get_workflow("orders"), spec.component_table)
+    assert graph.dependencies == {
+        "first": [],
+        "second": ["first"],
+        "third": [],
+        "fourth": ["third"],
+        "check": ["second"],
+        "fifth": ["check"],
+    }
+    assert graph.control_steps == {"check"}
+    assert graph.batch(0) == [0, 1, 2, 3]
+    assert graph.batch(2) == [2, 3]
+    assert graph.batch(4) == [4]
+    assert graph.batch(5) == [5]
+    assert graph.predecessors([0, 1, 2, 3]) == {0: [], 1: [0], 2: [], 3: [2]}
+
+
+def test_goto_targets_start_batches(specification: SpecificationFactory) -> None:
+    """Steps targeted by goto actions start a batch."""
+    again = {"name": "again", "type": "goto", "stepId": "third"}
+    workflow = {**ORDERS, "steps": [*ORDERS["steps"][:4], step("loop", onFailure=[again])]}
+    spec = specification(workflow)
+    graph = StepGraph.from_workflow(spec.get_workflow("orders"), spec.component_table)
+    assert graph.goto_targets == {"third"}
+    assert graph.batch(0) == [0, 1]
+    assert graph.batch(2) == [2, 3]
+
+
+def test_parallel_steps(specification: SpecificationFactory, slow_routes: SlowRoutes) -> None:
+    """Independent steps run concurrently, with the same outcome as a sequential run."""
+    spec = specification(ADOPTION)
+    sequential = WorkflowRunner(spec).run("adopt", {"user": "ann"})
+    assert slow_routes.max_in_flight == 1
+    parallel = WorkflowRunner(spec, parallel_steps=True).run("adopt", {"user": "ann"})
+    assert parallel.success, parallel.error
+    assert parallel.outputs == sequential.outputs
+    assert [step.step_id for step in parallel.steps] == ["login", "find", "pet"]
+    assert slow_routes.max_in_flight == 2
+    assert parallel.elapsed < sequential.elapsed
+
+
+@pytest.mark.usefixtures("slow_routes")
+def test_parallel_failure(specification: SpecificationFactory, stub_server: StubServer) -> None:
+    """A failed step fails the workflow, the steps depending on it are not run."""
+    stub_server.route("GET", "/pets", StubResponse(status=500))
+    result = WorkflowRunner(specification(ADOPTION), parallel_steps=True).run("adopt", {"user": "ann"})
+    assert not result.success
+    assert [(step.step_id, step.success) for step in result.steps] == [("login", True), ("find", False)]
+    assert result.error is not None
+    assert result.error.startswith("Step find failed")
+    assert {request.path for request in stub_server.requests} == {"/login", "/pets"}
+
+
+def test_parallel_actions(specification: SpecificationFactory, stub_server: StubServer) -> None:
+    """Steps with actions keep the sequential order."""
+    stub_server.route("POST", "/orders", lambda _: StubResponse(body={"id": 1}))
+    result = WorkflowRunner(specification(ORDERS), parallel_steps=True).run("orders")
+    assert result.success, result.error
+    assert [step.step_id for step in result.steps] == ["first", "second", "third", "fourth", "check"]
+    assert {"after": 1} in [request.json() for request in stub_server.requests if request.body]
+
+
+@pytest.mark.usefixtures("slow_routes")
+def test_parallel_workflow_references(specification: SpecificationFactory, stub_server: StubServer) -> None:
+    """Steps reading `$workflows` wait for the steps calling workflows."""
+    find = {
+        "workflowId": "find",
+        "steps": [{"stepId": "find", "operationId": "findPets", "outputs": {"id": "$response.body#/0/id"}}],
+        "outputs": {"id": "$steps.find.outputs.id"},
+    }
+    caller = {
+        "workflowId": "caller",
+        "steps": [
+            {"stepId": "call", "workflowId": "find"},
+            {
+                "stepId": "pet",
+                "operationId": "getPet",
+                "parameters": [{"name": "petId", "in": "path", "value": "$workflows.find.outputs.id"}],
+                "outputs": {"name": "$response.body#/name"},
+            },
+        ],
+    }
+    spec = specification(find, caller)
+    graph = StepGraph.from_workflow(spec.get_workflow("caller"), spec.component_table)
+    assert graph.dependencies == {"call": [], "pet": ["call"]}
+    result = WorkflowRunner(spec, parallel_steps=True).run("caller")
+    assert result.success, result.error
+    assert [request.path for request in stub_server.requests] == ["/pets", "/pets/7"]
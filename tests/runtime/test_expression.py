@@ -0,0 +1,88 @@
+"""Test the runtime expressions."""
+
+from typing import Any
+
+import pytest
+
+from pyarazzo.exceptions import ExpressionError
+from pyarazzo.runtime.expression import (
+    ExpressionContext,
+    compile_expression,
+    compile_template,
+    evaluate,
+    parse_json_pointer,
+)
+
+
+@pytest.fixture
+def context() -> ExpressionContext:
+    """Context of a step that just received a response."""
+    return ExpressionContext(
+        url="https://petstore.example/pets?tags=dog",
+        method="get",
+        status_code=200,
+        request_headers={"Authorization": "Bearer token"},
+        request_query={"tags": "dog"},
+        request_path={"petId": "1"},
+        response_headers={"Content-Type": "application/json"},
+        response_body=[{"id": 1, "a/b": {"~c": True}}, {"id": 2}],
+        inputs={"pet_id": 1, "nested": {"value": "x"}},
+        steps={"find-pet": {"outputs": {"my_pet_id": 1}}},
+        workflows={"place-order": {"outputs": {"order_id": "o1"}}},
+    )
+
+
+@pytest.mark.parametrize(
+    ("source", "expected"),
+    [
+        ("$url", "https://petstore.example/pets?tags=dog"),
+        ("$method", "get"),
+        ("$statusCode", 200),
+        ("$request.header.authorization", "Bearer token"),
+        ("$request.query.tags", "dog"),
+        ("$request.path.petId", "1"),
+        ("$response.header.Content-Type", "application/json"),
+        ("$response.body#/1/id", 2),
+        ("$response.body#/0/a~1b/~0c", True),
+        ("$response.body#/5/id", None),
+        ("$inputs.pet_id", 1),
+        ("$inputs.nested.value", "x"),
+        ("$inputs.missing.value", None),
+        ("$steps.find-pet.outputs.my_pet_id", 1),
+        ("$workflows.place-order.outputs.order_id", "o1"),
+    ],
+)
+def test_evaluate_expression(context: ExpressionContext, source: str, expected: Any) -> None:
+    """Expressions evaluate to the values of the context."""
+    assert compile_expression(source).evaluate(context) == expected
+
+
+@pytest.mark.parametrize(
+    "source",
+    ["inputs.x", "$unknown", "$statusCode.x", "$inputs", "$inputs..x", "$response.body.id", "$response.body#id"],
+)
+def test_malformed_expression(source: str) -> None:
+    """Malformed expressions are rejected when compiled."""
+    with pytest.raises(ExpressionError):
+        compile_expression(source)
+
+
+def test_templates(context: ExpressionContext) -> None:
+    """Strings embedding expressions are rendered, other values are kept as is."""
+    assert compile_template("Pet {$inputs.pet_id}: {$response.body#/1/id}").evaluate(context) == "Pet 1: 2"
+    assert compile_template("{$inputs.missing}").evaluate(context) == ""
+    assert evaluate("$inputs.pet_id", context) == 1
+    assert evaluate("plain", context) == "plain"
+    assert evaluate(3, context) == 3
+
+
+def test_compiled_expressions_are_cached() -> None:
+    """Expressions are compiled once per source text."""
+    assert compile_expression("$inputs.pet_id") is compile_expression("$inputs.pet_id")
+    assert compile_template("$inputs.pet_id") is compile_expression("$inputs.pet_id")
+
+
+def test_parse_json_pointer() -> None:
+    """JSON Pointers are split into unescaped tokens."""
+    assert parse_json_pointer("") == ()
+    assert parse_json_pointer("/a~1b/~0c/0") == ("a/b", "~c", "0")
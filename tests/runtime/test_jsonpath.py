@@ -0,0 +1,62 @@
+"""Test the JSONPath expressions."""
+
+from typing import Any
+
+import pytest
+
+from pyarazzo.exceptions import ExpressionError
+from pyarazzo.runtime.jsonpath import compile_jsonpath
+
+STORE = {
+    "store": {
+        "book": [
+            {"title": "Sayings", "price": 8.95, "tags": ["classic"]},
+            {"title": "Sword", "price": 12.99},
+            {"title": "Moby Dick", "price": 8.99, "isbn": "0-553"},
+        ],
+        "bicycle": {"color": "red", "price": 19.95},
+    },
+    "a.b": 1,
+}
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("$.store.book[*].title", ["Sayings", "Sword", "Moby Dick"]),
+        ("$.store.book[0].title", ["Sayings"]),
+        ("$.store.book[-1].title", ["Moby Dick"]),
+        ("$.store.book[0:2].price", [8.95, 12.99]),
+        ("$.store.book[::2].price", [8.95, 8.99]),
+        ("$.store.book[0,2].price", [8.95, 8.99]),
+        ("$['store']['bicycle'].color", ["red"]),
+        ("$['a.b']", [1]),
+        ("$..price", [8.95, 12.99, 8.99, 19.95]),
+        ("$.store.*.color", ["red"]),
+        ("$.store.book[?(@.price < 10)].title", ["Sayings", "Moby Dick"]),
+        ("$.store.book[?@.isbn].title", ["Moby Dick"]),
+        ("$.store.book[?(@.price < $.store.bicycle.price && !@.tags)].title", ["Sword", "Moby Dick"]),
+        ("$.store.book[?(length(@.tags) == 1)].title", ["Sayings"]),
+        ("$..book[?(match(@.title, 'S.*'))].price", [8.95, 12.99]),
+        ("$.store.book[7]", []),
+        ("$.missing.path", []),
+    ],
+)
+def test_find(path: str, expected: list[Any]) -> None:
+    """Paths select values in document order."""
+    assert compile_jsonpath(path).find(STORE) == expected
+
+
+@pytest.mark.parametrize("path", ["store", "$.", "$[", "$.book[1:2:0]", "$.book[?(@.price <)]", "$.book[a]"])
+def test_malformed_path(path: str) -> None:
+    """Malformed paths are rejected when compiled."""
+    with pytest.raises(ExpressionError):
+        compile_jsonpath(path)
+
+
+def test_compiled_paths_are_cached() -> None:
+    """Paths are compiled once per source text."""
+    path = compile_jsonpath("$.store.bicycle.color")
+    assert path is compile_jsonpath("$.store.bicycle.color")
+    assert path.first(STORE) == "red"
+    assert compile_jsonpath("$.missing").first(STORE) is None
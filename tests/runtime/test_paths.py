@@ -0,0 +1,35 @@
+"""Test the path expressions of criteria."""
+
+import pytest
+
+from pyarazzo.exceptions import ExpressionError
+from pyarazzo.runtime.jsonpath import JsonPath
+from pyarazzo.runtime.paths import compile_path
+from pyarazzo.runtime.xpath import XPath
+
+
+def test_paths_are_cached_by_type_version_and_text() -> None:
+    """Expressions are compiled once per (type, version, text), the latest version by default."""
+    path = compile_path("xpath", "/pets/pet/@id", "xpath-20")
+    assert isinstance(path, XPath)
+    assert path is compile_path("xpath", "/pets/pet/@id", "xpath-20")
+    assert compile_path("xpath", "/pets/pet/@id") is compile_path("xpath", "/pets/pet/@id", "xpath-30")
+    assert isinstance(compile_path("jsonpath", "$.pets[*].id"), JsonPath)
+
+
+def test_batch_evaluation() -> None:
+    """A compiled expression evaluates many documents."""
+    documents = [{"pets": [{"id": index}, {"id": index + 1}]} for index in range(3)]
+    assert compile_path("jsonpath", "$.pets[*].id").find_many(documents) == [[0, 1], [1, 2], [2, 3]]
+    xml = ['<pets><pet id="1"/></pets>', '<pets><pet id="2"/><pet id="3"/></pets>']
+    assert compile_path("xpath", "//pet/@id").find_many(xml) == [["1"], ["2", "3"]]
+
+
+@pytest.mark.parametrize(
+    ("type_", "version"),
+    [("xpath", "draft-goessner-dispatch-jsonpath-00"), ("jsonpath", "xpath-30"), ("xquery", None), ("xpath", "x")],
+)
+def test_unknown_version(type_: str, version: str | None) -> None:
+    """Versions must be versions of the expression language."""
+    with pytest.raises(ExpressionError):
+        compile_path(type_, "/pets", version)
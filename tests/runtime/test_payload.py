@@ -0,0 +1,97 @@
+"""Test the request bodies of steps."""
+
+from typing import Any
+
+import pytest
+
+from pyarazzo.exceptions import ExpressionError
+from pyarazzo.model.arazzo import PayloadReplacementObject, RequestBodyObject
+from pyarazzo.runtime.expression import ExpressionContext
+from pyarazzo.runtime.payload import compile_payload, compile_request_body
+
+PAYLOAD = {
+    "pet": {"name": "$inputs.name", "tags": ["dog"], "price": "$5"},
+    "greeting": "Hello {$inputs.name}",
+    "catalog": {"items": [{"id": index} for index in range(3)]},
+}
+
+
+def replacement(target: str, value: Any) -> PayloadReplacementObject:
+    """Build a payload replacement."""
+    return PayloadReplacementObject(target=target, value=value)
+
+
+def test_json_payload_is_copied_on_write() -> None:
+    """Bodies share the unchanged parts of the payload, which is never modified."""
+    compiled = compile_payload(
+        PAYLOAD,
+        [replacement("/pet/tags/-", "$inputs.tag"), replacement("/pet/id", 7), replacement("/catalog/items/1/id", 10)],
+    )
+    body = compiled.build(ExpressionContext(inputs={"name": "Rex", "tag": "small"}))
+    assert body["pet"] == {"name": "Rex", "tags": ["dog", "small"], "price": "$5", "id": 7}
+    assert body["greeting"] == "Hello Rex"
+    assert body["catalog"]["items"] == [{"id": 0}, {"id": 10}, {"id": 2}]
+    assert body["catalog"]["items"][0] is PAYLOAD["catalog"]["items"][0]
+    assert PAYLOAD["pet"] == {"name": "$inputs.name", "tags": ["dog"], "price": "$5"}
+    assert PAYLOAD["catalog"]["items"][1] == {"id": 1}
+
+
+def test_replacements_apply_in_turn() -> None:
+    """A replacement may target the value of an earlier one, which is copied in turn."""
+    owner = {"name": "Ann"}
+    compiled = compile_payload({}, [replacement("/owner", "$inputs.owner"), replacement("/owner/id", 1)])
+    bodies = compiled.build_many([ExpressionContext(inputs={"owner": owner})] * 2)
+    assert bodies == [{"owner": {"name": "Ann", "id": 1}}] * 2
+    assert bodies[0] is not bodies[1]
+    assert owner == {"name": "Ann"}
+
+
+def test_xml_payload() -> None:
+    """XPath targets replace the content of elements, attributes and texts of XML payloads."""
+    payload = '<pet id="{$inputs.id}"><name>old</name><tags><tag>a</tag><tag>b</tag></tags></pet>'
+    body = RequestBodyObject(
+        contentType="application/xml",
+        payload=payload,
+        replacements=[
+            replacement("/pet/name", "$inputs.name"),
+            replacement("//tag[2]/text()", "c"),
+            replacement("/pet/@kind", "dog"),
+        ],
+    )
+    compiled = compile_request_body(body)
+    assert compiled.build(ExpressionContext(inputs={"id": 3, "name": "Rex"})) == (
+        '<pet id="3" kind="dog"><name>Rex</name><tags><tag>a</tag><tag>c</tag></tags></pet>'
+    )
+    assert compiled.payload == payload
+
+    mixed = compile_payload(
+        "<pet><name>{$inputs.name}<first>x</first></name><owner>old<first>y</first></owner></pet>",
+        [replacement("/pet/owner/text()", "new")],
+    )
+    assert mixed.build(ExpressionContext(inputs={"name": "Rex"})) == (
+        "<pet><name>Rex<first>x</first></name><owner>new<first>y</first></owner></pet>"
+    )
+
+
+def test_payload_without_expressions() -> None:
+    """Payloads without expressions nor replacements are sent as is."""
+    payload = {"name": "Rex"}
+    assert compile_payload(payload).build(ExpressionContext()) is payload
+    compiled = compile_payload('{"name": "Rex"}', [replacement("/name", "Tom")])
+    assert compiled.build(ExpressionContext()) == {"name": "Tom"}
+
+
+@pytest.mark.parametrize(
+    ("payload", "target"),
+    [
+        (PAYLOAD, "/missing/name"),
+        (PAYLOAD, "/catalog/items/3/id"),
+        (PAYLOAD, "pet"),
+        ("not json", "/name"),
+        ("<pet><name/></pet>", "/pet/owner"),
+    ],
+)
+def test_invalid_target(payload: Any, target: str) -> None:
+    """Targets are checked against the payload when compiled."""
+    with pytest.raises(ExpressionError):
+        compile_payload(payload, [replacement(target, 1)])
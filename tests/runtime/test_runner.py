@@ -0,0 +1,251 @@
+"""Test the execution of workflows."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pyarazzo import cli
+from pyarazzo.exceptions import ExecutionError, SpecificationError
+from pyarazzo.runtime.runner import WorkflowRunner
+from pyarazzo.runtime.scheduler import WorkflowScheduler
+from tests.runtime.conftest import SpecificationFactory
+from tests.stub_server import StubResponse, StubServer
+
+STATUS_OK = {"condition": "$statusCode == 200"}
+
+ADOPTION = {
+    "workflowId": "adopt",
+    "inputs": {"type": "object", "properties": {"user": {"type": "string"}, "status": {"default": "available"}}},
+    "steps": [
+        {
+            "stepId": "login",
+            "operationId": "login",
+            "requestBody": {"contentType": "application/json", "payload": {"user": "$inputs.user"}},
+            "successCriteria": [STATUS_OK],
+            "outputs": {"token": "$response.body#/token"},
+        },
+        {
+            "stepId": "find",
+            "operationId": "findPets",
+            "parameters": [{"name": "status", "in": "query", "value": "$inputs.status"}],
+            "successCriteria": [STATUS_OK, {"context": "$response.body", "condition": "$[0].id", "type": "jsonpath"}],
+            "outputs": {"petId": "$response.body#/0/id"},
+        },
+        {
+            "stepId": "pet",
+            "operationPath": "{$sourceDescriptions.petstore.url}#/paths/~1pets~1{petId}/get",
+            "parameters": [
+                {"name": "petId", "in": "path", "value": "$steps.find.outputs.petId"},
+                {"name": "Authorization", "in": "header", "value": "Bearer {$steps.login.outputs.token}"},
+            ],
+            "outputs": {"name": "$response.body#/name"},
+        },
+    ],
+    "outputs": {"name": "$steps.pet.outputs.name", "petId": "$steps.find.outputs.petId"},
+}
+
+
+@pytest.fixture
+def pets(stub_server: StubServer) -> StubServer:
+    """Pet store routes."""
+    stub_server.route("POST", "/login", lambda request: StubResponse(body={"token": request.json()["user"] * 2}))
+    stub_server.route("GET", "/pets", StubResponse(body=[{"id": 7}, {"id": 8}]))
+    stub_server.route("GET", "/pets/7", StubResponse(body={"id": 7, "name": "Rex"}))
+    return stub_server
+
+
+def test_run_workflow(specification: SpecificationFactory, pets: StubServer) -> None:
+    """Steps pass values to each other, on a single keep-alive connection."""
+    result = WorkflowRunner(specification(ADOPTION)).run("adopt", {"user": "ann"})
+    assert result.success, result.error
+    assert result.outputs == {"name": "Rex", "petId": 7}
+    assert result.inputs == {"user": "ann", "status": "available"}
+    assert [(step.step_id, step.status_code) for step in result.steps] == [("login", 200), ("find", 200), ("pet", 200)]
+    login, find, pet = pets.requests
+    assert login.json() == {"user": "ann"}
+    assert find.query == {"status": ["available"]}
+    assert pet.headers["authorization"] == "Bearer annann"
+    assert pets.connections == 1
+
+
+def test_literal_values(specification: SpecificationFactory, pets: StubServer) -> None:
+    """Strings starting with `$` that are not runtime expressions are sent and output as is."""
+    find = {
+        "workflowId": "find",
+        "steps": [
+            {
+                "stepId": "find",
+                "operationId": "findPets",
+                "parameters": [{"name": "status", "in": "query", "value": "$5"}],
+                "outputs": {"price": "$5"},
+            },
+        ],
+        "outputs": {"price": "$steps.find.outputs.price", "currency": "$USD"},
+    }
+    result = WorkflowRunner(specification(find)).run("find")
+    assert result.success, result.error
+    assert result.outputs == {"price": "$5", "currency": "$USD"}
+    assert pets.requests[0].query == {"status": ["$5"]}
+
+
+def test_failure_fails_the_workflow(specification: SpecificationFactory, pets: StubServer) -> None:
+    """A failed step without failure action ends the workflow."""
+    pets.route("GET", "/pets", StubResponse(body=[]))
+    result = WorkflowRunner(specification(ADOPTION)).run("adopt", {"user": "ann"})
+    assert not result.success
+    assert result.outputs == {}
+    assert [step.success for step in result.steps] == [True, False]
+    assert result.error is not None
+    assert result.error.startswith("Step find failed")
+
+
+def test_retry(specification: SpecificationFactory, stub_server: StubServer) -> None:
+    """Retry actions execute the failed step again, after waiting."""
+    statuses = iter([503, 503, 200])
+    stub_server.route("POST", "/orders", lambda _: StubResponse(status=next(statuses), body={}))
+    retry = {"name": "retry", "type": "retry", "stepId": "order", "retryAfter": 0.5, "retryLimit": 2}
+    spec = specification(
+        {"workflowId": "order", "steps": [{"stepId": "order", "operationId": "placeOrder", "onFailure": [retry]}]},
+    )
+    waits: list[float] = []
+    result = WorkflowRunner(spec, sleep=waits.append).run("order")
+    assert result.success
+    assert [(step.status_code, step.attempt) for step in result.steps] == [(503, 1), (503, 2), (200, 3)]
+    assert waits == [0.5, 0.5]
+
+    statuses = iter([503, 503, 503])
+    result = WorkflowRunner(spec, sleep=waits.append).run("order")
+    assert not result.success
+    assert "after 2 retries" in str(result.error)
+
+
+def test_goto_and_end(specification: SpecificationFactory, stub_server: StubServer) -> None:
+    """Goto actions loop over steps until an end action."""
+    statuses = iter(["pending", "pending", "done"])
+    stub_server.route("GET", "/pets/1", lambda _: StubResponse(body={"status": next(statuses)}))
+    spec = specification(
+        {
+            "workflowId": "poll",
+            "steps": [
+                {
+                    "stepId": "poll",
+                    "operationId": "getPet",
+                    "parameters": [{"name": "petId", "in": "path", "value": 1}],
+                    "onSuccess": [
+                        {
+                            "name": "done",
+                            "type": "end",
+                            "criteria": [{"condition": "$response.body#/status == 'done'"}],
+                        },
+                        {"name": "again", "type": "goto", "stepId": "poll", "criteria": [STATUS_OK]},
+                    ],
+                    "outputs": {"status": "$response.body#/status"},
+                },
+                {"stepId": "never", "operationId": "placeOrder"},
+            ],
+            "outputs": {"status": "$steps.poll.outputs.status"},
+        },
+    )
+    result = WorkflowRunner(spec).run("poll")
+    assert result.success
+    assert result.outputs == {"status": "done"}
+    assert [step.step_id for step in result.steps] == ["poll"] * 3
+
+
+@pytest.mark.usefixtures("pets")
+def test_workflow_step(specification: SpecificationFactory) -> None:
+    """Workflow steps run another workflow with the step parameters as inputs."""
+    caller = {
+        "workflowId": "caller",
+        "steps": [
+            {
+                "stepId": "adopt",
+                "workflowId": "adopt",
+                "parameters": [{"name": "user", "value": "bob"}],
+                "outputs": {"name": "$outputs.name"},
+            },
+        ],
+        "outputs": {"name": "$steps.adopt.outputs.name", "token": "$workflows.adopt.inputs.user"},
+    }
+    workflows: dict[str, dict] = {}
+    result = WorkflowRunner(specification(ADOPTION, caller)).run("caller", workflows=workflows)
+    assert result.success
+    assert result.outputs == {"name": "Rex", "token": "bob"}
+    assert set(workflows) == {"adopt", "caller"}
+
+
+def test_workflow_cycles(specification: SpecificationFactory, stub_server: StubServer, tmp_path: Path) -> None:
+    """Workflows calling themselves, directly or through other workflows, are reported."""
+    poll = {"workflowId": "poll", "steps": [{"stepId": "poll", "workflowId": "poll"}]}
+    ping = {"workflowId": "ping", "steps": [{"stepId": "pong", "workflowId": "pong"}]}
+    pong = {
+        "workflowId": "pong",
+        "steps": [
+            {
+                "stepId": "order",
+                "operationId": "placeOrder",
+                "onSuccess": [{"name": "ping", "type": "goto", "workflowId": "ping"}],
+            },
+        ],
+    }
+    stub_server.route("POST", "/orders", StubResponse(body={"id": 1}))
+    spec = specification(poll, ping, pong)
+    with pytest.raises(SpecificationError, match="poll -> poll"):
+        WorkflowRunner(spec).run("poll")
+    with pytest.raises(SpecificationError, match="ping -> pong -> ping"):
+        WorkflowRunner(spec).run("ping")
+    schedule = WorkflowScheduler(WorkflowRunner(spec)).run(["poll"])
+    assert schedule.results["poll"].error == "Workflows call each other in a cycle: poll -> poll"
+    result = CliRunner().invoke(cli.cli, ["run", "-s", str(tmp_path / "arazzo.json"), "-w", "poll"])
+    assert result.exit_code != 0
+    assert "Workflows call each other in a cycle: poll -> poll" in result.output
+
+
+def test_missing_path_parameter(specification: SpecificationFactory, stub_server: StubServer) -> None:
+    """A step without a value for a path parameter fails without sending a request."""
+    spec = specification(
+        {
+            "workflowId": "pet",
+            "steps": [
+                {
+                    "stepId": "pet",
+                    "operationId": "getPet",
+                    "parameters": [{"name": "petId", "in": "path", "value": "$inputs.petId"}],
+                },
+            ],
+        },
+    )
+    result = WorkflowRunner(spec).run("pet")
+    assert not result.success
+    assert result.error == "Step pet failed: No value for the path parameters petId of /pets/{petId}"
+    assert stub_server.requests == []
+
+
+def test_unresolvable_steps(specification: SpecificationFactory, tmp_path: Path) -> None:
+    """Steps whose operation or server cannot be found are reported."""
+    spec = specification({"workflowId": "bad", "steps": [{"stepId": "bad", "operationId": "unknown"}]})
+    with pytest.raises(SpecificationError):
+        WorkflowRunner(spec).run("bad")
+    petstore = tmp_path / "petstore.json"
+    petstore.write_text(petstore.read_text().replace('"servers"', '"x-servers"'))
+    spec = specification({"workflowId": "order", "steps": [{"stepId": "order", "operationId": "placeOrder"}]})
+    with pytest.raises(ExecutionError):
+        WorkflowRunner(spec).run("order")
+    assert WorkflowRunner(spec, servers={"petstore": "http://127.0.0.1:1"}).run("order").error is not None
+
+
+def test_run_command(specification: SpecificationFactory, pets: StubServer, tmp_path: Path) -> None:
+    """`pyarazzo run` prints the outcome of the run."""
+    specification(ADOPTION)
+    arguments = ["run", "-s", str(tmp_path / "arazzo.json"), "-w", "adopt", "-i", "user=ann", "-i", 'status="sold"']
+    result = CliRunner().invoke(cli.cli, arguments)
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.output)
+    assert report["outputs"] == {"name": "Rex", "petId": 7}
+    assert pets.requests[1].query == {"status": ["sold"]}
+
+    pets.route("GET", "/pets", lambda _: StubResponse(status=500))
+    assert CliRunner().invoke(cli.cli, arguments).exit_code == 1
+    assert CliRunner().invoke(cli.cli, [*arguments, "--server", "petstore"]).exit_code != 0
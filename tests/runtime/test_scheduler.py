@@ -0,0 +1,172 @@
+"""Test the concurrent execution of workflows."""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+
+from pyarazzo import cli
+from pyarazzo.exceptions import SpecificationError
+from pyarazzo.runtime.runner import WorkflowRunner
+from pyarazzo.runtime.scheduler import WorkflowScheduler
+from tests.runtime.conftest import SpecificationFactory
+from tests.stub_server import StubRequest, StubResponse, StubServer
+
+DELAY = 0.2
+
+
+def fetch(workflow_id: str, pet_id: int, **fields: Any) -> dict[str, Any]:
+    """Workflow fetching a pet."""
+    return {
+        "workflowId": workflow_id,
+        "steps": [
+            {
+                "stepId": "get",
+                "operationId": "getPet",
+                "parameters": [{"name": "petId", "in": "path", "value": pet_id}],
+                "outputs": {"id": "$response.body#/id"},
+            },
+        ],
+        "outputs": {"id": "$steps.get.outputs.id"},
+        **fields,
+    }
+
+
+UPDATE = {
+    "workflowId": "update",
+    "dependsOn": ["first", "second"],
+    "steps": [
+        {
+            "stepId": "put",
+            "operationId": "updatePet",
+            "parameters": [{"name": "petId", "in": "path", "value": "$workflows.first.outputs.id"}],
+            "requestBody": {"contentType": "application/json", "payload": {"with": "$workflows.second.outputs.id"}},
+        },
+    ],
+}
+
+
+class SlowPets:
+    """Pet routes answering after a delay, recording the requests in flight."""
+
+    def __init__(self, server: StubServer) -> None:
+        """Constructor."""
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        for pet_id in (1, 2, 3):
+            server.route("GET", f"/pets/{pet_id}", self)
+            server.route("PUT", f"/pets/{pet_id}", self)
+
+    def __call__(self, request: StubRequest) -> StubResponse:
+        """Answer after a delay."""
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(DELAY)
+        with self._lock:
+            self.in_flight -= 1
+        if request.path == "/pets/3":
+            return StubResponse(status=500)
+        return StubResponse(body={"id": int(request.path.rpartition("/")[2])})
+
+
+@pytest.fixture
+def slow_pets(stub_server: StubServer) -> SlowPets:
+    """Slow pet routes."""
+    return SlowPets(stub_server)
+
+
+def test_independent_workflows_run_concurrently(
+    specification: SpecificationFactory,
+    stub_server: StubServer,
+    slow_pets: SlowPets,
+) -> None:
+    """Independent workflows overlap, dependents start with the outputs of their dependencies."""
+    spec = specification(fetch("first", 1), fetch("second", 2), UPDATE)
+    workflows: dict[str, Any] = {}
+    schedule = WorkflowScheduler(WorkflowRunner(spec)).run(workflows=workflows)
+    assert schedule.success
+    assert list(schedule.results)[-1] == "update"
+    assert slow_pets.max_in_flight == 2
+    put = next(request for request in stub_server.requests if request.method == "PUT")
+    assert put.path == "/pets/1"
+    assert put.json() == {"with": 2}
+    assert set(workflows) == {"first", "second", "update"}
+
+    assert schedule.critical_path[-1] == "update"
+    assert len(schedule.critical_path) == 2
+    assert schedule.critical_path_time < schedule.total
+    assert schedule.elapsed < schedule.total
+    assert schedule.speedup > 1
+
+
+@pytest.mark.usefixtures("slow_pets")
+def test_limits(specification: SpecificationFactory) -> None:
+    """Workflows in flight are bounded."""
+    spec = specification(fetch("first", 1), fetch("second", 2), UPDATE)
+    with pytest.raises(ValueError, match="at least 1"):
+        WorkflowScheduler(WorkflowRunner(spec), max_workflows=0)
+    schedule = WorkflowScheduler(WorkflowRunner(spec), max_workflows=1).run(["first", "second"])
+    assert schedule.success
+    assert set(schedule.results) == {"first", "second"}
+    assert schedule.elapsed >= 2 * DELAY
+
+
+def test_request_limit(specification: SpecificationFactory, slow_pets: SlowPets) -> None:
+    """The requests of every workflow share the request limit."""
+    spec = specification(fetch("first", 1), fetch("second", 2))
+    schedule = WorkflowScheduler(WorkflowRunner(spec), max_requests=1).run()
+    assert schedule.success
+    assert slow_pets.max_in_flight == 1
+
+
+@pytest.mark.usefixtures("slow_pets")
+def test_failed_dependency(specification: SpecificationFactory) -> None:
+    """Workflows depending on a failed workflow are not run."""
+    spec = specification(
+        fetch("first", 1),
+        fetch("second", 3),
+        UPDATE,
+        fetch("last", 1, dependsOn=["update"]),
+    )
+    schedule = WorkflowScheduler(WorkflowRunner(spec)).run(["last"])
+    assert not schedule.success
+    assert schedule.skipped == ["update", "last"]
+    assert schedule.results["update"].error == "Dependency second failed"
+    assert schedule.results["first"].success
+
+
+def test_cycle(specification: SpecificationFactory) -> None:
+    """Workflows depending on each other cannot be scheduled."""
+    spec = specification(fetch("first", 1, dependsOn=["second"]), fetch("second", 2, dependsOn=["first"]))
+    with pytest.raises(SpecificationError, match="cycle"):
+        WorkflowScheduler(WorkflowRunner(spec)).run()
+
+
+@pytest.mark.usefixtures("slow_pets")
+def test_run_command(specification: SpecificationFactory, tmp_path: Path) -> None:
+    """`pyarazzo run` without a workflow runs every workflow."""
+    specification(fetch("first", 1), fetch("second", 2), UPDATE)
+    result = CliRunner().invoke(cli.cli, ["run", "-s", str(tmp_path / "arazzo.json"), "--max-workflows", "2"])
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.output)
+    assert report["success"]
+    assert report["criticalPath"][-1] == "update"
+    assert {workflow["workflowId"] for workflow in report["workflows"]} == {"first", "second", "update"}
+
+
+@pytest.mark.usefixtures("slow_pets")
+def test_run_single_workflow(specification: SpecificationFactory, stub_server: StubServer, tmp_path: Path) -> None:
+    """`pyarazzo run` with a single workflow runs its dependencies first, and reports it alone."""
+    specification(fetch("first", 1), fetch("second", 2), UPDATE)
+    result = CliRunner().invoke(cli.cli, ["run", "-s", str(tmp_path / "arazzo.json"), "-w", "update"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)["workflowId"] == "update"
+    put = next(request for request in stub_server.requests if request.method == "PUT")
+    assert put.path == "/pets/1"
+    assert put.json() == {"with": 2}
@@ -0,0 +1,58 @@
+"""Test the XPath expressions."""
+
+import pytest
+
+from pyarazzo.exceptions import ExpressionError
+from pyarazzo.runtime.xpath import compile_xpath, parse_xml
+
+STORE = """<?xml version="1.0"?>
+<store xmlns="urn:store">
+    <book id="b1" lang="en"><title>XML Guide</title><price>12.5</price></book>
+    <book id="b2"><title>Python</title><price>8</price></book>
+    <shelf><book id="b3"><title>Deep Dive</title></book></shelf>
+</store>
+"""
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/store/book/@id", ["b1", "b2"]),
+        ("//book/@id", ["b1", "b2", "b3"]),
+        ("/store/*/book/@id", ["b3"]),
+        ("/store/book/title/text()", ["XML Guide", "Python"]),
+        ("/store/book[price > 10]/@id", ["b1"]),
+        ("//book[@lang='en' or price = 8]/@id", ["b1", "b2"]),
+        ("//book[contains(title, 'Dive')]/@id", ["b3"]),
+        ("//book[not(price)]/@id", ["b3"]),
+        ("//book[starts-with(., 'Py')]/@id", ["b2"]),
+        ("/store/book[2]/@id", ["b2"]),
+        ("//book[1]/@id", ["b1", "b3"]),
+        ("/store/book[last()]/@id", ["b2"]),
+        ("/store/book[@id='b2']/title/./text()", ["Python"]),
+        ("//@lang", ["en"]),
+        ("/store/book[5]", []),
+        ("/missing/path", []),
+    ],
+)
+def test_find(path: str, expected: list[str]) -> None:
+    """Paths select nodes in document order, whatever their namespace."""
+    assert compile_xpath(path).find(STORE) == expected
+
+
+@pytest.mark.parametrize("path", ["", "/store/@id/title", "/store/book[price >]", "/store/book[1", "/store/<book>"])
+def test_malformed_path(path: str) -> None:
+    """Malformed paths and paths out of the supported subset are rejected when compiled."""
+    with pytest.raises(ExpressionError):
+        compile_xpath(path)
+
+
+def test_documents_are_parsed_once() -> None:
+    """Documents are parsed once, and a path evaluates many of them."""
+    path = compile_xpath("/store/book[1]/title/text()")
+    assert path is compile_xpath("/store/book[1]/title/text()")
+    assert parse_xml(STORE) is parse_xml(STORE)
+    assert path.first(parse_xml(STORE)) == "XML Guide"
+    assert path.find_many([STORE, STORE.replace("XML Guide", "XSLT"), "<store/>"]) == [["XML Guide"], ["XSLT"], []]
+    with pytest.raises(ExpressionError, match="Invalid XML"):
+        path.find("<store>")
@@ -0,0 +1,140 @@
+"""Local stand-in HTTP server used by the tests."""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+
+@dataclass
+class StubRequest:
+    """Request received by the stub server."""
+
+    method: str
+    path: str
+    query: dict[str, list[str]]
+    headers: dict[str, str]
+    body: bytes
+
+    def json(self) -> Any:
+        """Decode the body as JSON."""
+        return json.loads(self.body)
+
+
+@dataclass
+class StubResponse:
+    """Response served by the stub server.
+
+    Dict and list bodies are served as JSON.
+    """
+
+    status: int = 200
+    body: Any = b""
+    headers: dict[str, str] = field(default_factory=dict)
+
+    def encoded(self) -> tuple[bytes, dict[str, str]]:
+        """Return the body as bytes along with the response headers."""
+        headers = dict(self.headers)
+        body = self.body
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body)
+            headers.setdefault("Content-Type", "application/json")
+        if isinstance(body, str):
+            body = body.encode()
+        return body, headers
+
+
+Handler = Callable[[StubRequest], StubResponse]
+
+
+class StubServer:
+    """Threaded HTTP/1.1 server serving canned or computed responses.
+
+    Every accepted connection is counted, which lets tests verify connection reuse.
+    """
+
+    def __init__(self) -> None:
+        """Constructor."""
+        self.routes: dict[tuple[str, str], StubResponse | Handler] = {}
+        self.requests: list[StubRequest] = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """Base url of the server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def url(self, path: str) -> str:
+        """Absolute url of `path` on the server."""
+        return self.base_url + path
+
+    def route(self, method: str, path: str, response: StubResponse | Handler) -> None:
+        """Register the response, or the function computing it, of `method path`."""
+        self.routes[(method.upper(), path)] = response
+
+    def start(self) -> None:
+        """Start serving in a background thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                with server._lock:
+                    server.connections += 1
+                super().setup()
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                pass
+
+            def _serve(self) -> None:
+                url = urlparse(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                request = StubRequest(
+                    method=self.command,
+                    path=url.path,
+                    query=parse_qs(url.query),
+                    headers={key.lower(): value for key, value in self.headers.items()},
+                    body=self.rfile.read(length) if length else b"",
+                )
+                with server._lock:
+                    server.requests.append(request)
+
+                route = server.routes.get((self.command, url.path))
+                if route is None:
+                    response = StubResponse(status=404, body="not found")
+                elif isinstance(route, StubResponse):
+                    response = route
+                else:
+                    response = route(request)
+
+                body, headers = response.encoded()
+                self.send_response(response.status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _serve  # noqa: N815
+
+        return RequestHandler
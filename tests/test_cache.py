@@ -0,0 +1,202 @@
+"""Tests for the on-disk caches."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import yaml
+
+from pyarazzo import cache, utils
+from pyarazzo.cache import DiskCache, ParseCache, TableCache, ValidationLedger
+from pyarazzo.exceptions import ValidationError
+from pyarazzo.model.openapi import OpenApiLoader
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class CountingParser:
+    """Parser recording the number of calls."""
+
+    def __init__(self) -> None:
+        """Constructor."""
+        self.calls = 0
+
+    def __call__(self, content: bytes) -> Any:
+        """Parse YAML content."""
+        self.calls += 1
+        return yaml.safe_load(content)
+
+
+def test_parse_cache_hit(tmp_path: Path) -> None:
+    """The second parse of the same content is served from the cache."""
+    parse_cache = ParseCache(str(tmp_path))
+    parser = CountingParser()
+    first = parse_cache.parse(b"key: value", "yaml", parser)
+    second = parse_cache.parse(b"key: value", "yaml", parser)
+    assert first == second == {"key": "value"}
+    assert parser.calls == 1
+
+
+def test_parse_cache_keyed_by_content_and_format(tmp_path: Path) -> None:
+    """Different content or format never share an entry."""
+    parse_cache = ParseCache(str(tmp_path))
+    parser = CountingParser()
+    parse_cache.parse(b"key: value", "yaml", parser)
+    parse_cache.parse(b"key: other", "yaml", parser)
+    parse_cache.parse(b"key: value", "json", parser)
+    assert parser.calls == 3
+
+
+def test_parse_cache_disabled(tmp_path: Path) -> None:
+    """A disabled cache always parses and never writes."""
+    parse_cache = ParseCache(str(tmp_path / "parse"), enabled=False)
+    parser = CountingParser()
+    parse_cache.parse(b"key: value", "yaml", parser)
+    parse_cache.parse(b"key: value", "yaml", parser)
+    assert parser.calls == 2
+    assert not (tmp_path / "parse").exists()
+
+
+def test_parse_cache_eviction(tmp_path: Path) -> None:
+    """Least recently used entries are evicted once the size bound is exceeded."""
+    parse_cache = ParseCache(str(tmp_path), max_bytes=1)
+    parser = CountingParser()
+    parse_cache.parse(b"key: value", "yaml", parser)
+    parse_cache.parse(b"key: other", "yaml", parser)
+    assert len(os.listdir(tmp_path)) <= 1
+
+
+def test_parse_cache_corrupted_entry(tmp_path: Path) -> None:
+    """An unreadable entry is treated as a miss."""
+    parse_cache = ParseCache(str(tmp_path))
+    key = ParseCache.key(b"key: value", "yaml")
+    (tmp_path / f"{key}.pickle").write_bytes(b"not a pickle")
+    parser = CountingParser()
+    assert parse_cache.parse(b"key: value", "yaml", parser) == {"key": "value"}
+    assert parser.calls == 1
+
+
+def test_load_spec_uses_parse_cache(isolated_cache: Path) -> None:
+    """Loading a specification populates the process-wide cache."""
+    utils.load_spec("./tests/data/test_utils_valid.yaml")
+    assert len(os.listdir(isolated_cache / "parse")) == 1
+    assert utils.load_spec("./tests/data/test_utils_valid.yaml") is not None
+
+
+def test_openapi_loader_uses_parse_cache(isolated_cache: Path) -> None:
+    """Loading an OpenAPI document populates the process-wide cache."""
+    OpenApiLoader.load("./tests/data/models/pet-coupons.openapi.yaml")
+    assert len(os.listdir(isolated_cache / "parse")) == 1
+
+
+def test_set_cache_enabled(isolated_cache: Path) -> None:
+    """Disabling the process-wide cache stops writes."""
+    cache.set_cache_enabled(enabled=False)
+    utils.load_spec("./tests/data/test_utils_valid.yaml")
+    assert not (isolated_cache / "parse").exists()
+
+
+def test_table_cache_memory_and_disk(tmp_path: Path) -> None:
+    """Tables are served from memory, then from disk once the memory is cleared."""
+    table_cache = TableCache(DiskCache(str(tmp_path), 1024 * 1024))
+    key = table_cache.key(b"content", "variant")
+    assert key != table_cache.key(b"content", "other")
+    assert table_cache.get("/a.yaml", key) == (False, None)
+    table = ["operation"]
+    table_cache.put("/a.yaml", key, table)
+    assert table_cache.get("/a.yaml", key)[1] is table
+    table_cache.clear()
+    assert table_cache.get("/b.yaml", key) == (True, table)
+
+
+def test_openapi_operation_tables_shared(isolated_cache: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """An OpenAPI document referenced several times is only scanned once."""
+    calls = []
+    extract = OpenApiLoader.extract
+
+    def counting_extract(spec_dict: dict, *, strict: bool = False) -> list:
+        calls.append(strict)
+        return extract(spec_dict, strict=strict)
+
+    monkeypatch.setattr(OpenApiLoader, "extract", counting_extract)
+    path = "./tests/data/models/pet-coupons.openapi.yaml"
+    first = OpenApiLoader.load(path)
+    assert OpenApiLoader.load(os.path.abspath(path)) == first
+    assert calls == [False]
+
+    # persisted between runs
+    cache.get_table_cache().clear()
+    assert len(OpenApiLoader.load(path)) == len(first)
+    assert calls == [False]
+    assert len(os.listdir(isolated_cache / "tables")) == 1
+
+    OpenApiLoader.load(path, strict=True)
+    assert calls == [False, True]
+
+
+def test_openapi_operation_table_invalidated(tmp_path: Path) -> None:
+    """A modified OpenAPI document is scanned again."""
+    document = tmp_path / "api.yaml"
+    document.write_text("paths:\n  /a:\n    get: {}\n")
+    assert [operation.path for operation in OpenApiLoader.load(str(document))] == ["/a"]
+    document.write_text("paths:\n  /b:\n    get: {}\n")
+    assert [operation.path for operation in OpenApiLoader.load(str(document))] == ["/b"]
+
+
+class CountingValidation:
+    """Schema validation recording the number of calls."""
+
+    def __init__(self) -> None:
+        """Constructor."""
+        self.calls = 0
+        self.validate = utils.schema_validation
+
+    def __call__(self, spec: dict, *, all_errors: bool = False) -> None:
+        """Validate the specification."""
+        self.calls += 1
+        self.validate(spec, all_errors=all_errors)
+
+
+def test_validation_ledger_bound_to_schema(tmp_path: Path) -> None:
+    """Ledger entries only hold for the schema they were validated against."""
+    ledger = ValidationLedger(str(tmp_path))
+    assert not ledger.is_validated(b"content", "schema")
+    ledger.record(b"content", "schema")
+    assert ledger.is_validated(b"content", "schema")
+    assert not ledger.is_validated(b"content", "other")
+    assert not ledger.is_validated(b"other", "schema")
+
+
+def test_load_spec_validates_content_once(isolated_cache: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A document that passed validation is not validated again."""
+    validation = CountingValidation()
+    monkeypatch.setattr(utils, "schema_validation", validation)
+    first = utils.load_spec("./tests/data/test_utils_valid.yaml")
+    cache.reset_caches()
+    assert utils.load_spec("./tests/data/test_utils_valid.yaml") == first
+    assert validation.calls == 1
+    assert len(os.listdir(isolated_cache / "validated")) == 1
+
+
+def test_load_spec_invalid_not_recorded(tmp_path: Path) -> None:
+    """Invalid documents fail on every load, unless trusted."""
+    spec_path = tmp_path / "invalid.yaml"
+    spec_path.write_text("arazzo: 1.0.0\n")
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            utils.load_spec(str(spec_path))
+    assert utils.load_spec(str(spec_path), trusted=True) == {"arazzo": "1.0.0"}
+
+
+def test_validation_ledger_disabled(isolated_cache: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without cache, documents are validated on every load."""
+    validation = CountingValidation()
+    monkeypatch.setattr(utils, "schema_validation", validation)
+    cache.set_cache_enabled(enabled=False)
+    utils.load_spec("./tests/data/test_utils_valid.yaml")
+    utils.load_spec("./tests/data/test_utils_valid.yaml")
+    assert validation.calls == 2
+    assert not (isolated_cache / "validated").exists()
@@ -2,11 +2,30 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 # from typing import TYPE_CHECKING
 from click.testing import CliRunner
 
 from pyarazzo import cli  # , debug
 
+# dependencies that must not be imported to start the CLI
+HEAVY_MODULES = [
+    "httpx",
+    "jsonref",
+    "jsonschema",
+    "openapi_pydantic",
+    "pydantic",
+    "requests",
+    "yaml",
+    "pyarazzo.doc.generator",
+    "pyarazzo.model",
+    "pyarazzo.utils",
+]
+
 # if TYPE_CHECKING:
 #     import pytest
 
@@ -18,6 +37,35 @@ def test_main() -> None:
     assert result.exit_code == 1
 
 
+def test_version() -> None:
+    """The version is printed without loading any subcommand."""
+    runner = CliRunner()
+    result = runner.invoke(cli.cli, ["--version"])
+    assert result.exit_code == 0
+    assert cli.get_version() in result.output
+
+
+def test_lazy_subcommands() -> None:
+    """Lazy subcommands are listed and resolved on demand."""
+    runner = CliRunner()
+    result = runner.invoke(cli.cli, ["doc", "--help"])
+    assert result.exit_code == 0
+    assert "generate" in result.output
+
+
+def test_startup_imports() -> None:
+    """Importing the CLI does not import the loaders and their dependencies."""
+    code = f"import sys, pyarazzo.cli; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).parent.parent / "src")},
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
 # def test_show_help(capsys: pytest.CaptureFixture) -> None:
 #     """Show help.
 
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import json
 import os
 import tempfile
+from pathlib import Path
 
 import pytest
 
 from pyarazzo.doc.generator import SimpleMarkdownGeneratorVisitor
 from pyarazzo.exceptions import LoadError
+from pyarazzo.model.arazzo import ArazzoSpecificationLoader
 from pyarazzo.utils import load_spec
 
 
@@ -62,3 +65,28 @@ def test_plantuml_name_conversion() -> None:
         assert generator.plantumlify("My Workflow") == "My_Workflow"
         assert generator.plantumlify("my-step-id") == "my_step_id"
         assert generator.plantumlify("already_formatted") == "already_formatted"
+
+
+def test_doc_generation_self_calling_workflow(tmp_path: Path) -> None:
+    """Workflows calling themselves are documented, in document order."""
+    openapi = Path("tests/data/models/pet-coupons.openapi.yaml").resolve()
+    document = {
+        "arazzo": "1.0.0",
+        "info": {"title": "polling", "version": "1.0.0"},
+        "sourceDescriptions": [{"name": "petstore", "url": str(openapi), "type": "openapi"}],
+        "workflows": [
+            {
+                "workflowId": "poll",
+                "steps": [
+                    {"stepId": "find", "operationId": "findPetsByStatus"},
+                    {"stepId": "again", "workflowId": "poll"},
+                ],
+            },
+            {"workflowId": "once", "steps": [{"stepId": "find", "operationId": "findPetsByStatus"}]},
+        ],
+    }
+    path = tmp_path / "arazzo.json"
+    path.write_text(json.dumps(document))
+    spec = ArazzoSpecificationLoader.load(str(path))
+    spec.accept(SimpleMarkdownGeneratorVisitor(str(tmp_path / "out")))
+    assert sorted(os.listdir(tmp_path / "out")) == ["once.md", "poll.md"]
@@ -6,6 +6,8 @@ import pytest
 
 from pyarazzo.exceptions import (
     ArazzoError,
+    ExecutionError,
+    ExpressionError,
     GenerationError,
     LoadError,
     SpecificationError,
@@ -25,6 +27,18 @@ def test_specification_error_inheritance() -> None:
         raise SpecificationError("Invalid spec")
 
 
+def test_expression_error_inheritance() -> None:
+    """Test ExpressionError inherits from SpecificationError."""
+    with pytest.raises(SpecificationError):
+        raise ExpressionError("Invalid expression")
+
+
+def test_execution_error_inheritance() -> None:
+    """Test ExecutionError inherits from ArazzoError."""
+    with pytest.raises(ArazzoError):
+        raise ExecutionError("Step failed")
+
+
 def test_load_error_inheritance() -> None:
     """Test LoadError inherits from ArazzoError."""
     with pytest.raises(ArazzoError):
@@ -0,0 +1,86 @@
+"""Tests for the shared HTTP client and its cache."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from pyarazzo import cache, http_client
+from pyarazzo.exceptions import LoadError
+from tests.stub_server import StubRequest, StubResponse, StubServer
+
+ETAG = '"v1"'
+
+
+def etag_handler(request: StubRequest) -> StubResponse:
+    """Serve a document, answering 304 when the client already has it."""
+    if request.headers.get("if-none-match") == ETAG:
+        return StubResponse(status=304, headers={"ETag": ETAG})
+    return StubResponse(body={"key": "value"}, headers={"ETag": ETAG})
+
+
+def test_shared_client() -> None:
+    """The same client is returned until it is closed."""
+    client = http_client.get_http_client()
+    assert http_client.get_http_client() is client
+    http_client.close_http_client()
+    assert http_client.get_http_client() is not client
+    http_client.close_http_client()
+
+
+def test_fetch_document_revalidates(stub_server: StubServer) -> None:
+    """A cached document is revalidated with a conditional request."""
+    stub_server.route("GET", "/spec.json", etag_handler)
+    url = stub_server.url("/spec.json")
+    first = http_client.fetch_document(url)
+    second = http_client.fetch_document(url)
+    assert first.content == second.content
+    assert [request.headers.get("if-none-match") for request in stub_server.requests] == [None, ETAG]
+
+
+def test_fetch_document_last_modified(stub_server: StubServer) -> None:
+    """Last-Modified validators are sent back with If-Modified-Since."""
+    last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+    stub_server.route("GET", "/spec.json", StubResponse(body={}, headers={"Last-Modified": last_modified}))
+    url = stub_server.url("/spec.json")
+    http_client.fetch_document(url)
+    http_client.fetch_document(url)
+    assert stub_server.requests[1].headers.get("if-modified-since") == last_modified
+
+
+def test_fetch_document_no_validator(stub_server: StubServer) -> None:
+    """Responses without validators are not cached."""
+    stub_server.route("GET", "/spec.json", StubResponse(body={}))
+    url = stub_server.url("/spec.json")
+    http_client.fetch_document(url)
+    http_client.fetch_document(url)
+    assert "if-none-match" not in stub_server.requests[1].headers
+
+
+def test_fetch_document_offline(stub_server: StubServer) -> None:
+    """Offline mode serves cached documents without touching the network."""
+    stub_server.route("GET", "/spec.json", etag_handler)
+    url = stub_server.url("/spec.json")
+    http_client.fetch_document(url)
+    http_client.set_offline(offline=True)
+    assert http_client.fetch_document(url).content == b'{"key": "value"}'
+    assert len(stub_server.requests) == 1
+    with pytest.raises(LoadError):
+        http_client.fetch_document(stub_server.url("/other.json"))
+
+
+def test_fetch_document_cache_disabled(stub_server: StubServer) -> None:
+    """Disabling the caches disables revalidation."""
+    cache.set_cache_enabled(enabled=False)
+    stub_server.route("GET", "/spec.json", etag_handler)
+    url = stub_server.url("/spec.json")
+    http_client.fetch_document(url)
+    http_client.fetch_document(url)
+    assert "if-none-match" not in stub_server.requests[1].headers
+
+
+def test_fetch_document_error(stub_server: StubServer) -> None:
+    """Error statuses raise."""
+    stub_server.route("GET", "/spec.json", StubResponse(status=500))
+    with pytest.raises(httpx.HTTPStatusError):
+        http_client.fetch_document(stub_server.url("/spec.json"))
@@ -4,14 +4,13 @@ import json
 import tempfile
 from collections.abc import Generator
 from typing import Any
-from unittest.mock import MagicMock, patch
 
 import pytest
-import requests
 import yaml
 
 from pyarazzo import utils
 from pyarazzo.exceptions import LoadError, ValidationError
+from tests.stub_server import StubResponse, StubServer
 
 
 @pytest.fixture
@@ -55,36 +54,38 @@ def test_load_spec_invalid_file_format() -> None:
             utils.load_spec(tmp.name)
 
 
-@patch("pyarazzo.utils.requests.get")
-def test_load_from_url_valid_json(mock_get: Any) -> None:
+def test_load_from_url_valid_json(stub_server: StubServer) -> None:
     """Read the test method name."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"key": "value"}
-    mock_response.headers = {"Content-Type": "application/json"}
-    mock_get.return_value = mock_response
-    spec = utils.load_from_url("https://example.com/spec.json")
+    stub_server.route("GET", "/spec.json", StubResponse(body={"key": "value"}))
+    spec = utils.load_from_url(stub_server.url("/spec.json"))
     assert spec == {"key": "value"}
 
 
-@patch("pyarazzo.utils.requests.get")
-def test_load_from_url_valid_yaml(mock_get: Any) -> None:
+def test_load_from_url_valid_yaml(stub_server: StubServer) -> None:
     """Read the test method name."""
-    mock_response = MagicMock()
-    mock_response.text = "key: value"
-    mock_response.headers = {"Content-Type": "application/yaml"}
-    mock_get.return_value = mock_response
-    spec = utils.load_from_url("https://example.com/spec.yaml")
+    stub_server.route(
+        "GET",
+        "/spec.yaml",
+        StubResponse(body="key: value", headers={"Content-Type": "application/yaml"}),
+    )
+    spec = utils.load_from_url(stub_server.url("/spec.yaml"))
     assert spec == {"key": "value"}
 
 
-@patch("pyarazzo.utils.requests.get")
-def test_load_from_url_unsupported_content_type(mock_get: Any) -> None:
+def test_load_from_url_unsupported_content_type(stub_server: StubServer) -> None:
     """Read the test method name."""
-    mock_response = MagicMock()
-    mock_response.headers = {"Content-Type": "text/plain"}
-    mock_get.return_value = mock_response
+    stub_server.route("GET", "/spec.txt", StubResponse(body="key: value", headers={"Content-Type": "text/plain"}))
     with pytest.raises(LoadError):
-        utils.load_from_url("https://example.com/spec.txt")
+        utils.load_from_url(stub_server.url("/spec.txt"))
+
+
+def test_load_from_url_reuses_connection(stub_server: StubServer) -> None:
+    """Several documents from the same host are fetched over one kept-alive connection."""
+    for index in range(5):
+        stub_server.route("GET", f"/spec{index}.json", StubResponse(body={"index": index}))
+    for index in range(5):
+        assert utils.load_from_url(stub_server.url(f"/spec{index}.json")) == {"index": index}
+    assert stub_server.connections == 1
 
 
 def test_load_from_file_valid_json(valid_json_file: Any) -> None:
@@ -114,14 +115,10 @@ def test_load_data_valid_local_file(valid_json_file: Any) -> None:
     assert spec == {"key": "value"}
 
 
-@patch("pyarazzo.utils.requests.get")
-def test_load_data_valid_url(mock_get: Any) -> None:
+def test_load_data_valid_url(stub_server: StubServer) -> None:
     """Read the test method name."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"key": "value"}
-    mock_response.headers = {"Content-Type": "application/json"}
-    mock_get.return_value = mock_response
-    spec = utils.load_data("https://example.com/spec.json")
+    stub_server.route("GET", "/spec.json", StubResponse(body={"key": "value"}))
+    spec = utils.load_data(stub_server.url("/spec.json"))
     assert spec == {"key": "value"}
 
 
@@ -139,12 +136,17 @@ def test_schema_validation_invalid_spec() -> None:
         utils.schema_validation(spec)
 
 
-@patch("pyarazzo.utils.requests.get")
-def test_load_data_url_http_error(mock_get: Any) -> None:
+def test_load_data_url_http_error(stub_server: StubServer) -> None:
+    """Read the test method name."""
+    stub_server.route("GET", "/spec.json", StubResponse(status=500, body="boom"))
+    with pytest.raises(LoadError):
+        utils.load_data(stub_server.url("/spec.json"))
+
+
+def test_load_data_url_unreachable() -> None:
     """Read the test method name."""
-    mock_get.side_effect = requests.RequestException("HTTP Error")
     with pytest.raises(LoadError):
-        utils.load_data("https://example.com/spec.json")
+        utils.load_data("http://127.0.0.1:9/spec.json")
 
 
 def test_load_data_invalid_local_file() -> None:
@@ -159,3 +161,26 @@ def test_load_data_invalid_json(valid_json_file: Any) -> None:
         f.write("Invalid JSON")
     with pytest.raises(LoadError):
         utils.load_data(valid_json_file)
+
+
+def test_validator_is_built_once() -> None:
+    """The schema validator is reused across validations."""
+    assert utils.get_validator() is utils.get_validator()
+    assert utils.schema == utils.load_schema()
+
+
+def test_schema_validation_all_errors() -> None:
+    """All violations are reported in a single pass."""
+    spec = {"arazzo": "1.0.0", "info": {"title": "t"}, "workflows": []}
+    messages = utils.validation_errors(spec)
+    assert len(messages) > 1
+    with pytest.raises(ValidationError) as exc_info:
+        utils.schema_validation(spec, all_errors=True)
+    for message in messages:
+        assert message in str(exc_info.value)
+
+
+def test_load_spec_all_errors() -> None:
+    """A valid specification has no violations in all errors mode."""
+    spec = utils.load_spec("./tests/data/test_utils_valid.yaml", all_errors=True)
+    assert utils.validation_errors(spec) == []